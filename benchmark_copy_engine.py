@@ -0,0 +1,88 @@
+import asyncio
+import os
+import sys
+import time
+from lhcPipeToolApp.handlers.file_copy_engine import FileCopyEngine
+
+# 파일 복사 엔진 벤치마크
+# 사용법: python benchmark_copy_engine.py <측정할 디렉토리> [파일 크기(MiB), 기본 1024]
+# 예) tmpfs: python benchmark_copy_engine.py /dev/shm 1024
+#     loop 마운트 ext4: python benchmark_copy_engine.py /mnt/loop 512
+#
+# baseline은 이전 AsyncNetworkFileHandler 방식 (aiofiles와 같이 64 KiB 청크마다
+# 작업 스레드를 한 번씩 거쳐 읽고 쓰기)이며, 모든 측정은 마지막 fsync까지 포함합니다.
+REPEAT = 3
+BASELINE_CHUNK_SIZE = 64 * 1024
+MB = 1000 * 1000    # 결과는 MB/s (10^6 bytes) 단위
+
+async def baseline_copy(source, destination):
+    """이전 방식: 64 KiB 청크를 읽기/쓰기마다 asyncio.to_thread로 실행"""
+    src = await asyncio.to_thread(open, source, 'rb')
+    dst = await asyncio.to_thread(open, destination, 'wb')
+    try:
+        while True:
+            chunk = await asyncio.to_thread(src.read, BASELINE_CHUNK_SIZE)
+            if not chunk:
+                break
+            await asyncio.to_thread(dst.write, chunk)
+        await asyncio.to_thread(dst.flush)
+        await asyncio.to_thread(os.fsync, dst.fileno())
+    finally:
+        src.close()
+        dst.close()
+
+def engine_copy(backend):
+    def copy(source, destination):
+        # fsync는 엔진 안에서 실행됨
+        FileCopyEngine(backend=backend).copy(source, destination)
+    return copy
+
+def measure(copy, source, destination, size):
+    """REPEAT번 복사하여 가장 빠른 처리량(MB/s) 반환"""
+    best = 0.0
+    for _ in range(REPEAT):
+        if os.path.exists(destination):
+            os.remove(destination)
+        start = time.perf_counter()
+        copy(source, destination)
+        best = max(best, size / (time.perf_counter() - start) / MB)
+    os.remove(destination)
+    return best
+
+if len(sys.argv) < 2:
+    print("사용법: python benchmark_copy_engine.py <디렉토리> [파일 크기(MiB)]")
+    sys.exit(1)
+
+target_dir = sys.argv[1]
+size = (int(sys.argv[2]) if len(sys.argv) > 2 else 1024) * 1024 * 1024
+source = os.path.join(target_dir, "benchmark_source.bin")
+destination = os.path.join(target_dir, "benchmark_destination.bin")
+
+try:
+    # 테스트 파일 생성 (압축/중복 제거 영향이 없도록 난수 데이터)
+    block = os.urandom(16 * 1024 * 1024)
+    with open(source, 'wb') as f:
+        for _ in range(size // len(block)):
+            f.write(block)
+        f.write(block[:size % len(block)])
+        f.flush()
+        os.fsync(f.fileno())
+
+    backends = ['readinto']
+    if hasattr(os, 'copy_file_range'):
+        backends.insert(0, 'copy_file_range')
+    if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+        backends.insert(-1, 'sendfile')
+
+    print(f"{target_dir}, {size // (1024 * 1024)} MiB, best of {REPEAT}")
+    results = [("baseline", measure(lambda s, d: asyncio.run(baseline_copy(s, d)), source, destination, size))]
+    for backend in backends:
+        results.append((backend, measure(engine_copy(backend), source, destination, size)))
+    for name, speed in results:
+        print(f"  {name:<16}{speed:>8.0f} MB/s")
+
+finally:
+    # 테스트 파일 삭제
+    for path in (source, destination, f"{destination}{FileCopyEngine.PART_SUFFIX}"):
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,115 @@
+import os
+import random
+import time
+import fdb
+from lhcPipeToolApp.schemas.table_schemas import TABLES, INDEXES
+
+# 최신 버전 조회 벤치마크 (버전 10만 개)
+# 별도의 벤치마크용 데이터베이스를 새로 만들어 측정하므로 실제 데이터베이스는 변경되지 않음
+DSN = 'BENCHMARK_VERSIONS.FDB'
+SEQUENCE_COUNT = 50
+SHOTS_PER_SEQUENCE = 40
+VERSIONS_PER_SHOT = 50      # 50 x 40 x 50 = 100,000 버전
+REPEAT = 20
+
+# 이전 방식: 샷마다 MAX(VERSION_NUMBER) 상관 서브쿼리
+MAX_QUERY = """
+    SELECT v.id, v.shot_id, v.version_number
+    FROM versions v
+    JOIN shots sh ON sh.id = v.shot_id
+    JOIN sequences s ON s.id = sh.sequence_id
+    WHERE s.project_id = ? AND v.version_number = (
+        SELECT MAX(m.version_number) FROM versions m WHERE m.shot_id = v.shot_id
+    )
+"""
+
+# 현재 방식: IS_LATEST 플래그 + (SHOT_ID, IS_LATEST) 인덱스
+LATEST_QUERY = """
+    SELECT v.id, v.shot_id, v.version_number
+    FROM versions v
+    JOIN shots sh ON sh.id = v.shot_id
+    JOIN sequences s ON s.id = sh.sequence_id
+    WHERE s.project_id = ? AND v.is_latest = TRUE
+"""
+
+def measure(cur, query, params):
+    """쿼리를 REPEAT번 실행하고 (중앙값 ms, 결과 행 수) 반환"""
+    durations = []
+    rows = 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        cur.execute(query, params)
+        rows = len(cur.fetchall())
+        durations.append((time.perf_counter() - start) * 1000)
+    durations.sort()
+    return durations[len(durations) // 2], rows
+
+if os.path.exists(DSN):
+    os.remove(DSN)
+con = fdb.create_database(f"create database '{DSN}' user 'sysdba' password 'lion'")
+cur = con.cursor()
+
+try:
+    # 스키마 생성 (애플리케이션과 같은 정의 사용)
+    for table_name in ('projects', 'sequences', 'shots', 'workers', 'versions'):
+        cur.execute(TABLES[table_name])
+    con.commit()
+
+    # 데이터 생성
+    start = time.perf_counter()
+    cur.execute("INSERT INTO workers (id, name, password) VALUES (1, 'benchmark', 'x')")
+    cur.execute("INSERT INTO projects (id, name) VALUES (1, 'benchmark')")
+    shot_id = 0
+    version_id = 0
+    for sequence_id in range(1, SEQUENCE_COUNT + 1):
+        cur.execute("INSERT INTO sequences (id, name, project_id) VALUES (?, ?, 1)",
+                    (sequence_id, f"SEQ{sequence_id:03d}"))
+        for _ in range(SHOTS_PER_SEQUENCE):
+            shot_id += 1
+            cur.execute("INSERT INTO shots (id, name, sequence_id) VALUES (?, ?, ?)",
+                        (shot_id, f"SH{shot_id:04d}", sequence_id))
+            # 샷마다 버전 수를 조금씩 다르게
+            version_count = random.randint(VERSIONS_PER_SHOT // 2, VERSIONS_PER_SHOT * 3 // 2)
+            rows = []
+            for number in range(1, version_count + 1):
+                version_id += 1
+                rows.append((version_id, f"v{number:03d}", shot_id, number, number == version_count))
+            cur.executemany(
+                "INSERT INTO versions (id, name, shot_id, version_number, worker_id, is_latest) "
+                "VALUES (?, ?, ?, ?, 1, ?)",
+                rows
+            )
+        con.commit()
+    print(f"버전 {version_id}개 생성 ({time.perf_counter() - start:.1f}초)")
+
+    # 인덱스 없이 측정
+    no_index_max = measure(cur, MAX_QUERY, (1,))
+    no_index_latest = measure(cur, LATEST_QUERY, (1,))
+
+    # 마이그레이션과 같은 인덱스 추가 후 측정
+    for index_name in ('idx_versions_shot_latest', 'idx_versions_shot_number'):
+        cur.execute(INDEXES[index_name])
+    con.commit()
+    cur.execute("SET STATISTICS INDEX IDX_VERSIONS_SHOT_LATEST")
+    cur.execute("SET STATISTICS INDEX IDX_VERSIONS_SHOT_NUMBER")
+    con.commit()
+    index_max = measure(cur, MAX_QUERY, (1,))
+    index_latest = measure(cur, LATEST_QUERY, (1,))
+
+    print(f"{'':<28}{'중앙값(ms)':>12}{'행 수':>10}")
+    for label, (duration, rows) in (
+        ("MAX 서브쿼리 (인덱스 없음)", no_index_max),
+        ("IS_LATEST (인덱스 없음)", no_index_latest),
+        ("MAX 서브쿼리 (인덱스)", index_max),
+        ("IS_LATEST (인덱스)", index_latest),
+    ):
+        print(f"{label:<28}{duration:>12.1f}{rows:>10}")
+
+except Exception as e:
+    con.rollback()
+    print(f"오류 발생: {e}")
+
+finally:
+    # 벤치마크용 데이터베이스 삭제
+    cur.close()
+    con.drop_database()
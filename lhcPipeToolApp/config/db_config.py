@@ -5,4 +5,19 @@ class DBConfig:
         self.dsn = "localhost:D:/WORKDATA/lhcPipeTool/PROJECT_MANAGEMENT.FDB"
         self.user = "SYSDBA"
         self.password = "lion"
-        self.charset = "UTF8"
\ No newline at end of file
+        self.charset = "UTF8"
+
+        # 커넥션 풀 설정
+        # 풀 크기는 커넥션을 쓰는 모든 스레드의 합으로 계산 (부족하면 pool_timeout 발생)
+        self.loader_threads = 2       # 백그라운드 데이터 로더(DataLoader) 작업 스레드 수
+        # 로더 외 백그라운드 작업용 예약 커넥션
+        # (작업 기록 저장 스레드, 프리뷰 경로 기록, 렌더 파일 목록 조회 작업, 버전 파일 해시 조회 각 1개)
+        self.reserved_connections = 4
+        self.pool_size = 1 + self.loader_threads + self.reserved_connections  # GUI 스레드 1개 포함
+        self.pool_max_idle = 300.0    # 유휴 커넥션 유지 시간(초)
+        self.pool_timeout = 10.0      # 커넥션 대기 제한 시간(초)
+        self.statement_cache_size = 64  # 커넥션별 준비문 캐시 크기
+
+        # 작업 기록 저장 설정
+        self.operation_history_enabled = True     # 완료된 작업을 OPERATION_HISTORY에 기록
+        self.operation_history_flush_interval = 5.0  # 기록을 모아서 저장하는 간격(초)
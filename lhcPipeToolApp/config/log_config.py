@@ -0,0 +1,35 @@
+"""로그 설정"""
+import os
+
+class LogConfig:
+    def __init__(self):
+        # 로그 파일 설정 (크기 기준 순환)
+        self.log_dir = "logs"
+        self.file_name = "app.log"
+        self.max_bytes = 10 * 1024 * 1024   # 파일 하나의 최대 크기
+        self.backup_count = 5               # 보관할 이전 로그 파일 수
+
+        # 출력 대상별 레벨
+        self.file_level = "DEBUG"
+        self.console_level = "INFO"
+
+        # 로거 레벨 (기본값과 서브시스템별 레벨 - 로거 이름 접두어 기준, 가장 긴 접두어 우선)
+        self.default_level = os.environ.get("LHC_LOG_LEVEL", "INFO")
+        self.levels = {
+            # 작업별 완료 기록은 OPERATION_HISTORY에 남으므로 경고 이상만 출력
+            "lhcPipeToolApp.handlers.monitoring_handler": "WARNING",
+            # SQL 로그는 sql_logging과 샘플링으로 제어
+            "lhcPipeToolApp.sql": "DEBUG",
+        }
+
+        # SQL 로그 (기본 꺼짐, 켜면 sql_sample_rate 비율의 쿼리만 DEBUG로 기록)
+        # LHC_SQL_LOG 환경 변수에 비율(0~1)을 지정하면 켜짐 (예: 1, 0.05)
+        self.sql_logging = False
+        self.sql_sample_rate = 0.01
+        sql_log = os.environ.get("LHC_SQL_LOG")
+        if sql_log:
+            self.sql_logging = True
+            try:
+                self.sql_sample_rate = float(sql_log)
+            except ValueError:
+                self.sql_sample_rate = 1.0
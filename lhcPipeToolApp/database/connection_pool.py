@@ -0,0 +1,231 @@
+"""데이터베이스 커넥션 풀"""
+import threading
+import time
+from contextlib import contextmanager
+import fdb
+from ..utils.logger import setup_logger
+
+class ConnectionPool:
+    """
+    스레드 단위로 커넥션을 임대하는 고정 크기 커넥션 풀
+
+    한 스레드는 release()를 호출하기 전까지 같은 커넥션을 계속 사용하므로
+    execute() 후 commit()을 따로 호출하는 기존 트랜잭션 흐름이 그대로 유지됩니다.
+    종료된 스레드가 반납하지 않은 커넥션은 풀이 가득 찼을 때 회수됩니다.
+    """
+
+    HEALTH_CHECK_QUERY = "SELECT 1 FROM RDB$DATABASE"
+
+    def __init__(self, config, max_size=4, max_idle=300.0, timeout=10.0, on_close=None):
+        self.config = config
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.on_close = on_close    # 커넥션 종료 직전에 호출되는 콜백
+        self.logger = setup_logger(__name__)
+
+        self._lock = threading.Condition()
+        self._idle = []      # [(connection, 반납 시각)]
+        self._leases = {}    # 스레드 ident -> (thread, connection)
+        self._size = 0       # 열려 있는 전체 커넥션 수
+        self._closed = False
+
+    def _create_connection(self):
+        """새 커넥션 생성"""
+        return fdb.connect(
+            dsn=self.config.dsn,
+            user=self.config.user,
+            password=self.config.password,
+            charset=self.config.charset
+        )
+
+    def _is_healthy(self, connection):
+        """커넥션 상태 확인"""
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(self.HEALTH_CHECK_QUERY)
+                cursor.fetchone()
+            finally:
+                cursor.close()
+            return True
+        except Exception as e:
+            self.logger.warning(f"커넥션 상태 확인 실패: {str(e)}")
+            return False
+
+    def _close_connections(self, connections):
+        """커넥션 종료 (락 밖에서 호출)"""
+        for connection in connections:
+            if self.on_close:
+                try:
+                    self.on_close(connection)
+                except Exception as e:
+                    self.logger.warning(f"커넥션 종료 콜백 실패: {str(e)}")
+            try:
+                connection.close()
+            except Exception as e:
+                self.logger.warning(f"커넥션 종료 실패: {str(e)}")
+
+    def _evict_idle(self):
+        """유휴 시간이 초과된 커넥션 분리 (락 보유 상태에서 호출)"""
+        now = time.monotonic()
+        expired = [conn for conn, released_at in self._idle if now - released_at > self.max_idle]
+        if expired:
+            self._idle = [(conn, released_at) for conn, released_at in self._idle
+                          if now - released_at <= self.max_idle]
+            self._size -= len(expired)
+            self.logger.debug(f"유휴 커넥션 {len(expired)}개 정리")
+        return expired
+
+    def _reclaim_dead_leases(self):
+        """종료된 스레드가 임대한 커넥션 회수 (락 보유 상태에서 호출)"""
+        reclaimed = []
+        for ident, (thread, connection) in list(self._leases.items()):
+            if not thread.is_alive():
+                del self._leases[ident]
+                reclaimed.append(connection)
+        if reclaimed:
+            self._size -= len(reclaimed)
+            self.logger.debug(f"종료된 스레드의 커넥션 {len(reclaimed)}개 회수")
+        return reclaimed
+
+    def current(self):
+        """현재 스레드가 임대 중인 커넥션 반환 (없으면 None)"""
+        with self._lock:
+            lease = self._leases.get(threading.get_ident())
+            return lease[1] if lease else None
+
+    def acquire(self):
+        """현재 스레드에 커넥션 임대 (이미 임대 중이면 같은 커넥션 반환)"""
+        thread = threading.current_thread()
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            stale = []
+            connection = None
+            create_new = False
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("커넥션 풀이 닫혀 있습니다")
+
+                lease = self._leases.get(thread.ident)
+                if lease:
+                    return lease[1]
+
+                stale.extend(self._evict_idle())
+                if not self._idle and self._size >= self.max_size:
+                    stale.extend(self._reclaim_dead_leases())
+
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                elif self._size < self.max_size:
+                    self._size += 1
+                    create_new = True
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"커넥션 대기 시간 초과 ({self.timeout}초, 최대 {self.max_size}개 사용 중)"
+                        )
+                    self._lock.wait(remaining)
+
+            self._close_connections(stale)
+
+            if create_new:
+                try:
+                    connection = self._create_connection()
+                except Exception:
+                    with self._lock:
+                        self._size -= 1
+                        self._lock.notify()
+                    raise
+                self.logger.debug(f"새 커넥션 생성 - 스레드: {thread.name}")
+            elif connection is not None and not self._is_healthy(connection):
+                self._close_connections([connection])
+                with self._lock:
+                    self._size -= 1
+                    self._lock.notify()
+                continue
+
+            if connection is None:
+                continue
+
+            with self._lock:
+                self._leases[thread.ident] = (thread, connection)
+            return connection
+
+    def release(self):
+        """현재 스레드의 커넥션을 풀에 반납 (커밋되지 않은 트랜잭션은 롤백)"""
+        with self._lock:
+            lease = self._leases.pop(threading.get_ident(), None)
+        if not lease:
+            return
+
+        connection = lease[1]
+        try:
+            connection.rollback()
+        except Exception as e:
+            self.logger.warning(f"반납 커넥션 롤백 실패, 커넥션 폐기: {str(e)}")
+            self._close_connections([connection])
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            return
+
+        with self._lock:
+            if self._closed:
+                closed = True
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._lock.notify()
+                closed = False
+        if closed:
+            self._close_connections([connection])
+
+    def discard(self):
+        """현재 스레드의 커넥션을 반납하지 않고 폐기 (연결 오류 시)"""
+        with self._lock:
+            lease = self._leases.pop(threading.get_ident(), None)
+            if lease:
+                self._size -= 1
+                self._lock.notify()
+        if lease:
+            self._close_connections([lease[1]])
+
+    @contextmanager
+    def connection(self):
+        """
+        커넥션 체크아웃/체크인 컨텍스트 매니저
+
+        현재 스레드가 이미 커넥션을 임대 중이면 그 커넥션을 그대로 사용하고
+        블록이 끝나도 반납하지 않습니다.
+        """
+        already_leased = self.current() is not None
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            if not already_leased:
+                self.release()
+
+    def close_all(self):
+        """모든 커넥션 종료"""
+        with self._lock:
+            self._closed = True
+            connections = [conn for conn, _ in self._idle]
+            connections.extend(conn for _, conn in self._leases.values())
+            self._idle = []
+            self._leases = {}
+            self._size = 0
+            self._lock.notify_all()
+        self._close_connections(connections)
+
+    def get_statistics(self):
+        """풀 사용 현황 반환"""
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "open_connections": self._size,
+                "idle_connections": len(self._idle),
+                "leased_connections": len(self._leases)
+            }
@@ -1,23 +1,46 @@
 """데이터베이스 연결 관리"""
-import fdb
+import threading
+from contextlib import contextmanager
+from .connection_pool import ConnectionPool
+from .statement_cache import StatementCache, is_ddl
 from ..utils.logger import setup_logger
 
 class DBConnector:
     def __init__(self, config):
         self.config = config
-        self.connection = None
+        self.pool = None
+        self.statement_cache = StatementCache(config.statement_cache_size)
+        self._local = threading.local()    # 스레드별 실행 쿼리 수
         self.logger = setup_logger(__name__)
+
+    @property
+    def query_count(self):
+        """현재 스레드에서 실행된 쿼리 수 (쿼리 예산 확인용, 다른 스레드의 쿼리는 포함하지 않음)"""
+        return getattr(self._local, 'query_count', 0)
+
+    def _count_query(self):
+        self._local.query_count = self.query_count + 1
+
+    @property
+    def connection(self):
+        """현재 스레드가 사용 중인 커넥션 (없으면 None)"""
+        if not self.pool:
+            return None
+        return self.pool.current()
     
     def connect(self):
-        """데이터베이스 연결"""
+        """데이터베이스 연결 (커넥션 풀 생성 후 현재 스레드에 커넥션 할당)"""
         self.logger.info("데이터베이스 연결 시도")
         try:
-            self.connection = fdb.connect(
-                dsn=self.config.dsn,
-                user=self.config.user,
-                password=self.config.password,
-                charset='UTF8'
-            )
+            if not self.pool:
+                self.pool = ConnectionPool(
+                    self.config,
+                    max_size=self.config.pool_size,
+                    max_idle=self.config.pool_max_idle,
+                    timeout=self.config.pool_timeout,
+                    on_close=self.statement_cache.discard_connection
+                )
+            self.pool.acquire()
             self.logger.info("데이터베이스 연결 성공")
             return True
         except Exception as e:
@@ -26,27 +49,81 @@ class DBConnector:
 
     def execute(self, query, params=None):
         """쿼리 실행"""
-        cursor = self.cursor()
+        cursor, _ = self._execute(query, params)
+        return cursor
+
+    def _execute(self, query, params=None):
+        """
+        쿼리 실행 (준비문 캐시 사용)
+
+        Returns:
+            tuple: (cursor, 캐시된 준비문 - DDL인 경우 None)
+        """
+        connection = None
+        statement = None
+        self._count_query()
         try:
+            if is_ddl(query):
+                # DDL은 캐시하지 않고, 실행 전에 기존 준비문을 모두 무효화
+                self.invalidate_statement_cache()
+                cursor = self.cursor()
+                operation = query
+            else:
+                connection = self._acquire_connection()
+                cursor, statement = self.statement_cache.get(connection, query)
+                operation = statement
+
             if params:
                 # Firebird는 ? 대신 named parameters나 위치 기반 parameters를 사용
                 if isinstance(params, (list, tuple)):
-                    cursor.execute(query, parameters=params)  # 위치 기반 파라미터
+                    cursor.execute(operation, parameters=params)  # 위치 기반 파라미터
                 else:
-                    cursor.execute(query, named_parameters=params)  # 이름 기반 파라미터
+                    cursor.execute(operation, named_parameters=params)  # 이름 기반 파라미터
             else:
-                cursor.execute(query)
+                cursor.execute(operation)
 
-            return cursor
+            return cursor, statement
 
         except Exception as e:
+            if connection is not None:
+                self.statement_cache.discard(connection, query)
             self.rollback()
             self.logger.error(f"쿼리 실행 실패: {str(e)}\n쿼리: {query}\n파라미터: {params}", exc_info=True)
             raise
 
+    def execute_many(self, query, params_list):
+        """
+        같은 쿼리를 여러 파라미터로 일괄 실행 (준비문 한 번으로 실행)
+
+        Args:
+            query: 실행할 쿼리 (DML)
+            params_list: 위치 기반 파라미터 튜플 목록
+        """
+        connection = None
+        self._count_query()
+        try:
+            connection = self._acquire_connection()
+            cursor, statement = self.statement_cache.get(connection, query)
+            cursor.executemany(statement, params_list)
+            return cursor
+
+        except Exception as e:
+            if connection is not None:
+                self.statement_cache.discard(connection, query)
+            self.rollback()
+            self.logger.error(f"일괄 쿼리 실행 실패: {str(e)}\n쿼리: {query}\n건수: {len(params_list)}", exc_info=True)
+            raise
+
+    def _close_result(self, cursor, statement):
+        """결과 집합 정리 (캐시된 준비문은 다음 실행을 위해 유지)"""
+        if statement is not None:
+            statement.close()
+        else:
+            cursor.close()
+
     def fetch_one(self, query, params=None):
         """단일 결과 조회"""
-        cursor = self.execute(query, params)
+        cursor, statement = self._execute(query, params)
         try:
             row = cursor.fetchone()
             if row and cursor.description:
@@ -55,11 +132,11 @@ class DBConnector:
                 return dict(zip(columns, row))
             return None
         finally:
-            cursor.close()
+            self._close_result(cursor, statement)
 
     def fetch_all(self, query, params=None):
         """모든 결과 조회"""
-        cursor = self.execute(query, params)
+        cursor, statement = self._execute(query, params)
         try:
             rows = cursor.fetchall()
             if rows and cursor.description:
@@ -68,38 +145,69 @@ class DBConnector:
                 return [dict(zip(columns, row)) for row in rows]
             return []
         finally:
-            cursor.close()
+            self._close_result(cursor, statement)
     
-    def cursor(self):
-        """커서 반환"""
-        if not self.connection:
+    def _acquire_connection(self):
+        """현재 스레드의 커넥션 반환 (연결이 없으면 재연결)"""
+        if not self.pool:
             self.logger.warning("데이터베이스 연결이 없습니다. 재연결 시도...")
             if not self.connect():
                 raise Exception("데이터베이스 연결 실패")
-        return self.connection.cursor()
+        return self.pool.acquire()
+
+    def invalidate_statement_cache(self):
+        """준비문 캐시 무효화 (DDL 실행 전 호출)"""
+        self.statement_cache.invalidate(self.connection)
+
+    def cursor(self):
+        """커서 반환 (현재 스레드의 커넥션 사용)"""
+        return self._acquire_connection().cursor()
+
+    @contextmanager
+    def checkout(self):
+        """
+        커넥션 체크아웃 컨텍스트 매니저
+
+        Example:
+            with db_connector.checkout() as connection:
+                cursor = connection.cursor()
+        """
+        if not self.pool and not self.connect():
+            raise Exception("데이터베이스 연결 실패")
+        with self.pool.connection() as connection:
+            yield connection
+
+    def release(self):
+        """현재 스레드의 커넥션을 풀에 반납 (백그라운드 작업 종료 시 호출)"""
+        if self.pool:
+            self.pool.release()
 
     def commit(self):
         """트랜잭션 커밋"""
-        if self.connection:
-            self.connection.commit()
+        connection = self.connection
+        if connection:
+            connection.commit()
             self.logger.debug("트랜잭션 커밋 완료")
 
     def rollback(self):
         """트랜잭션 롤백"""
         self.logger.info("트랜잭션 롤백 시도")
         try:
-            if self.connection:
-                self.connection.rollback()
+            connection = self.connection
+            if connection:
+                connection.rollback()
                 self.logger.info("트랜잭션 롤백 성공")
         except Exception as e:
             self.logger.error(f"트랜잭션 롤백 실패: {str(e)}", exc_info=True)
+            # 롤백조차 실패한 커넥션은 재사용하지 않음
+            self.pool.discard()
 
     def close(self):
         """데이터베이스 연결 종료"""
-        if self.connection:
+        if self.pool:
             try:
-                self.connection.close()
-                self.connection = None
+                self.pool.close_all()
+                self.pool = None
                 self.logger.info("데이터베이스 연결 종료")
             except Exception as e:
                 self.logger.error(f"데이터베이스 연결 종료 실패: {str(e)}", exc_info=True)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""준비된 SQL 문(Prepared Statement) 캐시"""
+import threading
+from collections import OrderedDict
+from ..utils.logger import setup_logger
+
+# 실행 시 캐시를 무효화해야 하는 DDL 키워드
+DDL_KEYWORDS = ('CREATE', 'ALTER', 'DROP', 'RECREATE')
+
+def is_ddl(query):
+    """DDL 쿼리인지 확인"""
+    parts = query.lstrip().split(None, 1)
+    return bool(parts) and parts[0].upper() in DDL_KEYWORDS
+
+class StatementCache:
+    """
+    커넥션별 LRU 준비문 캐시
+
+    fdb의 PreparedStatement는 자신을 만든 커서에 묶여 있으므로 (커서, 준비문) 쌍을
+    SQL 문자열 기준으로 저장합니다. 커넥션은 한 번에 한 스레드만 사용하므로
+    커넥션별 캐시는 락 없이 접근하고, 전체 무효화는 세대(generation) 번호로 처리합니다.
+    """
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+        self._caches = {}        # id(connection) -> (connection, generation, OrderedDict)
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _close_statements(self, entries):
+        """캐시에서 제거된 준비문의 커서 종료"""
+        for cursor, _ in entries:
+            try:
+                cursor.close()
+            except Exception as e:
+                self.logger.debug(f"준비문 커서 종료 실패: {str(e)}")
+
+    def _get_statements(self, connection):
+        """커넥션의 준비문 캐시 반환 (세대가 바뀌었으면 비우고 새로 생성)"""
+        key = id(connection)
+        with self._lock:
+            entry = self._caches.get(key)
+            generation = self._generation
+            if entry and entry[0] is connection and entry[1] == generation:
+                return entry[2]
+            statements = OrderedDict()
+            self._caches[key] = (connection, generation, statements)
+
+        if entry and entry[0] is connection:
+            self._close_statements(entry[2].values())
+        return statements
+
+    def get(self, connection, query):
+        """SQL에 해당하는 (cursor, prepared statement) 반환 (없으면 준비 후 캐시)"""
+        statements = self._get_statements(connection)
+
+        cached = statements.get(query)
+        if cached:
+            statements.move_to_end(query)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        cursor = connection.cursor()
+        try:
+            statement = cursor.prep(query)
+        except Exception:
+            cursor.close()
+            raise
+        statements[query] = (cursor, statement)
+
+        if len(statements) > self.max_size:
+            _, evicted = statements.popitem(last=False)
+            self._close_statements([evicted])
+        return cursor, statement
+
+    def discard(self, connection, query):
+        """특정 준비문 제거 (실행 실패 시)"""
+        with self._lock:
+            entry = self._caches.get(id(connection))
+        if entry and entry[0] is connection:
+            removed = entry[2].pop(query, None)
+            if removed:
+                self._close_statements([removed])
+
+    def discard_connection(self, connection):
+        """커넥션의 준비문 전체 제거 (커넥션 종료/재연결 시)"""
+        with self._lock:
+            entry = self._caches.get(id(connection))
+            if entry and entry[0] is connection:
+                del self._caches[id(connection)]
+            else:
+                entry = None
+        if entry:
+            self._close_statements(entry[2].values())
+
+    def invalidate(self, connection=None):
+        """
+        전체 캐시 무효화 (DDL 실행 전 호출)
+
+        다른 스레드의 커넥션 캐시는 다음 사용 시점에 비워지며,
+        connection이 주어지면 해당 커넥션의 캐시는 즉시 비웁니다.
+        """
+        with self._lock:
+            self._generation += 1
+        if connection is not None:
+            self.discard_connection(connection)
+        self.logger.debug("준비문 캐시 무효화")
+
+    def get_statistics(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            cached = sum(len(entry[2]) for entry in self._caches.values())
+        return {
+            "cached_statements": cached,
+            "hits": self.hits,
+            "misses": self.misses
+        }
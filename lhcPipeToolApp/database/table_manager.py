@@ -1,6 +1,6 @@
 """테이블 생성 및 관리"""
 from ..utils.logger import setup_logger
-from ..schemas.table_schemas import TABLES
+from ..schemas.table_schemas import TABLES, INDEXES
 
 class TableManager:
     def __init__(self, db_connector):
@@ -14,6 +14,8 @@ class TableManager:
             raise ValueError(f"Unknown table: {table_name}")
             
         try:
+            # DDL 실행 전 준비문 캐시 무효화
+            self.db_connector.invalidate_statement_cache()
             cursor = self.db_connector.cursor()
             sql = TABLES[table_name]
             self.logger.debug(f"실행할 SQL:\n{sql}")
@@ -46,7 +48,9 @@ class TableManager:
             'workers',
             'project_versions',
             'sequence_versions',
-            'versions'
+            'versions',
+            'version_files',
+            'operation_history'
         ]
         
         for table_name in table_order:
@@ -55,11 +59,53 @@ class TableManager:
                 return False
                 
         self.logger.info("모든 테이블 생성 완료")
+        return self.create_all_indexes()
+
+    def create_index(self, index_name):
+        """단일 인덱스 생성"""
+        if index_name not in INDEXES:
+            self.logger.error(f"Unknown index: {index_name}")
+            raise ValueError(f"Unknown index: {index_name}")
+
+        try:
+            # DDL 실행 전 준비문 캐시 무효화
+            self.db_connector.invalidate_statement_cache()
+            cursor = self.db_connector.cursor()
+            sql = INDEXES[index_name]
+            self.logger.debug(f"실행할 SQL:\n{sql}")
+
+            cursor.execute(sql)
+            self.db_connector.commit()
+            self.logger.info(f"인덱스 생성 성공: {index_name}")
+            return True
+        except Exception as e:
+            if 'already exists' not in str(e):
+                self.logger.error(
+                    f"인덱스 생성 오류: {str(e)}\n"
+                    f"인덱스: {index_name}\n"
+                    f"SQL: {INDEXES[index_name]}",
+                    exc_info=True
+                )
+                return False
+            self.logger.info(f"인덱스가 이미 존재함: {index_name}")
+            return True
+
+    def create_all_indexes(self):
+        """모든 인덱스 생성"""
+        self.logger.info("모든 인덱스 생성 시작")
+        for index_name in INDEXES:
+            if not self.create_index(index_name):
+                self.logger.error(f"인덱스 생성 실패: {index_name}")
+                return False
+
+        self.logger.info("모든 인덱스 생성 완료")
         return True
     
     def recreate_table(self, table_name):
         """테이블 재생성"""
         try:
+            # DDL 실행 전 준비문 캐시 무효화
+            self.db_connector.invalidate_statement_cache()
             cursor = self.db_connector.cursor()
             self.logger.info(f"테이블 삭제 시도: {table_name}")
             cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
@@ -168,6 +214,8 @@ class TableManager:
     def drop_table(self, table_name):
         """테이블 삭제"""
         try:
+            # DDL 실행 전 준비문 캐시 무효화
+            self.db_connector.invalidate_statement_cache()
             cursor = self.db_connector.cursor()
             self.logger.info(f"테이블 삭제 시도: {table_name}")
             cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
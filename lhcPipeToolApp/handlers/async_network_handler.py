@@ -1,127 +1,208 @@
 """비동기 네트워크 파일 핸들러"""
 import asyncio
-import aiofiles
-import os
-import time
+import errno
+import threading
 from pathlib import Path
 from typing import Optional
+from .file_copy_engine import FileCopyEngine
 from .network_path_handler import NetworkPathHandler
-from .retry_handler import retry_handler
+from .retry_handler import CircuitOpenError, network_retry_policy
+from ..utils.directory_cache import known_directories
 from ..utils.logger import setup_logger
 from ..handlers.monitoring_handler import NetworkMonitor, OperationType
 
 class AsyncNetworkFileHandler:
-    def __init__(self, chunk_size: int = 64 * 1024, timeout: float = 30.0):
+    STALL_CHECK_INTERVAL = 1.0     # 진행 상황 확인 간격(초)
+    THROUGHPUT_GRACE = 10.0        # 최소 처리량 검사를 시작하기 전 대기 시간(초)
+
+    def __init__(
+        self,
+        chunk_size: int = FileCopyEngine.INITIAL_CHUNK_SIZE,
+        stall_timeout: float = 30.0,
+        min_throughput_mbps: Optional[float] = None
+    ):
+        """
+        Args:
+            chunk_size: 복사 시작 청크 크기 (이후 처리량에 따라 조정)
+            stall_timeout: 전송량이 늘지 않은 채 이 시간(초)이 지나면 복사 중단
+            min_throughput_mbps: 평균 처리량이 이 값(MB/s) 아래로 떨어지면 복사 중단 (None이면 검사 안 함)
+        """
         self.logger = setup_logger(__name__)
         self.chunk_size = chunk_size
-        self.timeout = timeout
+        self.stall_timeout = stall_timeout
+        self.min_throughput_mbps = min_throughput_mbps
         self.network_path_handler = NetworkPathHandler()
-        self.monitor = NetworkMonitor()
+        self.monitor = NetworkMonitor.instance()
+        # 청크 크기는 측정한 처리량에 따라 엔진이 조정 (chunk_size는 시작 크기)
+        self.copy_engine = FileCopyEngine(initial_chunk_size=chunk_size)
+
+    @staticmethod
+    def _dispatch_progress(progress_callback: callable, progress: float) -> None:
+        """진행률 콜백 호출 (이벤트 루프 스레드, 코루틴 콜백도 지원)"""
+        result = progress_callback(progress)
+        if asyncio.iscoroutine(result):
+            asyncio.ensure_future(result)
 
     async def copy_file(self, source: str, destination: str, progress_callback: Optional[callable] = None) -> bool:
         try:
-            source_size = Path(source).stat().st_size
-            copied_size = 0
+            await self._copy(source, destination, progress_callback)
+            return True
+        except Exception as e:
+            self.logger.error(f"비동기 파일 복사 실패: {str(e)}")
+            return False
 
-            # 네트워크 접근 확인
-            success, actual_dest = self.network_path_handler.ensure_network_access(destination)
-            if not success:
-                raise PermissionError(f"네트워크 접근 실패: {actual_dest}")
+    async def _copy(self, source: str, destination: str, progress_callback: Optional[callable] = None) -> None:
+        """파일 복사 (실패 시 예외 발생)"""
+        source_size = Path(source).stat().st_size
+
+        # 네트워크 접근 확인
+        success, actual_dest = self.network_path_handler.ensure_network_access(destination)
+        if not success:
+            raise PermissionError(f"네트워크 접근 실패: {actual_dest}")
+
+        operation = self.monitor.start_operation(
+            OperationType.FILE_COPY,
+            source,
+            actual_dest,
+            source_size
+        )
+
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
 
-            operation = self.monitor.start_operation(
-                OperationType.FILE_COPY,
-                source,
-                actual_dest,
-                source_size
+        def on_progress(copied: int, total: int, speed: float) -> None:
+            # 복사 작업 스레드에서 호출됨
+            self.monitor.update_progress(operation.operation_id, copied, speed)
+            if progress_callback:
+                progress = copied / total * 100 if total else 100.0
+                loop.call_soon_threadsafe(self._dispatch_progress, progress_callback, progress)
+
+        # 복사는 작업 스레드에서 커널 복사(copy_file_range/sendfile) 또는 재사용 버퍼로 실행
+        copy_task = asyncio.ensure_future(asyncio.to_thread(
+            self.copy_engine.copy, source, actual_dest, on_progress, cancel_event
+        ))
+        # 중단 후 작업 스레드가 남긴 예외는 여기서 처리되므로 미확인 예외 경고 방지
+        copy_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        try:
+            await self._watch_progress(operation.operation_id, copy_task)
+            self.monitor.complete_operation(operation.operation_id, True)
+
+        except BaseException as e:
+            # 정체/취소 시 작업 스레드도 다음 청크에서 중단
+            # (복사한 부분은 .part 파일로 남아 다음 시도에서 이어서 복사)
+            cancel_event.set()
+            if not copy_task.done() and not isinstance(e, asyncio.CancelledError):
+                # 재시도가 같은 .part 파일을 열기 전에 작업 스레드가 정리될 때까지 대기
+                await asyncio.wait({copy_task}, timeout=self.stall_timeout)
+            self.monitor.complete_operation(
+                operation.operation_id,
+                False,
+                "복사 취소" if isinstance(e, asyncio.CancelledError) else str(e)
             )
-            
-            try:
-                start_time = time.time()
-                last_update_time = start_time
-
-                async with aiofiles.open(source, 'rb') as src:
-                    async with aiofiles.open(actual_dest, 'wb') as dst:
-                        while chunk := await src.read(self.chunk_size):
-                            await dst.write(chunk)
-                            copied_size += len(chunk)
-                            
-                            current_time = time.time()
-                            if current_time - last_update_time >= 1.0:
-                                speed = copied_size / (current_time - start_time)
-                                self.monitor.update_progress(
-                                    operation.operation_id,
-                                    copied_size,
-                                    speed
-                                )
-                                last_update_time = current_time
-
-                self.monitor.complete_operation(operation.operation_id, True)
-                return True
+            raise
 
-            except Exception as e:
-                self.monitor.complete_operation(operation.operation_id, False, str(e))
-                return False
+    async def _watch_progress(self, operation_id: str, copy_task: asyncio.Future) -> None:
+        """
+        NetworkMonitor의 진행 정보로 복사 정체 감시
 
-        except Exception as e:
-            self.logger.error(f"비동기 파일 복사 실패: {str(e)}")
-            return False
+        stall_timeout 동안 전송량이 늘지 않거나, THROUGHPUT_GRACE 이후 평균 처리량이
+        min_throughput_mbps보다 낮으면 TimeoutError를 발생시킵니다.
+        파일 크기와 무관하게 진행 중인 복사는 끝까지 기다립니다.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = last_progress_time = loop.time()
+        last_bytes = None
+
+        while True:
+            done, _ = await asyncio.wait({copy_task}, timeout=self.STALL_CHECK_INTERVAL)
+            if done:
+                copy_task.result()
+                return
+
+            status = self.monitor.active_operations.get(operation_id)
+            transferred = status.transferred_bytes if status else 0
+            now = loop.time()
+
+            if transferred != last_bytes:
+                last_bytes = transferred
+                last_progress_time = now
+            elif now - last_progress_time >= self.stall_timeout:
+                raise TimeoutError(
+                    f"복사 정체: {self.stall_timeout:.0f}초 동안 진행 없음 ({transferred} bytes)"
+                )
+
+            if self.min_throughput_mbps and status and now - start_time >= self.THROUGHPUT_GRACE:
+                speed = status.current_speed_mbps
+                if speed < self.min_throughput_mbps:
+                    raise TimeoutError(
+                        f"복사 처리량 부족: {speed:.2f} MB/s (최소 {self.min_throughput_mbps} MB/s)"
+                    )
 
     async def ensure_directory(self, path: str) -> bool:
         """
-        매핑된 드라이브 경로의 모든 상위 디렉토리를 순차적으로 생성
+        매핑된 드라이브 경로의 모든 상위 디렉토리를 생성
+
+        이번 세션에서 이미 확인한 디렉토리는 네트워크에 접근하지 않고 바로 성공합니다.
         """
         try:
+            if known_directories.contains(path):
+                return True
+
             # 네트워크 접근 확인 및 매핑된 드라이브 경로 얻기
             success, mapped_path = self.network_path_handler.ensure_network_access(path)
             if not success:
                 raise PermissionError(f"네트워크 접근 실패: {mapped_path}")
-            
+
             self.logger.debug(f"디렉토리 생성 시작: {mapped_path}")
-            
-            # 경로를 컴포넌트로 분리 (드라이브 경로 사용)
-            path_parts = Path(mapped_path).parts
-            
-            # 드라이브 문자로 시작하는 경우 (Y:\)
-            current_path = path_parts[0]  # 드라이브 문자 (예: Y:)
-            
-            # 순차적으로 디렉토리 생성
-            for part in path_parts[1:]:
-                current_path = os.path.join(current_path, part)
-                if not os.path.exists(current_path):
-                    try:
-                        os.makedirs(current_path, exist_ok=True)
-                        self.logger.info(f"디렉토리 생성됨: {current_path}")
-                    except Exception as e:
-                        self.logger.error(f"디렉토리 생성 실패: {current_path} - {str(e)}")
-                        return False
-                else:
-                    self.logger.debug(f"이미 존재하는 디렉토리: {current_path}")
-                
+            if not await asyncio.to_thread(known_directories.ensure, mapped_path):
+                return False
+            known_directories.add(path)
             return True
-            
+
         except Exception as e:
             self.logger.error(f"디렉토리 생성 실패: {str(e)}")
             return False
 
-    @retry_handler.retry_on_network_error()
     async def copy_with_timeout(self, source: str, destination: str, progress_callback: Optional[callable] = None) -> bool:
-        try:
-            # 네트워크 접근 확인 및 경로 변환
-            success, actual_dest = self.network_path_handler.ensure_network_access(destination)
-            if not success:
-                raise PermissionError(f"네트워크 접근 실패: {actual_dest}")
-
-            # 대상 디렉토리 생성
-            if not await self.ensure_directory(str(Path(actual_dest).parent)):
-                raise ValueError(f"대상 디렉토리 생성 실패: {actual_dest}")
+        """
+        정체 감시와 함께 파일 복사 (네트워크 오류/정체 시 공유 재시도 정책에 따라 재시도)
 
-            # 타임아웃과 함께 복사 실행
-            async with asyncio.timeout(self.timeout):
-                return await self.copy_file(source, actual_dest, progress_callback)
+        재시도는 .part 파일의 검증된 위치부터 이어서 복사하며, 대상 서버의 서킷 브레이커가
+        열려 있으면 시도하지 않고 바로 실패합니다.
+        """
+        try:
+            return await network_retry_policy.call_async(
+                self._copy_attempt, source, destination, progress_callback,
+                host=network_retry_policy.host_key(destination)
+            )
 
-        except asyncio.TimeoutError:
-            self.logger.error(f"파일 복사 시간 초과 (제한 시간: {self.timeout}초)")
+        except CircuitOpenError as e:
+            self.logger.error(f"파일 복사 중단: {str(e)}")
+            return False
+        except TimeoutError as e:
+            self.logger.error(f"파일 복사 시간 초과: {str(e)}")
             return False
         except Exception as e:
             self.logger.error(f"파일 복사 실패: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    async def _copy_attempt(self, source: str, destination: str, progress_callback: Optional[callable] = None) -> bool:
+        """복사 1회 시도 (실패 시 예외 발생)"""
+        # 네트워크 접근 확인 및 경로 변환
+        success, actual_dest = self.network_path_handler.ensure_network_access(destination)
+        if not success:
+            raise PermissionError(f"네트워크 접근 실패: {actual_dest}")
+
+        # 대상 디렉토리 생성
+        if not await self.ensure_directory(str(Path(actual_dest).parent)):
+            raise ValueError(f"대상 디렉토리 생성 실패: {actual_dest}")
+
+        # 정체 감시와 함께 복사 실행 (고정 제한 시간 없음)
+        try:
+            await self._copy(source, actual_dest, progress_callback)
+        except OSError as e:
+            # 대상 디렉토리가 사라졌으면 다음 시도에서 다시 생성
+            if e.errno == errno.ENOENT:
+                known_directories.discard(Path(actual_dest).parent)
+            raise
+        return True
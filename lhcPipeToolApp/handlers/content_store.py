@@ -0,0 +1,187 @@
+"""콘텐츠 주소 저장소"""
+import errno
+import hashlib
+import os
+import socket
+import stat
+import sys
+import threading
+import uuid
+from .file_copy_engine import FileCopyEngine
+from ..utils.logger import setup_logger
+
+class ContentStore:
+    """
+    해시로 주소를 정하는 파일 저장소 (<root>/<해시 앞 2자리>/<해시>)
+
+    같은 내용의 파일은 저장소에 한 번만 저장하고, 버전 폴더에는 reflink 또는 하드링크로 연결합니다.
+    하드링크는 모든 버전이 같은 파일을 공유하므로 저장소 파일은 읽기 전용으로 둡니다.
+    (Windows는 읽기 전용 속성이 하드링크 전체에 적용되어 버전 파일을 지울 수 없게 되므로 제외)
+    링크를 만들 수 없는 파일시스템이면 호출하는 쪽에서 일반 복사로 처리합니다.
+    링크 지원 여부는 can_link_to()로 (저장소, 대상 볼륨)마다 한 번만 확인합니다.
+    여러 작업자가 같은 내용을 동시에 올릴 수 있으므로 업로드는 업로더별 임시 파일에 쓰고
+    commit_upload()로 저장소 파일이 아직 없을 때만 등록합니다.
+    """
+
+    HASH_DIGEST_SIZE = 32            # BLAKE2b-256
+    HASH_CHUNK_SIZE = 8 * 1024 * 1024
+    FICLONE = 0x40049409             # Linux reflink ioctl
+    PROBE_NAME = ".link_probe"
+    UPLOAD_SUFFIX = ".upload"
+
+    # (저장소 경로, 대상 볼륨 장치 번호) -> 링크 가능 여부 (프로세스 전역)
+    _link_support = {}
+    _link_support_lock = threading.Lock()
+
+    def __init__(self, root):
+        self.logger = setup_logger(__name__)
+        self.root = root
+
+    @classmethod
+    def hash_file(cls, path):
+        """파일 내용 해시 (BLAKE2b-256, 16진수)"""
+        hasher = hashlib.blake2b(digest_size=cls.HASH_DIGEST_SIZE)
+        buffer = memoryview(bytearray(cls.HASH_CHUNK_SIZE))
+        with open(path, 'rb', buffering=0) as f:
+            while read := f.readinto(buffer):
+                hasher.update(buffer[:read])
+        return hasher.hexdigest()
+
+    def blob_path(self, content_hash):
+        """해시에 해당하는 저장소 파일 경로"""
+        return os.path.join(self.root, content_hash[:2], content_hash)
+
+    def has_blob(self, content_hash):
+        return os.path.exists(self.blob_path(content_hash))
+
+    def upload_path(self, content_hash):
+        """업로드용 임시 파일 경로 (업로더마다 달라 .part 파일과 이어받기 저널을 공유하지 않음)"""
+        return (f"{self.blob_path(content_hash)}.{socket.gethostname()}.{os.getpid()}."
+                f"{uuid.uuid4().hex}{self.UPLOAD_SUFFIX}")
+
+    def commit_upload(self, upload_path, content_hash):
+        """
+        업로드한 임시 파일을 저장소 파일로 등록 (이미 있는 저장소 파일은 덮어쓰지 않음)
+
+        Returns:
+            bool: 등록했으면 True, 그 사이 다른 업로더가 먼저 등록해 임시 파일을 지웠으면 False
+        """
+        blob = self.blob_path(content_hash)
+        self._seal(upload_path)
+        try:
+            if os.name == 'nt':
+                os.rename(upload_path, blob)    # Windows는 대상이 있으면 FileExistsError
+            else:
+                os.link(upload_path, blob)      # 대상이 있으면 FileExistsError
+                os.remove(upload_path)
+            return True
+        except FileExistsError:
+            self.remove_file(upload_path)
+            return False
+
+    def discard_upload(self, upload_path):
+        """실패한 업로드의 임시 파일, .part 파일과 저널 삭제 (이름이 업로더별이라 다시 이어받지 않음)"""
+        part_path = f"{upload_path}{FileCopyEngine.PART_SUFFIX}"
+        for path in (upload_path, part_path, f"{part_path}{FileCopyEngine.JOURNAL_SUFFIX}"):
+            try:
+                if os.path.exists(path):
+                    self.remove_file(path)
+            except OSError as e:
+                self.logger.warning(f"업로드 임시 파일 삭제 실패 ({path}): {str(e)}")
+
+    @staticmethod
+    def _seal(path):
+        """저장소에 넣을 파일을 읽기 전용으로 설정 (Windows 제외)"""
+        if os.name == 'nt':
+            return
+        mode = os.stat(path).st_mode
+        os.chmod(path, mode & ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH))
+
+    @staticmethod
+    def remove_file(path):
+        """
+        파일 삭제 (저장소 파일에 연결된 버전 파일 포함)
+
+        Windows에서 읽기 전용으로 설정된 이전 저장소 파일의 링크이면 읽기 전용 속성을 풀고 삭제합니다.
+        """
+        try:
+            os.remove(path)
+        except PermissionError:
+            if os.name != 'nt':
+                raise
+            os.chmod(path, os.stat(path).st_mode | stat.S_IWRITE)
+            os.remove(path)
+
+    def link(self, content_hash, target):
+        """
+        저장소 파일을 대상 경로에 연결 (reflink -> 하드링크 순서로 시도)
+
+        Returns:
+            str: 사용한 방식 ('reflink' 또는 'hardlink')
+
+        Raises:
+            OSError: 두 방식 모두 지원되지 않는 경우
+        """
+        blob = self.blob_path(content_hash)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if os.path.lexists(target):
+            self.remove_file(target)
+
+        if sys.platform.startswith('linux') and self._reflink(blob, target):
+            return 'reflink'
+        os.link(blob, target)
+        return 'hardlink'
+
+    def can_link_to(self, directory):
+        """
+        directory에 저장소 파일을 링크할 수 있는지 확인 (파일 접근 있음, 작업 스레드에서 호출)
+
+        작은 시험 파일로 reflink/하드링크를 한 번 시도하고 결과를 대상 볼륨별로 기억합니다.
+        """
+        key = (os.path.normcase(os.path.abspath(self.root)), os.stat(directory).st_dev)
+        with self._link_support_lock:
+            if key in self._link_support:
+                return self._link_support[key]
+
+        supported = self._probe_link(directory)
+        with self._link_support_lock:
+            self._link_support[key] = supported
+        if not supported:
+            self.logger.info(f"저장소 파일 링크 미지원 볼륨, 일반 복사로 처리: {directory}")
+        return supported
+
+    def _probe_link(self, directory):
+        probe_name = f"{self.PROBE_NAME}.{os.getpid()}.{threading.get_ident()}"
+        probe = os.path.join(self.root, probe_name)
+        target = os.path.join(directory, probe_name)
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(probe, 'wb') as f:
+                f.write(b'probe')
+            if sys.platform.startswith('linux') and self._reflink(probe, target):
+                return True
+            os.link(probe, target)
+            return True
+        except OSError as e:
+            self.logger.debug(f"링크 지원 확인 실패: {str(e)}")
+            return False
+        finally:
+            for path in (target, probe):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _reflink(self, blob, target):
+        """Linux에서 블록을 공유하는 독립 사본 생성 (btrfs/xfs 등, 미지원 시 False)"""
+        import fcntl
+        try:
+            with open(blob, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), self.FICLONE, src.fileno())
+            return True
+        except OSError as e:
+            if os.path.exists(target):
+                os.remove(target)
+            if e.errno not in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.EBADF):
+                self.logger.debug(f"reflink 실패: {str(e)}")
+            return False
@@ -0,0 +1,251 @@
+"""파일 복사 스케줄러"""
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, List, Optional, Tuple
+from .async_network_handler import AsyncNetworkFileHandler
+from ..utils.logger import setup_logger
+
+class CopyRequest:
+    """대기 중인 복사 요청"""
+
+    __slots__ = ('size', 'seq', 'volume', 'loop', 'future', 'granted', 'cancelled')
+
+    def __init__(self, size, seq, volume, loop, future):
+        self.size = size
+        self.seq = seq
+        self.volume = volume
+        self.loop = loop
+        self.future = future
+        self.granted = False
+        self.cancelled = False      # 대기 중 취소됨 (힙에서 꺼낼 때 건너뜀)
+
+class CopyScheduler:
+    """
+    동시 실행 수를 제한하는 파일 복사 스케줄러
+
+    전체 동시 복사 수와 대상 볼륨(드라이브/공유)별 동시 복사 수를 제한하므로
+    수천 개의 시퀀스 파일을 한 번에 넘겨도 실제로 열리는 파일 핸들 수는 제한값을 넘지 않습니다.
+    대기 중인 요청은 작은 파일부터 시작합니다.
+    대기 요청은 볼륨별 힙에 두고, 빈 슬롯이 있는 볼륨의 첫 요청만 시작 후보 힙에 올리므로
+    한 볼륨에 수천 개가 대기해도 배정 한 번에 한도에 걸린 요청을 다시 훑지 않습니다.
+    대기 상태는 이벤트 루프와 무관하게 관리되므로 여러 다이얼로그/서비스가 같은 인스턴스를 공유할 수 있습니다.
+
+    Example:
+        results = await copy_scheduler.copy_many([(source, destination), ...])
+    """
+
+    MAX_CONCURRENT = 4        # 전체 동시 복사 수
+    PER_VOLUME_LIMIT = 2      # 대상 볼륨별 동시 복사 수
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT, per_volume_limit: int = PER_VOLUME_LIMIT,
+                 file_handler: Optional[AsyncNetworkFileHandler] = None):
+        self.logger = setup_logger(__name__)
+        self.file_handler = file_handler or AsyncNetworkFileHandler()
+        self.max_concurrent = max_concurrent
+        self.per_volume_limit = per_volume_limit
+
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._waiting = {}                       # 볼륨 -> (size, seq, CopyRequest) 힙
+        self._ready = []                         # (size, seq, 볼륨) 힙, 빈 슬롯이 있는 볼륨의 첫 요청
+        self._queued = 0
+        self._queued_bytes = 0
+        self._active = 0
+        self._active_by_volume = defaultdict(int)
+
+        # 처리량 통계 (복사가 하나라도 진행 중인 시간 기준)
+        self._bytes_copied = 0
+        self._files_completed = 0
+        self._files_failed = 0
+        self._busy_time = 0.0
+        self._busy_since = None
+
+    def configure(self, max_concurrent: Optional[int] = None, per_volume_limit: Optional[int] = None) -> None:
+        """동시 실행 제한 변경 (대기 중인 요청에도 바로 적용)"""
+        with self._lock:
+            if max_concurrent:
+                self.max_concurrent = max_concurrent
+            if per_volume_limit:
+                self.per_volume_limit = per_volume_limit
+            # 볼륨 한도가 바뀌었으므로 시작 후보를 다시 구성
+            self._ready = []
+            for volume in list(self._waiting):
+                self._push_ready(volume)
+            self._dispatch()
+
+    @staticmethod
+    def volume_key(path: str) -> str:
+        """경로가 속한 볼륨 식별자 (드라이브 문자, UNC 공유 또는 장치 번호)"""
+        path = os.path.abspath(path)
+        drive = os.path.splitdrive(path)[0]
+        if drive:
+            return drive.lower()
+        # 드라이브 개념이 없는 경우 존재하는 가장 가까운 상위 디렉토리의 장치 번호 사용
+        while path and not os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        try:
+            return f"dev:{os.stat(path).st_dev}"
+        except OSError:
+            return path
+
+    def _push_ready(self, volume: str) -> None:
+        """볼륨의 첫 대기 요청을 시작 후보에 등록 (잠금 안에서 호출)"""
+        waiting = self._waiting.get(volume)
+        # 취소된 요청은 첫 요청이 될 때 제거 (볼륨 힙의 첫 요청은 항상 취소되지 않은 요청)
+        while waiting and waiting[0][2].cancelled:
+            heapq.heappop(waiting)
+        if not waiting:
+            self._waiting.pop(volume, None)
+            return
+        if self._active_by_volume.get(volume, 0) < self.per_volume_limit:
+            size, seq, _ = waiting[0]
+            heapq.heappush(self._ready, (size, seq, volume))
+
+    def _dispatch(self) -> None:
+        """빈 슬롯에 대기 요청 배정 (잠금 안에서 호출)"""
+        while self._ready and self._active < self.max_concurrent:
+            _, seq, volume = heapq.heappop(self._ready)
+            waiting = self._waiting.get(volume)
+            # 이미 시작/취소된 요청이거나 볼륨 한도에 걸린 후보는 버림 (슬롯 반납 시 다시 등록)
+            if (not waiting or waiting[0][1] != seq
+                    or self._active_by_volume.get(volume, 0) >= self.per_volume_limit):
+                continue
+
+            request = heapq.heappop(waiting)[2]
+            self._queued -= 1
+            self._queued_bytes -= request.size
+            request.granted = True
+            self._active += 1
+            self._active_by_volume[request.volume] += 1
+            if self._busy_since is None:
+                self._busy_since = time.monotonic()
+            request.loop.call_soon_threadsafe(self._wake, request.future)
+            self._push_ready(volume)
+
+    @staticmethod
+    def _wake(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    async def _acquire(self, size: int, volume: str) -> CopyRequest:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            request = CopyRequest(size, next(self._sequence), volume, loop, loop.create_future())
+            waiting = self._waiting.setdefault(volume, [])
+            heapq.heappush(waiting, (size, request.seq, request))
+            self._queued += 1
+            self._queued_bytes += size
+            if waiting[0][2] is request:
+                self._push_ready(volume)
+            self._dispatch()
+
+        try:
+            await request.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if request.granted:
+                    self._release_slot(request.volume)
+                else:
+                    request.cancelled = True
+                    self._queued -= 1
+                    self._queued_bytes -= request.size
+                    waiting = self._waiting.get(request.volume)
+                    if waiting and waiting[0][2] is request:
+                        self._push_ready(request.volume)
+            raise
+        return request
+
+    def _release_slot(self, volume: str) -> None:
+        """슬롯 반납 후 다음 요청 배정 (잠금 안에서 호출)"""
+        self._active -= 1
+        self._active_by_volume[volume] -= 1
+        if not self._active_by_volume[volume]:
+            del self._active_by_volume[volume]
+        if not self._active and self._busy_since is not None:
+            self._busy_time += time.monotonic() - self._busy_since
+            self._busy_since = None
+        self._push_ready(volume)
+        self._dispatch()
+
+    async def copy(self, source: str, destination: str, progress_callback: Optional[Callable] = None) -> bool:
+        """슬롯이 날 때까지 기다린 후 파일 복사"""
+        try:
+            size = os.path.getsize(source)
+        except OSError:
+            size = 0
+        volume = self.volume_key(destination)
+
+        request = await self._acquire(size, volume)
+        success = False
+        try:
+            success = await self.file_handler.copy_with_timeout(source, destination, progress_callback)
+            return success
+        finally:
+            with self._lock:
+                if success:
+                    self._bytes_copied += size
+                    self._files_completed += 1
+                else:
+                    self._files_failed += 1
+                self._release_slot(request.volume)
+
+    async def copy_many(self, files: List[Tuple[str, str]],
+                        progress_callback: Optional[Callable] = None) -> List[bool]:
+        """
+        여러 파일 복사 (동시 실행 수는 스케줄러 제한을 따름)
+
+        Args:
+            files: (source, destination) 튜플 목록
+            progress_callback: callback(source, progress) 파일별 진행률 콜백
+
+        Returns:
+            list[bool]: 입력 순서대로 각 파일의 복사 성공 여부
+        """
+        async def copy_one(source: str, destination: str) -> bool:
+            callback = None
+            if progress_callback:
+                callback = lambda progress: progress_callback(source, progress)
+            try:
+                return await self.copy(source, destination, callback)
+            except Exception as e:
+                self.logger.error(f"파일 복사 실패 ({source}): {str(e)}")
+                return False
+
+        start_time = time.monotonic()
+        results = await asyncio.gather(*(copy_one(source, destination) for source, destination in files))
+
+        elapsed = time.monotonic() - start_time
+        self.logger.info(
+            f"일괄 복사 완료 - 성공: {sum(results)}/{len(results)}, "
+            f"소요시간: {elapsed:.2f}초, 전체 처리량: {self.get_statistics()['throughput_mbps']:.1f} MB/s"
+        )
+        return list(results)
+
+    def get_statistics(self) -> dict:
+        """스케줄러 상태와 누적 처리량 반환"""
+        with self._lock:
+            busy_time = self._busy_time
+            if self._busy_since is not None:
+                busy_time += time.monotonic() - self._busy_since
+            return {
+                "active": self._active,
+                "queued": self._queued,
+                "queued_bytes": self._queued_bytes,
+                "active_by_volume": dict(self._active_by_volume),
+                "files_completed": self._files_completed,
+                "files_failed": self._files_failed,
+                "bytes_copied": self._bytes_copied,
+                "throughput_mbps": (self._bytes_copied / busy_time) / (1024 * 1024) if busy_time > 0 else 0.0
+            }
+
+
+# 서비스와 다이얼로그가 함께 사용하는 전역 인스턴스
+copy_scheduler = CopyScheduler()
@@ -0,0 +1,305 @@
+"""파일 복사 엔진"""
+import errno
+import hashlib
+import json
+import os
+import sys
+import time
+from ..utils.logger import setup_logger
+
+class CopyCancelledError(Exception):
+    """복사 작업이 취소된 경우"""
+
+class CopyJournal:
+    """
+    재개용 사이드카 파일 (<대상>.part.json)
+
+    원본 파일의 크기/수정 시각과 .part 파일에 기록한 청크별 (길이, 해시)를 저장합니다.
+    커널 복사로 기록한 청크는 데이터를 읽지 않으므로 해시 없이(None) 길이만 저장합니다.
+    원본이 바뀌었으면 불러오지 않으므로 처음부터 다시 복사합니다.
+    """
+
+    def __init__(self, path, source_size, source_mtime):
+        self.path = path
+        self.source_size = source_size
+        self.source_mtime = source_mtime
+        self.chunks = []   # [length, hexdigest]
+
+    @classmethod
+    def load(cls, path, source_size, source_mtime):
+        """사이드카 불러오기 (없거나 원본이 바뀌었으면 None)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('source_size') != source_size or data.get('source_mtime') != source_mtime:
+            return None
+        journal = cls(path, source_size, source_mtime)
+        journal.chunks = [list(chunk) for chunk in data.get('chunks', [])]
+        return journal
+
+    @property
+    def end(self):
+        """기록된 청크의 끝 위치"""
+        return sum(length for length, _ in self.chunks)
+
+    def append(self, length, digest):
+        self.chunks.append([length, digest])
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체하여 저장 (쓰다가 중단되어도 이전 내용 유지)"""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'source_size': self.source_size,
+                'source_mtime': self.source_mtime,
+                'chunks': self.chunks
+            }, f)
+        os.replace(temp_path, self.path)
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+class FileCopyEngine:
+    """
+    커널 오프로드 파일 복사 엔진 (동기, 작업 스레드에서 실행)
+
+    사용 가능한 백엔드 중 가장 빠른 것을 사용합니다.
+        copy_file_range: 커널 안에서 복사 (같은 파일시스템이면 서버/스토리지 측 복사까지 가능)
+        sendfile: 커널 안에서 복사 (Linux)
+        readinto: 재사용 버퍼로 읽고 쓰기 (Windows 등 위 함수가 없는 환경)
+    커널 복사가 지원되지 않는 파일시스템이면 남은 부분은 readinto로 이어서 복사합니다.
+    청크 크기는 청크당 소요 시간을 기준으로 늘리거나 줄여 진행률 보고 간격을 일정하게 유지합니다.
+
+    복사는 <대상>.part 파일에 한 뒤 완료되면 원자적으로 이름을 바꾸므로 중단되어도
+    불완전한 대상 파일이 남지 않습니다. RESUMABLE_MIN_SIZE 이상인 파일은 청크별 해시를
+    사이드카에 기록해 두었다가, 다시 복사할 때 마지막으로 검증된 청크 다음부터 이어서 복사합니다.
+    이어받기 정보가 없는 .part 파일은 복사가 실패하면 삭제합니다.
+    """
+
+    MIN_CHUNK_SIZE = 256 * 1024
+    MAX_CHUNK_SIZE = 64 * 1024 * 1024
+    INITIAL_CHUNK_SIZE = 4 * 1024 * 1024
+    TARGET_CHUNK_SECONDS = 0.25    # 청크 하나당 목표 소요 시간
+    PROGRESS_INTERVAL = 0.5        # 진행률 콜백 최소 간격(초)
+
+    PART_SUFFIX = ".part"
+    JOURNAL_SUFFIX = ".json"                # <대상>.part.json
+    RESUMABLE_MIN_SIZE = 32 * 1024 * 1024   # 이어받기 사이드카를 기록할 최소 파일 크기
+    JOURNAL_INTERVAL = 2.0                  # 사이드카 저장 간격(초)
+
+    # 커널 복사를 포기하고 readinto로 전환할 오류
+    FALLBACK_ERRNOS = {
+        errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+        getattr(errno, 'EOPNOTSUPP', errno.ENOSYS), getattr(errno, 'ENOTSUP', errno.ENOSYS)
+    }
+
+    def __init__(self, initial_chunk_size=INITIAL_CHUNK_SIZE, backend=None):
+        self.logger = setup_logger(__name__)
+        self.initial_chunk_size = min(max(initial_chunk_size, self.MIN_CHUNK_SIZE), self.MAX_CHUNK_SIZE)
+        self.backend = backend or self.detect_backend()
+
+    @staticmethod
+    def detect_backend():
+        """현재 플랫폼에서 사용할 백엔드 이름 반환"""
+        if hasattr(os, 'copy_file_range'):
+            return 'copy_file_range'
+        if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+            return 'sendfile'
+        return 'readinto'
+
+    def copy(self, source, destination, progress_callback=None, cancel_event=None):
+        """
+        파일 복사 (<대상>.part에 쓴 뒤 완료 시 이름 변경, 중단된 복사는 이어서 진행)
+
+        Args:
+            source: 원본 파일 경로
+            destination: 대상 파일 경로 (있으면 덮어씀)
+            progress_callback: callback(copied_bytes, total_bytes, bytes_per_second), 작업 스레드에서 호출
+            cancel_event: set()되면 다음 청크 전에 CopyCancelledError 발생 (threading.Event)
+
+        Returns:
+            int: 대상 파일 크기 (이어받은 부분 포함)
+        """
+        part_path = f"{destination}{self.PART_SUFFIX}"
+        journal_path = f"{part_path}{self.JOURNAL_SUFFIX}"
+        journal = None
+        part_opened = False
+
+        try:
+            with open(source, 'rb', buffering=0) as src:
+                stat = os.fstat(src.fileno())
+                total = stat.st_size
+
+                start = 0
+                if total >= self.RESUMABLE_MIN_SIZE:
+                    journal = CopyJournal.load(journal_path, total, stat.st_mtime_ns)
+                    if journal and os.path.exists(part_path):
+                        start = self._verify_part(part_path, journal, src)
+                    else:
+                        journal = CopyJournal(journal_path, total, stat.st_mtime_ns)
+
+                with open(part_path, 'r+b' if start else 'wb', buffering=0) as dst:
+                    part_opened = True
+                    if start:
+                        dst.truncate(start)
+                        self.logger.info(f"중단된 복사 이어서 진행: {destination} ({start}/{total} bytes)")
+
+                    on_chunk = self._journal_recorder(dst, journal) if journal else None
+                    try:
+                        copied = self._copy_loop(src, dst, total, progress_callback, cancel_event, start, on_chunk)
+                        os.fsync(dst.fileno())
+                    except BaseException:
+                        if journal:
+                            self._save_journal(dst, journal)
+                        raise
+
+            if copied != total:
+                if journal:
+                    journal.remove()
+                    journal = None
+                raise OSError(f"복사된 크기 불일치: {copied}/{total} bytes")
+        except BaseException:
+            # 이어받기 정보가 없는 .part 파일은 다시 사용할 수 없으므로 삭제
+            if part_opened and journal is None:
+                self._remove_part(part_path)
+            raise
+
+        os.replace(part_path, destination)
+        if journal:
+            journal.remove()
+        return copied
+
+    def _remove_part(self, part_path):
+        """실패한 복사의 .part 파일 삭제"""
+        try:
+            os.remove(part_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f".part 파일 삭제 실패: {part_path} ({str(e)})")
+
+    def _journal_recorder(self, dst, journal):
+        """복사된 청크를 사이드카에 기록하는 on_chunk 콜백 생성 (JOURNAL_INTERVAL마다 저장)"""
+        last_save = [time.monotonic()]
+
+        def record_chunk(offset, length, data):
+            # 커널 복사(data 없음)는 원본을 다시 읽지 않도록 해시 없이 기록 (이어받을 때 검증)
+            journal.append(length, self._hash_chunk(None, offset, length, data) if data is not None else None)
+            now = time.monotonic()
+            if now - last_save[0] >= self.JOURNAL_INTERVAL:
+                # 디스크에 기록된 청크만 사이드카에 남도록 flush 후 저장
+                os.fsync(dst.fileno())
+                journal.save()
+                last_save[0] = now
+
+        return record_chunk
+
+    def _save_journal(self, dst, journal):
+        """중단 시 이어받기 정보 저장"""
+        try:
+            os.fsync(dst.fileno())
+            journal.save()
+        except OSError as e:
+            self.logger.warning(f"이어받기 정보 저장 실패: {str(e)}")
+
+    def _verify_part(self, part_path, journal, src):
+        """
+        .part 파일의 기록된 청크를 끝에서부터 검증하여 이어서 복사할 위치 반환
+
+        사이드카는 fsync 이후에만 저장되므로 마지막으로 검증된 청크 앞부분은 기록된 것으로 봅니다.
+        해시 없이 기록된 청크(커널 복사)는 원본의 같은 구간과 비교합니다.
+        """
+        with open(part_path, 'rb', buffering=0) as part:
+            part_size = os.fstat(part.fileno()).st_size
+            while journal.chunks:
+                length, digest = journal.chunks[-1]
+                offset = journal.end - length
+                if offset + length <= part_size:
+                    if digest is None:
+                        digest = self._hash_chunk(src, offset, length)
+                    if self._hash_chunk(part, offset, length) == digest:
+                        break
+                journal.chunks.pop()
+        return journal.end
+
+    @staticmethod
+    def _hash_chunk(file, offset, length, data=None):
+        """청크 해시 (data가 없으면 파일 위치를 바꾸지 않고 읽음)"""
+        if data is None:
+            if hasattr(os, 'pread'):
+                data = os.pread(file.fileno(), length, offset)
+            else:
+                position = file.tell()
+                file.seek(offset)
+                data = file.read(length)
+                file.seek(position)
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _copy_loop(self, src, dst, total, progress_callback, cancel_event, start=0, on_chunk=None):
+        backend = self.backend
+        chunk_size = self.initial_chunk_size
+        buffer = None
+        copied = start
+        start_time = last_report = time.monotonic()
+        src.seek(start)
+        dst.seek(start)
+
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CopyCancelledError(f"복사 취소됨 ({copied}/{total} bytes)")
+
+            chunk_start = time.monotonic()
+            try:
+                if backend == 'copy_file_range':
+                    written = os.copy_file_range(src.fileno(), dst.fileno(), chunk_size)
+                elif backend == 'sendfile':
+                    written = os.sendfile(dst.fileno(), src.fileno(), copied, chunk_size)
+                else:
+                    if buffer is None:
+                        # 최대 청크 크기의 버퍼를 한 번만 할당하고 memoryview로 잘라서 재사용
+                        buffer = memoryview(bytearray(self.MAX_CHUNK_SIZE))
+                    written = src.readinto(buffer[:chunk_size])
+                    if written:
+                        dst.write(buffer[:written])
+            except OSError as e:
+                if backend == 'readinto' or e.errno not in self.FALLBACK_ERRNOS:
+                    raise
+                self.logger.debug(f"{backend} 미지원 ({e.strerror}), readinto로 전환")
+                backend = 'readinto'
+                # 커널 복사 도중 전환하므로 양쪽 파일 위치를 복사한 위치로 맞춤
+                src.seek(copied)
+                dst.seek(copied)
+                continue
+
+            if not written:
+                break
+            if on_chunk:
+                # 커널 복사는 데이터가 버퍼를 거치지 않으므로 None 전달
+                on_chunk(copied, written, buffer[:written] if backend == 'readinto' else None)
+            copied += written
+
+            # 청크 소요 시간에 맞춰 청크 크기 조정
+            chunk_elapsed = time.monotonic() - chunk_start
+            if chunk_elapsed < self.TARGET_CHUNK_SECONDS / 2 and chunk_size < self.MAX_CHUNK_SIZE:
+                chunk_size *= 2
+            elif chunk_elapsed > self.TARGET_CHUNK_SECONDS * 2 and chunk_size > self.MIN_CHUNK_SIZE:
+                chunk_size //= 2
+
+            now = time.monotonic()
+            if progress_callback and now - last_report >= self.PROGRESS_INTERVAL:
+                progress_callback(copied, total, (copied - start) / max(now - start_time, 1e-6))
+                last_report = now
+
+        elapsed = max(time.monotonic() - start_time, 1e-6)
+        if progress_callback:
+            progress_callback(copied, total, (copied - start) / elapsed)
+        self.logger.debug(
+            f"복사 완료 - backend: {backend}, {copied - start} bytes, "
+            f"{(copied - start) / elapsed / (1024 * 1024):.1f} MB/s"
+        )
+        return copied
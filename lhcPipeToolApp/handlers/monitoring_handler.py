@@ -1,5 +1,10 @@
 """네트워크 작업 모니터링 핸들러"""
-from dataclasses import dataclass
+import itertools
+import math
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
@@ -9,34 +14,263 @@ from ..utils.logger import setup_logger
 class OperationType(Enum):
     """작업 유형 정의"""
     FILE_COPY = "file_copy"
+    VERSION_FILE = "version_file"      # 버전 폴더로 파일 가져오기 (디렉토리 생성, 복사 대기 포함)
     DIRECTORY_CREATE = "directory_create"
     FILE_DELETE = "file_delete"
     NETWORK_CHECK = "network_check"
     DISK_CHECK = "disk_check"
+    PREVIEW_GENERATE = "preview_generate"
 
-@dataclass
 class OperationStatus:
     """작업 상태 정보"""
-    operation_id: str
-    operation_type: OperationType
-    source: str
-    destination: Optional[str]
-    start_time: datetime
-    end_time: Optional[datetime] = None
-    success: bool = False
-    error_message: Optional[str] = None
-    progress: float = 0.0
-    transferred_bytes: int = 0
-    total_bytes: int = 0
-    retry_count: int = 0
-    details: Dict[str, Any] = None
 
-class NetworkMonitor:
+    __slots__ = (
+        'operation_id', 'operation_type', 'source', 'destination', 'start_time', 'end_time',
+        'success', 'error_message', 'progress', 'transferred_bytes', 'total_bytes', 'retry_count',
+        'current_speed_mbps', 'elapsed_time', 'total_duration', 'average_speed_mbps'
+    )
+
+    def __init__(
+        self,
+        operation_id: str,
+        operation_type: OperationType,
+        source: str,
+        destination: Optional[str],
+        start_time: datetime,
+        total_bytes: int = 0
+    ):
+        self.operation_id = operation_id
+        self.operation_type = operation_type
+        self.source = source
+        self.destination = destination
+        self.start_time = start_time
+        self.end_time: Optional[datetime] = None
+        self.success = False
+        self.error_message: Optional[str] = None
+        self.progress = 0.0
+        self.transferred_bytes = 0
+        self.total_bytes = total_bytes
+        self.retry_count = 0
+        self.current_speed_mbps = 0.0
+        self.elapsed_time = 0.0
+        self.total_duration = 0.0
+        self.average_speed_mbps = 0.0
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        """속도/시간 정보 (조회할 때 생성)"""
+        details = {
+            "current_speed_mbps": self.current_speed_mbps,
+            "elapsed_time": self.elapsed_time
+        }
+        if self.end_time is not None:
+            details.update({
+                "total_duration": self.total_duration,
+                "average_speed_mbps": self.average_speed_mbps
+            })
+        return details
+
+class LogHistogram:
+    """
+    로그 간격 구간 히스토그램
+
+    값 추가는 O(1)이고, 분위수는 해당 값이 속한 구간의 상한으로 계산합니다
+    (구간 비율이 growth이므로 상대 오차는 growth - 1 이하).
+    """
+
+    __slots__ = ('base', 'growth', 'counts', 'total')
+
+    def __init__(self, base: float, max_value: float, growth: float = 2 ** 0.25):
+        self.base = base
+        self.growth = growth
+        self.counts = [0] * (math.ceil(math.log(max_value / base, growth)) + 1)
+        self.total = 0
+
+    def upper_bound(self, index: int) -> float:
+        return self.base * self.growth ** index
+
+    def add(self, value: float) -> None:
+        index = 0 if value <= self.base else math.ceil(math.log(value / self.base, self.growth))
+        self.counts[min(index, len(self.counts) - 1)] += 1
+        self.total += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.total:
+            return 0.0
+        rank = q * self.total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return self.upper_bound(index)
+        return self.upper_bound(len(self.counts) - 1)
+
+    def buckets(self) -> list:
+        """(구간 상한, 개수) 목록 (빈 구간 제외)"""
+        return [(round(self.upper_bound(index), 3), count) for index, count in enumerate(self.counts) if count]
+
+class OperationStatistics:
+    """완료된 작업 누적 통계 (작업 하나 반영은 O(1))"""
+
+    __slots__ = ('total_operations', 'successful_operations', 'total_bytes', 'total_duration',
+                 'duration_histogram', 'throughput_histogram')
+
     def __init__(self):
+        self.total_operations = 0
+        self.successful_operations = 0
+        self.total_bytes = 0
+        self.total_duration = 0.0
+        self.duration_histogram = LogHistogram(0.001, 86400.0)       # 초
+        self.throughput_histogram = LogHistogram(0.01, 10000.0)      # MB/s
+
+    def add(self, status: OperationStatus) -> None:
+        self.total_operations += 1
+        self.total_bytes += status.transferred_bytes
+        self.total_duration += status.total_duration
+        self.duration_histogram.add(status.total_duration)
+        if status.success:
+            self.successful_operations += 1
+            if status.transferred_bytes > 0 and status.total_duration > 0:
+                self.throughput_histogram.add(status.average_speed_mbps)
+
+    def to_dict(self) -> Dict[str, Any]:
+        total_operations = self.total_operations
+        return {
+            "total_operations": total_operations,
+            "successful_operations": self.successful_operations,
+            "failed_operations": total_operations - self.successful_operations,
+            "total_bytes": self.total_bytes,
+            "average_duration": self.total_duration / total_operations if total_operations > 0 else 0,
+            "p50_duration": self.duration_histogram.quantile(0.5),
+            "p95_duration": self.duration_histogram.quantile(0.95),
+            "throughput_histogram_mbps": self.throughput_histogram.buckets()
+        }
+
+class OperationHistoryWriter:
+    """
+    완료된 작업을 OPERATION_HISTORY 테이블에 모아서 기록 (write-behind)
+
+    작업 완료 시에는 큐에 넣기만 하고, 별도 스레드가 flush_interval마다 또는
+    batch_size개가 모이면 한 번에 저장합니다. 큐가 가득 차면 새 기록은 버립니다.
+    저장에는 생성 시 전달받은 작업 기록 모델(OperationHistory)을 사용합니다.
+    """
+
+    BATCH_SIZE = 200
+    MAX_PENDING = 10000
+    _STOP = object()
+
+    def __init__(self, history_model, flush_interval: float = 5.0,
+                 batch_size: int = BATCH_SIZE, max_pending: int = MAX_PENDING):
+        self.logger = setup_logger(__name__)
+        self.model = history_model
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="OperationHistoryWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, status: OperationStatus) -> None:
+        try:
+            self._queue.put_nowait(status)
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """남은 기록을 저장하고 스레드 종료"""
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                break
+            if item is not None:
+                batch.append(item)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+        self._flush(batch)
+
+    def _flush(self, batch: list) -> None:
+        if not batch:
+            return
+        try:
+            self.model.add_operations(batch)
+            self.model._commit()
+        except Exception as e:
+            self.model._rollback()
+            self.logger.error(f"작업 기록 저장 실패 ({len(batch)}건): {str(e)}")
+        finally:
+            # 기록 사이에는 커넥션을 풀에 돌려줌
+            self.model.db_connector.release()
+        if self.dropped:
+            self.logger.warning(f"작업 기록 대기열이 가득 차 {self.dropped}건을 저장하지 못했습니다")
+            self.dropped = 0
+
+class NetworkMonitor:
+    """
+    작업 진행/완료 모니터
+
+    핸들러와 서비스가 instance()로 같은 모니터를 공유합니다. 완료된 작업은 최근
+    HISTORY_SIZE개만 메모리에 보관하고, 통계는 완료 시점에 누적해 두므로 기록 수와
+    관계없이 일정한 시간에 조회됩니다.
+    """
+
+    HISTORY_SIZE = 1000
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        """프로세스 전역 인스턴스 반환"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
         self.logger = setup_logger(__name__)
         self.active_operations: Dict[str, OperationStatus] = {}
-        self.completed_operations: list[OperationStatus] = []
-        
+        self.completed_operations: deque[OperationStatus] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._history_writer: Optional[OperationHistoryWriter] = None
+
+        # 누적 통계 (전체, 작업 유형별)
+        self._statistics = OperationStatistics()
+        self._statistics_by_type: Dict[OperationType, OperationStatistics] = {}
+
+    def enable_persistence(self, history_model, flush_interval: float = 5.0) -> None:
+        """
+        완료된 작업을 데이터베이스에 모아서 기록
+
+        Args:
+            history_model: add_operations()를 제공하는 작업 기록 모델 (OperationHistory)
+        """
+        with self._lock:
+            if self._history_writer is None:
+                self._history_writer = OperationHistoryWriter(history_model, flush_interval)
+                self.logger.info("작업 기록 저장 시작")
+
+    def disable_persistence(self) -> None:
+        """남은 작업 기록을 저장하고 기록 중지 (데이터베이스 연결 종료 전에 호출)"""
+        with self._lock:
+            writer, self._history_writer = self._history_writer, None
+        if writer:
+            writer.stop()
+            self.logger.info("작업 기록 저장 중지")
+
     def start_operation(
         self,
         operation_type: OperationType,
@@ -46,25 +280,27 @@ class NetworkMonitor:
     ) -> OperationStatus:
         """
         새로운 작업 모니터링 시작
-        
+
         Args:
             operation_type: 작업 유형
             source: 원본 경로
             destination: 대상 경로
             total_bytes: 전체 바이트 수
         """
-        operation_id = f"{operation_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        now = datetime.now()
+        # 공유 모니터에서 같은 시각에 시작한 작업이 겹치지 않도록 일련번호 추가
+        operation_id = f"{operation_type.value}_{now.strftime('%Y%m%d_%H%M%S_%f')}_{next(self._sequence)}"
         status = OperationStatus(
             operation_id=operation_id,
             operation_type=operation_type,
             source=source,
             destination=destination,
-            start_time=datetime.now(),
-            total_bytes=total_bytes,
-            details={}
+            start_time=now,
+            total_bytes=total_bytes
         )
-        
-        self.active_operations[operation_id] = status
+
+        with self._lock:
+            self.active_operations[operation_id] = status
         self.logger.info(f"작업 시작: {operation_type.value} - {source}")
         return status
 
@@ -75,19 +311,17 @@ class NetworkMonitor:
         current_speed: float = 0.0
     ) -> None:
         """작업 진행률 업데이트"""
-        if operation_id not in self.active_operations:
-            return
-            
-        status = self.active_operations[operation_id]
-        status.transferred_bytes = transferred_bytes
-        
-        if status.total_bytes > 0:
-            status.progress = (transferred_bytes / status.total_bytes) * 100
-            
-        status.details.update({
-            "current_speed_mbps": current_speed / (1024 * 1024),
-            "elapsed_time": (datetime.now() - status.start_time).total_seconds()
-        })
+        now = datetime.now()
+        with self._lock:
+            status = self.active_operations.get(operation_id)
+            if status is None:
+                return
+
+            status.transferred_bytes = transferred_bytes
+            if status.total_bytes > 0:
+                status.progress = (transferred_bytes / status.total_bytes) * 100
+            status.current_speed_mbps = current_speed / (1024 * 1024)
+            status.elapsed_time = (now - status.start_time).total_seconds()
 
     def complete_operation(
         self,
@@ -96,24 +330,29 @@ class NetworkMonitor:
         error_message: Optional[str] = None
     ) -> None:
         """작업 완료 처리"""
-        if operation_id not in self.active_operations:
-            return
-            
-        status = self.active_operations[operation_id]
-        status.end_time = datetime.now()
-        status.success = success
-        status.error_message = error_message
-        
-        duration = (status.end_time - status.start_time).total_seconds()
-        status.details.update({
-            "total_duration": duration,
-            "average_speed_mbps": (status.transferred_bytes / duration) / (1024 * 1024)
-            if duration > 0 else 0
-        })
-        
-        self.completed_operations.append(status)
-        del self.active_operations[operation_id]
-        
+        with self._lock:
+            status = self.active_operations.pop(operation_id, None)
+            if status is None:
+                return
+
+            status.end_time = datetime.now()
+            status.success = success
+            status.error_message = error_message
+
+            duration = (status.end_time - status.start_time).total_seconds()
+            status.total_duration = duration
+            status.average_speed_mbps = (
+                (status.transferred_bytes / duration) / (1024 * 1024) if duration > 0 else 0
+            )
+
+            self.completed_operations.append(status)
+            self._statistics.add(status)
+            self._statistics_by_type.setdefault(status.operation_type, OperationStatistics()).add(status)
+            writer = self._history_writer
+
+        if writer:
+            writer.submit(status)
+
         log_message = (
             f"작업 완료: {status.operation_type.value}\n"
             f"결과: {'성공' if success else '실패'}\n"
@@ -121,12 +360,20 @@ class NetworkMonitor:
         )
         if error_message:
             log_message += f"\n오류: {error_message}"
-            
+
         if success:
             self.logger.info(log_message)
         else:
             self.logger.error(log_message)
 
+    def get_active_operations(self, operation_type: Optional[OperationType] = None) -> list:
+        """진행 중인 작업 목록 (시작 순서, operation_type이 있으면 해당 유형만)"""
+        with self._lock:
+            operations = list(self.active_operations.values())
+        if operation_type is not None:
+            operations = [operation for operation in operations if operation.operation_type == operation_type]
+        return operations
+
     def check_system_health(self) -> Dict[str, Any]:
         """시스템 상태 확인"""
         try:
@@ -141,18 +388,17 @@ class NetworkMonitor:
             self.logger.error(f"시스템 상태 확인 실패: {str(e)}")
             return {}
 
-    def get_operation_statistics(self) -> Dict[str, Any]:
-        """작업 통계 정보 반환"""
-        total_operations = len(self.completed_operations)
-        successful_operations = sum(1 for op in self.completed_operations if op.success)
-        
-        return {
-            "total_operations": total_operations,
-            "successful_operations": successful_operations,
-            "failed_operations": total_operations - successful_operations,
-            "active_operations": len(self.active_operations),
-            "average_duration": sum(
-                (op.end_time - op.start_time).total_seconds()
-                for op in self.completed_operations
-            ) / total_operations if total_operations > 0 else 0
-        }
\ No newline at end of file
+    def get_operation_statistics(self, operation_type: Optional[OperationType] = None) -> Dict[str, Any]:
+        """
+        작업 통계 정보 반환 (세션 전체 누적값, operation_type이 있으면 해당 유형만)
+
+        소요 시간 분위수와 처리량 히스토그램은 로그 간격 구간 기준의 근사값입니다.
+        """
+        with self._lock:
+            if operation_type is None:
+                statistics = self._statistics
+            else:
+                statistics = self._statistics_by_type.get(operation_type) or OperationStatistics()
+            result = statistics.to_dict()
+            result["active_operations"] = len(self.active_operations)
+            return result
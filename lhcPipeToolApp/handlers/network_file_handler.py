@@ -1,17 +1,18 @@
 """네트워크 파일 작업 핸들러"""
+import errno
 import shutil
 from pathlib import Path
 from .network_path_handler import NetworkPathHandler
 from .retry_handler import retry_handler
+from ..utils.directory_cache import known_directories
 from ..utils.logger import setup_logger
-import os
 
 class NetworkFileHandler:
     def __init__(self):
         self.logger = setup_logger(__name__)
         self.network_handler = NetworkPathHandler()
 
-    @retry_handler.retry_on_network_error()
+    @retry_handler.retry_on_network_error(host_arg="destination")
     def copy_to_network(self, source: str, destination: str) -> bool:
         """
         파일을 네트워크 경로로 복사
@@ -35,7 +36,13 @@ class NetworkFileHandler:
                 raise ValueError(f"대상 디렉토리 생성 실패: {dest_dir}")
             
             # 파일 복사
-            shutil.copy2(source, actual_dest)
+            try:
+                shutil.copy2(source, actual_dest)
+            except OSError as e:
+                # 대상 디렉토리가 사라졌으면 다음 시도에서 다시 생성
+                if e.errno == errno.ENOENT:
+                    known_directories.discard(dest_dir)
+                raise
             self.logger.info(f"파일 복사 성공: {source} -> {actual_dest}")
             
             return True
@@ -44,7 +51,7 @@ class NetworkFileHandler:
             self.logger.error(f"파일 복사 실패: {str(e)}")
             raise
 
-    @retry_handler.retry_on_network_error()
+    @retry_handler.retry_on_network_error(host_arg="path")
     def ensure_network_directory(self, path: str) -> bool:
         """
         네트워크 경로에 디렉토리가 있는지 확인하고 없으면 생성
@@ -56,28 +63,19 @@ class NetworkFileHandler:
             bool: 디렉토리 생성 성공 여부
         """
         try:
+            # 이번 세션에서 이미 확인한 디렉토리
+            if known_directories.contains(path):
+                return True
+
             # 네트워크 접근 확인 및 경로 변환
             success, actual_path = self.network_handler.ensure_network_access(path)
             if not success:
                 raise PermissionError(f"네트워크 접근 실패: {actual_path}")
 
-            # 상위 디렉토리들을 순차적으로 생성
-            current_path = actual_path
-            paths_to_create = []
-            
-            while current_path and not os.path.exists(current_path):
-                paths_to_create.append(current_path)
-                current_path = str(Path(current_path).parent)
-            
-            # 역순으로 디렉토리 생성
-            for dir_path in reversed(paths_to_create):
-                try:
-                    Path(dir_path).mkdir(parents=True, exist_ok=True)
-                    self.logger.info(f"디렉토리 생성 완료: {dir_path}")
-                except Exception as e:
-                    self.logger.error(f"디렉토리 생성 실패: {dir_path} - {str(e)}")
-                    return False
-            
+            # 없는 상위 디렉토리부터 생성
+            if not known_directories.ensure(actual_path):
+                return False
+            known_directories.add(path)
             return True
             
         except Exception as e:
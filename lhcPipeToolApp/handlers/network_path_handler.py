@@ -2,11 +2,81 @@
 import os
 import string
 import subprocess
+import threading
+import time
 import urllib.parse
 from pathlib import Path
 from typing import Optional, Tuple, Dict
 from ..utils.logger import setup_logger
 
+class DriveMappingCache:
+    """
+    드라이브 매핑 조회 결과 캐시 (TTL)
+
+    net use 호출은 하위 프로세스를 띄우므로, 공유 폴더(\\\\server\\share)별 매핑 드라이브와
+    net use 목록을 일정 시간 재사용합니다. 같은 키를 동시에 조회하면 먼저 시작한 조회 하나만
+    실행되고 나머지는 그 결과를 기다립니다. 실패한 조회는 캐시하지 않습니다.
+    """
+
+    DEFAULT_TTL = 300.0
+    MAPPINGS_KEY = 'net use'
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries = {}      # key -> (만료 시각, 값)
+        self._key_locks = {}    # key -> 조회 중 잠금
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """캐시된 값 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def resolve(self, key, loader):
+        """
+        캐시된 값을 반환하고, 없으면 loader()로 조회해 저장
+
+        Args:
+            key: 캐시 키
+            loader: 값을 조회하는 함수 (실패 시 None 반환 또는 예외)
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # 기다리는 동안 다른 스레드가 조회를 마쳤으면 그 결과 사용
+            value = self.get(key)
+            if value is None:
+                value = loader()
+                if value is not None:
+                    self.set(key, value)
+            return value
+
+    def invalidate(self, key=None):
+        """캐시 무효화 (key가 없으면 전체)"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+# 모든 NetworkPathHandler 인스턴스가 함께 사용하는 전역 캐시
+drive_mapping_cache = DriveMappingCache()
+
 class NetworkPathHandler:
     def __init__(self):
         self.logger = setup_logger(__name__)
@@ -30,7 +100,12 @@ class NetworkPathHandler:
             return None
 
     def get_drive_mappings(self) -> Dict[str, str]:
-        """현재 시스템의 네트워크 드라이브 매핑 정보 가져오기"""
+        """현재 시스템의 네트워크 드라이브 매핑 정보 가져오기 (TTL 동안 캐시)"""
+        mappings = drive_mapping_cache.resolve(DriveMappingCache.MAPPINGS_KEY, self._query_drive_mappings)
+        return dict(mappings) if mappings is not None else {}
+
+    def _query_drive_mappings(self) -> Optional[Dict[str, str]]:
+        """net use 출력에서 드라이브 매핑 정보 조회 (실패 시 None)"""
         try:
             mappings = {}
             result = subprocess.run(['net', 'use'], capture_output=True, text=True)
@@ -46,7 +121,7 @@ class NetworkPathHandler:
             
         except Exception as e:
             self.logger.error(f"드라이브 매핑 정보 가져오기 실패: {str(e)}")
-            return {}
+            return None
 
     def map_network_drive(self, unc_path: str) -> Tuple[bool, str]:
         """
@@ -68,46 +143,70 @@ class NetworkPathHandler:
             share = path_parts[1]
             # UNC 경로 형식으로 변환 (백슬래시 사용)
             share_path = f"\\\\{server}\\{share}"
-            
-            # 현재 매핑된 드라이브 확인
-            current_mappings = self.get_drive_mappings()
-            
-            # 이미 매핑된 드라이브가 있는지 확인
-            for drive, mapped_path in current_mappings.items():
-                if mapped_path.lower() == share_path.lower():
-                    self.logger.debug(f"이미 매핑된 드라이브 사용: {drive} -> {mapped_path}")
-                    # 매핑 성공 시, 전체 경로 반환
-                    remaining_path = '/'.join(path_parts[2:]) if len(path_parts) > 2 else ''
-                    full_path = f"{drive}/{remaining_path}" if remaining_path else drive
-                    return True, full_path
-            
-            # 매핑된 드라이브가 없으면 새로 매핑
-            drive_letter = self.find_available_drive()
-            if not drive_letter:
-                raise RuntimeError("사용 가능한 드라이브 문자가 없습니다")
 
-            # 공유 폴더까지만 매핑 (올바른 net use 구문)
-            command = ['net', 'use', f"{drive_letter}:", share_path]
-            
-            self.logger.debug(f"새로운 드라이브 매핑 시도: {command}")
-            subprocess.run(command, check=True, capture_output=True, text=True)
-            
+            # 공유 폴더별 매핑 드라이브 (캐시 또는 net use 조회)
+            drive = drive_mapping_cache.resolve(share_path.lower(), lambda: self._resolve_share_drive(share_path))
+
             # 매핑 성공 시, 전체 경로 반환
             remaining_path = '/'.join(path_parts[2:]) if len(path_parts) > 2 else ''
-            full_path = f"{drive_letter}:/{remaining_path}" if remaining_path else f"{drive_letter}:"
-            
+            full_path = f"{drive}/{remaining_path}" if remaining_path else drive
             return True, full_path
-            
+
         except subprocess.CalledProcessError as e:
             error_msg = f"드라이브 매핑 실패: {e.stderr.strip()}"
             self.logger.error(error_msg)
+            self.invalidate_mapping(unc_path)
             return False, error_msg
             
         except Exception as e:
             error_msg = f"드라이브 매핑 실패: {str(e)}"
             self.logger.error(error_msg)
+            self.invalidate_mapping(unc_path)
             return False, error_msg
 
+    def _resolve_share_drive(self, share_path: str) -> str:
+        """
+        공유 폴더가 매핑된 드라이브 (없으면 새로 매핑)
+
+        Returns:
+            str: 드라이브 (예: "Z:")
+        """
+        # 이미 매핑된 드라이브가 있는지 확인
+        for drive, mapped_path in self.get_drive_mappings().items():
+            if mapped_path.lower() == share_path.lower():
+                self.logger.debug(f"이미 매핑된 드라이브 사용: {drive} -> {mapped_path}")
+                return drive
+
+        # 매핑된 드라이브가 없으면 새로 매핑
+        drive_letter = self.find_available_drive()
+        if not drive_letter:
+            raise RuntimeError("사용 가능한 드라이브 문자가 없습니다")
+
+        # 공유 폴더까지만 매핑 (올바른 net use 구문)
+        command = ['net', 'use', drive_letter, share_path]
+
+        self.logger.debug(f"새로운 드라이브 매핑 시도: {command}")
+        subprocess.run(command, check=True, capture_output=True, text=True)
+
+        # 매핑 목록이 바뀌었으므로 net use 목록 캐시 갱신
+        drive_mapping_cache.invalidate(DriveMappingCache.MAPPINGS_KEY)
+        return drive_letter
+
+    def invalidate_mapping(self, unc_path: Optional[str] = None):
+        """
+        드라이브 매핑 캐시 무효화
+
+        Args:
+            unc_path: 무효화할 UNC 경로 (//server/share/...) - 없으면 전체
+        """
+        if unc_path is None:
+            drive_mapping_cache.invalidate()
+            return
+        path_parts = unc_path.replace('\\', '/').strip('/').split('/')
+        if len(path_parts) >= 2:
+            drive_mapping_cache.invalidate(f"\\\\{path_parts[0]}\\{path_parts[1]}".lower())
+        drive_mapping_cache.invalidate(DriveMappingCache.MAPPINGS_KEY)
+
     def ensure_network_access(self, path: str) -> Tuple[bool, str]:
         """네트워크 경로 접근 보장"""
         try:
@@ -130,7 +229,12 @@ class NetworkPathHandler:
                 drive_path = path.replace(server_share, f"{result}")
                 if os.path.exists(drive_path):
                     return True, drive_path
-                    
+
+                # 캐시된 드라이브가 끊어졌으면 다음 호출에서 다시 매핑
+                drive_root = result.split('/')[0]
+                if not os.path.exists(f"{drive_root}/"):
+                    self.invalidate_mapping(server_share)
+
             return False, f"네트워크 경로 접근 실패: {result}"
 
         except Exception as e:
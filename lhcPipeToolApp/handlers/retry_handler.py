@@ -1,9 +1,293 @@
 """재시도 메커니즘 핸들러"""
+import asyncio
+import inspect
+import os
+import random
+import threading
 import time
 from functools import wraps
-from typing import Callable, Any, Type, Union, Tuple
+from typing import Callable, Any, Dict, Optional, Type, Union, Tuple
 from ..utils.logger import setup_logger
 
+# 재시도할 네트워크 오류 유형
+NETWORK_ERRORS = (
+    FileNotFoundError,
+    PermissionError,
+    TimeoutError,
+    ConnectionError
+)
+
+# 서버 장애로 보고 서킷 브레이커에 실패로 기록할 오류 유형
+# (파일 없음/권한 오류는 서버가 응답한 것이므로 제외)
+SERVER_ERRORS = (
+    TimeoutError,
+    ConnectionError
+)
+
+class CircuitOpenError(ConnectionError):
+    """서킷 브레이커가 열려 있어 호출하지 않고 바로 실패하는 경우"""
+
+class CircuitBreaker:
+    """
+    호스트별 서킷 브레이커
+
+    연속 실패가 failure_threshold에 도달하면 열림(open) 상태가 되어 reset_timeout 동안
+    호출을 바로 실패시킵니다. 시간이 지나면 반열림(half-open) 상태에서 한 번만 시험 호출을
+    허용하고, 성공하면 닫히고 실패하면 다시 열립니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (반열림 상태에서는 시험 호출 하나만 허용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_running = False
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def release(self) -> None:
+        """서버 상태와 무관한 오류로 끝난 시험 호출 반납"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+class RetryBudget:
+    """
+    재시도 예산 (토큰 버킷)
+
+    호출마다 ratio만큼 토큰이 쌓이고 재시도마다 1개를 사용합니다.
+    서버 장애로 모든 호출이 실패할 때 재시도가 전체 요청의 ratio 비율을 넘지 않도록 제한합니다.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self.tokens < 1.0:
+                return False
+            self.tokens -= 1.0
+            return True
+
+class RetryPolicy:
+    """
+    동기/비동기 공용 재시도 정책
+
+    대기 시간은 full jitter 지수 백오프(0 ~ min(max_delay, base_delay * backoff^시도))로 정하고,
+    비동기 함수는 asyncio.sleep으로 대기하므로 이벤트 루프를 막지 않습니다.
+    재시도 예산과 호스트별 서킷 브레이커를 인스턴스 안에 두므로 여러 핸들러가 같은 정책을
+    공유하면 응답 없는 파일 서버에 대한 작업은 대기열 전체가 함께 빠르게 실패합니다.
+
+    Example:
+        @network_retry_policy.decorator(host_arg="destination")
+        async def copy(self, source, destination): ...
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        backoff: float = 2.0,
+        exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = NETWORK_ERRORS,
+        budget: Optional[RetryBudget] = None,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ):
+        self.logger = setup_logger(__name__)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.exceptions = exceptions
+        self.budget = budget or RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(path: Optional[str]) -> Optional[str]:
+        """경로의 서버 식별자 (UNC 서버 이름 또는 드라이브 문자)"""
+        if not path:
+            return None
+        path = str(path)
+        if path[:2] in ('\\\\', '//'):
+            return path[2:].replace('/', '\\').split('\\')[0].lower()
+        drive = os.path.splitdrive(path)[0]
+        return drive.lower() if drive else "local"
+
+    def get_breaker(self, host: Optional[str]) -> Optional[CircuitBreaker]:
+        """호스트별 서킷 브레이커 반환 (호스트가 없으면 None)"""
+        if not host:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def compute_delay(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (self.backoff ** attempt)))
+
+    def _before_attempt(self, name: str, breaker: Optional[CircuitBreaker], host: Optional[str]) -> None:
+        if breaker and not breaker.allow():
+            raise CircuitOpenError(f"서버 응답 없음으로 작업 중단 (host: {host}, 함수: {name})")
+
+    def _after_failure(self, name: str, attempt: int, error: Exception,
+                       breaker: Optional[CircuitBreaker]) -> Optional[float]:
+        """실패 처리 후 재시도 대기 시간 반환 (재시도하지 않으면 None)"""
+        if breaker:
+            if isinstance(error, SERVER_ERRORS):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+        retry_count = attempt + 1
+        if retry_count >= self.max_attempts:
+            self.logger.error(
+                f"최대 재시도 횟수 도달 ({self.max_attempts}회) - "
+                f"함수: {name}, 마지막 오류: {str(error)}"
+            )
+            return None
+        if not self.budget.withdraw():
+            self.logger.error(f"재시도 예산 소진으로 재시도 중단 - 함수: {name}, 오류: {str(error)}")
+            return None
+
+        delay = self.compute_delay(attempt)
+        self.logger.warning(
+            f"작업 실패 (시도 {retry_count}/{self.max_attempts}) - "
+            f"함수: {name}, 오류: {str(error)}, 다음 시도까지 대기 시간: {delay:.2f}초"
+        )
+        return delay
+
+    def call(self, func: Callable, *args, host: Optional[str] = None, **kwargs) -> Any:
+        """동기 함수를 정책에 따라 실행"""
+        breaker = self.get_breaker(host)
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            self._before_attempt(func.__name__, breaker, host)
+            try:
+                result = func(*args, **kwargs)
+            except CircuitOpenError:
+                raise
+            except self.exceptions as e:
+                delay = self._after_failure(func.__name__, attempt, e, breaker)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                if breaker:
+                    breaker.release()
+                raise
+            if breaker:
+                breaker.record_success()
+            return result
+
+    async def call_async(self, func: Callable, *args, host: Optional[str] = None, **kwargs) -> Any:
+        """코루틴 함수를 정책에 따라 실행 (대기 중에도 이벤트 루프를 막지 않음)"""
+        breaker = self.get_breaker(host)
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            self._before_attempt(func.__name__, breaker, host)
+            try:
+                result = await func(*args, **kwargs)
+            except CircuitOpenError:
+                raise
+            except self.exceptions as e:
+                delay = self._after_failure(func.__name__, attempt, e, breaker)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            except BaseException:
+                if breaker:
+                    breaker.release()
+                raise
+            if breaker:
+                breaker.record_success()
+            return result
+
+    def decorator(self, host_arg: Optional[str] = None) -> Callable:
+        """
+        재시도 데코레이터 (동기/비동기 함수 모두 지원)
+
+        Args:
+            host_arg: 서킷 브레이커 호스트를 정할 경로 인자 이름 (없으면 서킷 브레이커 미사용)
+        """
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+
+            def resolve_host(args, kwargs) -> Optional[str]:
+                if not host_arg:
+                    return None
+                bound = signature.bind_partial(*args, **kwargs)
+                return self.host_key(bound.arguments.get(host_arg))
+
+            if inspect.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs) -> Any:
+                    return await self.call_async(func, *args, host=resolve_host(args, kwargs), **kwargs)
+                return async_wrapper
+
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> Any:
+                return self.call(func, *args, host=resolve_host(args, kwargs), **kwargs)
+            return wrapper
+        return decorator
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """서킷 브레이커 상태와 남은 재시도 예산 반환"""
+        with self._lock:
+            breakers = {
+                host: {"state": breaker.state, "failures": breaker.failures}
+                for host, breaker in self._breakers.items()
+            }
+        return {"retry_tokens": round(self.budget.tokens, 2), "breakers": breakers}
+
 class RetryHandler:
     def __init__(self):
         self.logger = setup_logger(__name__)
@@ -13,68 +297,41 @@ class RetryHandler:
         retries: int = 3,
         delay: float = 1.0,
         backoff: float = 2.0,
-        exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = (
-            FileNotFoundError,
-            PermissionError,
-            TimeoutError,
-            ConnectionError
-        )
+        exceptions: Union[Type[Exception], Tuple[Type[Exception], ...]] = NETWORK_ERRORS,
+        host_arg: Optional[str] = None
     ) -> Callable:
         """
-        네트워크 작업 실패 시 재시도하는 데코레이터
-        
+        네트워크 작업 실패 시 재시도하는 데코레이터 (동기/비동기 함수 모두 지원)
+
         Args:
-            retries (int): 최대 재시도 횟수
-            delay (float): 초기 대기 시간(초)
+            retries (int): 최대 시도 횟수
+            delay (float): 초기 최대 대기 시간(초), 실제 대기 시간은 0~해당 값에서 무작위
             backoff (float): 대기 시간 증가 배율
             exceptions (Exception | tuple): 재시도할 예외 유형
-            
+            host_arg (str): 서킷 브레이커 호스트를 정할 경로 인자 이름
+
         Returns:
             Callable: 데코레이터 함수
-            
+
         Example:
             @retry_handler.retry_on_network_error(retries=3, delay=1.0)
             def copy_file(self, source: str, destination: str):
                 # 파일 복사 로직
         """
-        def decorator(func: Callable) -> Callable:
-            @wraps(func)
-            def wrapper(*args, **kwargs) -> Any:
-                last_exception = None
-                current_delay = delay
-                
-                for attempt in range(retries):
-                    try:
-                        return func(*args, **kwargs)
-                    
-                    except exceptions as e:
-                        last_exception = e
-                        retry_count = attempt + 1
-                        
-                        if retry_count == retries:
-                            self.logger.error(
-                                f"최대 재시도 횟수 도달 ({retries}회) - "
-                                f"함수: {func.__name__}, "
-                                f"마지막 오류: {str(e)}"
-                            )
-                            raise last_exception
-                        
-                        self.logger.warning(
-                            f"작업 실패 (시도 {retry_count}/{retries}) - "
-                            f"함수: {func.__name__}, "
-                            f"오류: {str(e)}, "
-                            f"다음 시도까지 대기 시간: {current_delay}초"
-                        )
-                        
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                
-                if last_exception:
-                    raise last_exception
-                    
-            return wrapper
-        return decorator
+        if (retries, delay, backoff, exceptions) == (3, 1.0, 2.0, NETWORK_ERRORS):
+            # 기본 설정은 공유 정책을 사용하여 재시도 예산과 서킷 브레이커를 함께 적용
+            return network_retry_policy.decorator(host_arg)
+        policy = RetryPolicy(
+            max_attempts=retries,
+            base_delay=delay,
+            backoff=backoff,
+            exceptions=exceptions
+        )
+        return policy.decorator(host_arg)
+
 
+# 핸들러들이 함께 사용하는 네트워크 재시도 정책
+network_retry_policy = RetryPolicy()
 
 # 사용 편의를 위한 전역 인스턴스
-retry_handler = RetryHandler()
\ No newline at end of file
+retry_handler = RetryHandler()
@@ -1,14 +1,18 @@
 import sys
+import multiprocessing
 from PySide6.QtWidgets import QApplication, QDialog
 from .config.db_config import DBConfig
 from .database.db_connector import DBConnector
+from .handlers.monitoring_handler import NetworkMonitor
 from .services.worker_service import WorkerService
 from .ui.main_window import MainWindow
 from .utils.logger import setup_logger
 from .ui.login_dialog import LoginDialog
 from .models.worker import Worker
+from .models.operation_history import OperationHistory
 from .config.app_state import AppState
 from .utils.db_migration import run_migrations
+from .utils.icon_cache import IconCache
 
 def initialize_database():
     """데이터베이스 초기화"""
@@ -23,6 +27,9 @@ def initialize_database():
 def main():
     app = QApplication(sys.argv)
     
+    # 화면 DPI 변경 시 아이콘 캐시 무효화
+    IconCache.install_dpi_hook(app)
+    
     # 로거 초기화
     logger = setup_logger(__name__)
     
@@ -33,6 +40,14 @@ def main():
     
     # 데이터베이스 마이그레이션 실행
     run_migrations(db_connector)
+
+    # 완료된 작업 기록 저장 (데이터베이스 연결 종료 전에 남은 기록 저장)
+    monitor = NetworkMonitor.instance()
+    if db_connector.config.operation_history_enabled:
+        monitor.enable_persistence(
+            OperationHistory(db_connector), db_connector.config.operation_history_flush_interval
+        )
+        app.aboutToQuit.connect(monitor.disable_persistence)
     
     # 로그인 처리
     worker_model = Worker(db_connector)
@@ -57,4 +72,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # 프리뷰 프로세스 풀이 패키징된 실행 파일에서도 동작하도록 설정
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -1,22 +1,21 @@
 """기본 모델 클래스"""
-from ..utils.logger import setup_logger
+from ..utils.logger import setup_logger, sql_log_sampled, SQL_LOGGER_NAME
 
 class BaseModel:
     def __init__(self, db_connector):
         self.db_connector = db_connector
         self.logger = setup_logger(__name__)
+        self.sql_logger = setup_logger(SQL_LOGGER_NAME)
+
+    def _log_query(self, message, query, params=None):
+        """쿼리 로깅 (SQL 로그를 켠 경우 샘플링된 쿼리만)"""
+        if sql_log_sampled():
+            self.sql_logger.debug(f"{message}:\n{query}\n파라미터: {params}")
 
     def _execute(self, query, params=None):
         """모델 레벨의 쿼리 실행"""
         try:
-            # 쿼리 로깅
-            formatted_query = query
-            if params:
-                try:
-                    formatted_query = query % params
-                except:
-                    formatted_query = f"Query: {query}, Params: {params}"
-            self.logger.info(f"실행할 쿼리:\n{formatted_query}")
+            self._log_query("실행할 쿼리", query, params)
 
             # DBConnector를 통한 쿼리 실행
             cursor = self.db_connector.execute(query, params)
@@ -25,11 +24,20 @@ class BaseModel:
             self.logger.error(f"쿼리 실행 실패: {str(e)}", exc_info=True)
             raise
 
+    def _execute_many(self, query, params_list):
+        """모델 레벨의 일괄 쿼리 실행"""
+        try:
+            self._log_query(f"실행할 일괄 쿼리 ({len(params_list)}건)", query)
+            return self.db_connector.execute_many(query, params_list)
+        except Exception as e:
+            self.logger.error(f"일괄 쿼리 실행 실패: {str(e)}", exc_info=True)
+            raise
+
     def _fetch_one(self, query, params=None):
         """단일 결과 조회"""
         try:
+            self._log_query("조회 쿼리", query, params)
             result = self.db_connector.fetch_one(query, params)
-            self.logger.info("쿼리 실행 성공")
             return result
         except Exception as e:
             self.logger.error(f"데이터 조회 오류: {e}", exc_info=True)
@@ -38,8 +46,8 @@ class BaseModel:
     def _fetch_all(self, query, params=None):
         """모든 결과 조회"""
         try:
+            self._log_query("조회 쿼리", query, params)
             results = self.db_connector.fetch_all(query, params)
-            self.logger.info("쿼리 실행 성공")
             return results
         except Exception as e:
             self.logger.error(f"데이터 조회 오류: {e}", exc_info=True)
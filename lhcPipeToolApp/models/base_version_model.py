@@ -49,6 +49,18 @@ class BaseVersionModel(BaseModel):
         """
         return self._execute(query, (item_id,))
 
+    def _promote_latest_version(self, item_id):
+        """남은 버전 중 가장 높은 버전 번호를 최신 버전으로 지정"""
+        query = f"""
+            UPDATE {self.table_name}
+            SET is_latest = TRUE
+            WHERE {self.get_foreign_key()} = ? AND version_number = (
+                SELECT MAX(version_number) FROM {self.table_name}
+                WHERE {self.get_foreign_key()} = ?
+            )
+        """
+        return self._execute(query, (item_id, item_id))
+
     def get_latest_version(self, item_id):
         """최신 버전 조회"""
         query = f"""
@@ -79,16 +91,29 @@ class BaseVersionModel(BaseModel):
         """
         return self._execute(query, (status, version_id))
     
+    def update_preview_path(self, version_id, preview_path):
+        """프리뷰 경로 업데이트"""
+        query = f"""
+            UPDATE {self.table_name}
+            SET preview_path = ?
+            WHERE id = ?
+        """
+        return self._execute(query, (preview_path, version_id))
+
     def get_by_id(self, version_id):
         """ID로 버전 조회"""
         query = f"SELECT * FROM {self.table_name} WHERE id = ?"
         return self._fetch_one(query, (version_id,))
 
     def delete(self, version_id):
-        """버전 삭제"""
+        """버전 삭제 (최신 버전을 삭제하면 남은 버전 중 가장 높은 번호를 최신으로 지정)"""
         try:
+            version = self.get_by_id(version_id)
             query = f"DELETE FROM {self.table_name} WHERE id = ?"
-            return self._execute(query, (version_id,))
+            cursor = self._execute(query, (version_id,))
+            if version and version.get('is_latest'):
+                self._promote_latest_version(version[self.get_foreign_key()])
+            return cursor
         except Exception as e:
             self.logger.error(f"버전 삭제 중 오류 발생: {str(e)}", exc_info=True)
             return False
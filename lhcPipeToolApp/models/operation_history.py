@@ -0,0 +1,45 @@
+"""작업 기록 모델"""
+from .base_model import BaseModel
+
+class OperationHistory(BaseModel):
+    # 컬럼 길이 (초과분은 잘라서 저장)
+    PATH_LENGTH = 500
+    ERROR_LENGTH = 1000
+
+    def __init__(self, db_connector):
+        super().__init__(db_connector)
+        self.table_name = 'OPERATION_HISTORY'
+
+    def add_operations(self, operations):
+        """
+        완료된 작업 일괄 추가 (커밋은 호출하는 쪽에서 처리)
+
+        Args:
+            operations: OperationStatus 목록
+        """
+        if not operations:
+            return 0
+        query = f"""
+            INSERT INTO {self.table_name}
+                (operation_id, operation_type, source_path, destination_path, start_time, end_time,
+                 success, error_message, transferred_bytes, total_bytes, duration, average_speed_mbps)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        self._execute_many(query, [
+            (
+                operation.operation_id,
+                operation.operation_type.value,
+                (operation.source or '')[:self.PATH_LENGTH],
+                operation.destination[:self.PATH_LENGTH] if operation.destination else None,
+                operation.start_time,
+                operation.end_time,
+                operation.success,
+                operation.error_message[:self.ERROR_LENGTH] if operation.error_message else None,
+                operation.transferred_bytes,
+                operation.total_bytes,
+                operation.total_duration,
+                operation.average_speed_mbps
+            )
+            for operation in operations
+        ])
+        return len(operations)
@@ -31,29 +31,17 @@ class Project(BaseModel):
         LatestProjectVersion AS (
             SELECT pv.project_id, pv.preview_path
             FROM project_versions pv
-            WHERE pv.version_number = (
-                SELECT MAX(version_number)
-                FROM project_versions
-                WHERE project_id = pv.project_id
-            )
+            WHERE pv.is_latest = TRUE
         ),
         LatestSequenceVersion AS (
             SELECT sv.sequence_id, sv.preview_path
             FROM sequence_versions sv
-            WHERE sv.version_number = (
-                SELECT MAX(version_number)
-                FROM sequence_versions
-                WHERE sequence_id = sv.sequence_id
-            )
+            WHERE sv.is_latest = TRUE
         ),
         LatestShotVersion AS (
             SELECT shv.shot_id, shv.preview_path
             FROM versions shv
-            WHERE shv.version_number = (
-                SELECT MAX(version_number)
-                FROM versions
-                WHERE shot_id = shv.shot_id
-            )
+            WHERE shv.is_latest = TRUE
         )
         SELECT
             p.id AS project_id,
@@ -75,6 +63,52 @@ class Project(BaseModel):
         """
         return self._fetch_all(query)
 
+    def get_project_nodes(self):
+        """트리 표시용 프로젝트 목록 조회 (최신 프리뷰, 시퀀스 수 포함)"""
+        query = """
+        SELECT
+            p.id,
+            p.name,
+            (SELECT FIRST 1 pv.preview_path
+             FROM project_versions pv
+             WHERE pv.project_id = p.id AND pv.is_latest = TRUE) AS preview_path,
+            (SELECT COUNT(*) FROM sequences s WHERE s.project_id = p.id) AS child_count
+        FROM projects p
+        ORDER BY p.name
+        """
+        return self._fetch_all(query)
+
+    def get_sequence_nodes(self, project_id):
+        """트리 표시용 프로젝트별 시퀀스 목록 조회 (최신 프리뷰, 샷 수 포함)"""
+        query = """
+        SELECT
+            s.id,
+            s.name,
+            (SELECT FIRST 1 sv.preview_path
+             FROM sequence_versions sv
+             WHERE sv.sequence_id = s.id AND sv.is_latest = TRUE) AS preview_path,
+            (SELECT COUNT(*) FROM shots sh WHERE sh.sequence_id = s.id) AS child_count
+        FROM sequences s
+        WHERE s.project_id = ?
+        ORDER BY s.name
+        """
+        return self._fetch_all(query, (project_id,))
+
+    def get_shot_nodes(self, sequence_id):
+        """트리 표시용 시퀀스별 샷 목록 조회 (최신 프리뷰 포함)"""
+        query = """
+        SELECT
+            sh.id,
+            sh.name,
+            (SELECT FIRST 1 v.preview_path
+             FROM versions v
+             WHERE v.shot_id = sh.id AND v.is_latest = TRUE) AS preview_path
+        FROM shots sh
+        WHERE sh.sequence_id = ?
+        ORDER BY sh.name
+        """
+        return self._fetch_all(query, (sequence_id,))
+
     @require_admin
     def create(self, name, path=None, description=None):
         """프로젝트 생성"""
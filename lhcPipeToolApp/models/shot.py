@@ -29,6 +29,17 @@ class Shot(BaseModel):
         query = f"SELECT * FROM {self.table_name} WHERE sequence_id = ? ORDER BY name"
         return self._fetch_all(query, (sequence_id,))
     
+    def get_by_project(self, project_id):
+        """프로젝트별 샷 조회 (모든 시퀀스의 샷을 한 번에 조회)"""
+        query = f"""
+            SELECT sh.*
+            FROM {self.table_name} sh
+            JOIN sequences s ON s.id = sh.sequence_id
+            WHERE s.project_id = ?
+            ORDER BY sh.sequence_id, sh.name
+        """
+        return self._fetch_all(query, (project_id,))
+
     @require_admin
     def create(self, name, sequence_id, status="pending", description=None):
         """샷 생성"""
@@ -0,0 +1,144 @@
+"""버전 파일 목록 모델"""
+from .base_model import BaseModel
+
+class VersionFile(BaseModel):
+    def __init__(self, db_connector):
+        super().__init__(db_connector)
+        self.table_name = 'VERSION_FILES'
+
+    def add_files(self, item_type, version_id, files):
+        """
+        버전 파일 목록 일괄 추가 (커밋은 호출하는 쪽에서 처리)
+
+        Args:
+            item_type: 'project', 'sequence', 'shot' 중 하나
+            version_id: 버전 ID
+            files: file_path, file_size 키와 선택적으로 source_path, source_mtime,
+                   content_hash, frame_number, sequence_key 키를 가진 dict 목록
+        """
+        if not files:
+            return 0
+        query = f"""
+            INSERT INTO {self.table_name}
+                (item_type, version_id, file_path, source_path, file_size, source_mtime, content_hash,
+                 frame_number, sequence_key)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        self._execute_many(query, [
+            (
+                item_type,
+                version_id,
+                file['file_path'],
+                file.get('source_path'),
+                file['file_size'],
+                file.get('source_mtime'),
+                file.get('content_hash'),
+                file.get('frame_number'),
+                file.get('sequence_key')
+            )
+            for file in files
+        ])
+        return len(files)
+
+    def get_by_version(self, item_type, version_id):
+        """버전의 파일 목록 조회"""
+        query = f"""
+            SELECT * FROM {self.table_name}
+            WHERE item_type = ? AND version_id = ?
+            ORDER BY file_path
+        """
+        return self._fetch_all(query, (item_type, version_id))
+
+    def get_by_versions(self, item_type, version_ids):
+        """여러 버전의 파일 목록을 한 번에 조회"""
+        if not version_ids:
+            return []
+        placeholders = ", ".join("?" * len(version_ids))
+        query = f"""
+            SELECT * FROM {self.table_name}
+            WHERE item_type = ? AND version_id IN ({placeholders})
+            ORDER BY version_id, file_path
+        """
+        return self._fetch_all(query, (item_type, *version_ids))
+
+    def get_summaries(self, item_type, version_ids):
+        """
+        버전별 파일 수, 전체 크기, 시퀀스별 프레임 범위 조회
+
+        한 버전에 여러 시퀀스(패스)가 있으면 프레임 범위를 시퀀스마다 따로 계산합니다.
+
+        Returns:
+            dict: version_id -> {file_count, total_size,
+                                 sequences: [{sequence_key, first_frame, last_frame, frame_count}]}
+        """
+        if not version_ids:
+            return {}
+        placeholders = ", ".join("?" * len(version_ids))
+        query = f"""
+            SELECT version_id,
+                   sequence_key,
+                   COUNT(*) AS file_count,
+                   SUM(file_size) AS total_size,
+                   MIN(frame_number) AS first_frame,
+                   MAX(frame_number) AS last_frame,
+                   COUNT(frame_number) AS frame_count
+            FROM {self.table_name}
+            WHERE item_type = ? AND version_id IN ({placeholders})
+            GROUP BY version_id, sequence_key
+            ORDER BY version_id, sequence_key
+        """
+        summaries = {}
+        for row in self._fetch_all(query, (item_type, *version_ids)):
+            summary = summaries.setdefault(row['version_id'], {
+                'version_id': row['version_id'],
+                'file_count': 0,
+                'total_size': 0,
+                'sequences': []
+            })
+            summary['file_count'] += row['file_count']
+            summary['total_size'] += row['total_size'] or 0
+            if row['frame_count']:
+                summary['sequences'].append({
+                    'sequence_key': row['sequence_key'],
+                    'first_frame': row['first_frame'],
+                    'last_frame': row['last_frame'],
+                    'frame_count': row['frame_count']
+                })
+        return summaries
+
+    def delete_by_path(self, item_type, file_path):
+        """파일 경로로 목록에서 제거 (커밋은 호출하는 쪽에서 처리)"""
+        query = f"DELETE FROM {self.table_name} WHERE item_type = ? AND file_path = ?"
+        return self._execute(query, (item_type, file_path))
+
+    def find_frame_gaps(self, item_type, version_id):
+        """
+        시퀀스별 누락된 프레임 구간 조회 (시퀀스마다 기록된 첫 프레임과 마지막 프레임 사이)
+
+        Returns:
+            dict: sequence_key -> [(누락 시작 프레임, 누락 끝 프레임), ...] (누락이 있는 시퀀스만)
+        """
+        query = f"""
+            SELECT sequence_key, frame_number, next_frame FROM (
+                SELECT sequence_key, frame_number,
+                       LEAD(frame_number) OVER (PARTITION BY sequence_key ORDER BY frame_number) AS next_frame
+                FROM {self.table_name}
+                WHERE item_type = ? AND version_id = ? AND frame_number IS NOT NULL
+            )
+            WHERE next_frame > frame_number + 1
+            ORDER BY sequence_key, frame_number
+        """
+        gaps = {}
+        for row in self._fetch_all(query, (item_type, version_id)):
+            gaps.setdefault(row['sequence_key'], []).append((row['frame_number'] + 1, row['next_frame'] - 1))
+        return gaps
+
+    def find_content_hash(self, source_path, file_size, source_mtime):
+        """경로, 크기, 수정 시각이 같은 원본을 이전에 등록했으면 그 해시 반환"""
+        query = f"""
+            SELECT FIRST 1 content_hash FROM {self.table_name}
+            WHERE file_size = ? AND source_mtime = ? AND source_path = ?
+            AND content_hash IS NOT NULL
+        """
+        result = self._fetch_one(query, (file_size, source_mtime, source_path))
+        return result['content_hash'] if result else None
@@ -7,6 +7,18 @@ class ShotVersion(BaseVersionModel):
         self.table_name = "VERSIONS"
         self.item_type = "shot"
 
+    def get_latest_versions_by_project(self, project_id):
+        """프로젝트에 속한 모든 샷의 최신 버전 조회"""
+        query = f"""
+            SELECT v.*, w.name as worker_name
+            FROM {self.table_name} v
+            JOIN workers w ON v.worker_id = w.id
+            JOIN shots sh ON sh.id = v.shot_id
+            JOIN sequences s ON s.id = sh.sequence_id
+            WHERE s.project_id = ? AND v.is_latest = TRUE
+        """
+        return self._fetch_all(query, (project_id,))
+
 class SequenceVersion(BaseVersionModel):
     def __init__(self, db_connector):
         super().__init__(db_connector)
@@ -118,6 +118,40 @@ TABLES = {
         )
     """,
 
+    'version_files': """
+        CREATE TABLE VERSION_FILES (
+            ID INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            ITEM_TYPE VARCHAR(20) NOT NULL,     -- 'project', 'sequence', 'shot'
+            VERSION_ID INTEGER NOT NULL,        -- ITEM_TYPE별 버전 테이블의 ID
+            FILE_PATH VARCHAR(500) NOT NULL,    -- 버전 폴더 안의 파일 경로
+            SOURCE_PATH VARCHAR(500),           -- 원본 파일 경로
+            FILE_SIZE BIGINT NOT NULL,
+            SOURCE_MTIME BIGINT,                -- 원본 수정 시각 (ns)
+            CONTENT_HASH VARCHAR(64),           -- BLAKE2b 해시 (중복 제거 저장소 키)
+            FRAME_NUMBER INTEGER,               -- 시퀀스 이미지의 프레임 번호
+            SEQUENCE_KEY VARCHAR(255),          -- 시퀀스 이미지가 속한 시퀀스 (예: name.####.exr)
+            CREATED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+
+    'operation_history': """
+        CREATE TABLE OPERATION_HISTORY (
+            ID INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            OPERATION_ID VARCHAR(100) NOT NULL,
+            OPERATION_TYPE VARCHAR(30) NOT NULL,  -- 'file_copy', 'preview_generate' 등
+            SOURCE_PATH VARCHAR(500),
+            DESTINATION_PATH VARCHAR(500),
+            START_TIME TIMESTAMP NOT NULL,
+            END_TIME TIMESTAMP,
+            SUCCESS BOOLEAN DEFAULT FALSE,
+            ERROR_MESSAGE VARCHAR(1000),
+            TRANSFERRED_BYTES BIGINT DEFAULT 0,
+            TOTAL_BYTES BIGINT DEFAULT 0,
+            DURATION DOUBLE PRECISION,          -- 소요 시간(초)
+            AVERAGE_SPEED_MBPS DOUBLE PRECISION
+        )
+    """,
+
     'migrations': """
         CREATE TABLE MIGRATIONS (
             ID INTEGER NOT NULL PRIMARY KEY,
@@ -125,4 +159,47 @@ TABLES = {
             APPLIED_AT TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """
-}
\ No newline at end of file
+}
+
+# 최신 버전 조회(IS_LATEST), 버전 번호 정렬/집계, 버전 파일 목록 조회용 인덱스
+INDEXES = {
+    'idx_versions_shot_latest': """
+        CREATE INDEX IDX_VERSIONS_SHOT_LATEST ON VERSIONS (SHOT_ID, IS_LATEST)
+    """,
+
+    'idx_versions_shot_number': """
+        CREATE INDEX IDX_VERSIONS_SHOT_NUMBER ON VERSIONS (SHOT_ID, VERSION_NUMBER)
+    """,
+
+    'idx_seq_versions_latest': """
+        CREATE INDEX IDX_SEQ_VERSIONS_LATEST ON SEQUENCE_VERSIONS (SEQUENCE_ID, IS_LATEST)
+    """,
+
+    'idx_seq_versions_number': """
+        CREATE INDEX IDX_SEQ_VERSIONS_NUMBER ON SEQUENCE_VERSIONS (SEQUENCE_ID, VERSION_NUMBER)
+    """,
+
+    'idx_prj_versions_latest': """
+        CREATE INDEX IDX_PRJ_VERSIONS_LATEST ON PROJECT_VERSIONS (PROJECT_ID, IS_LATEST)
+    """,
+
+    'idx_prj_versions_number': """
+        CREATE INDEX IDX_PRJ_VERSIONS_NUMBER ON PROJECT_VERSIONS (PROJECT_ID, VERSION_NUMBER)
+    """,
+
+    'idx_version_files_version': """
+        CREATE INDEX IDX_VERSION_FILES_VERSION ON VERSION_FILES (ITEM_TYPE, VERSION_ID, FRAME_NUMBER)
+    """,
+
+    'idx_version_files_source': """
+        CREATE INDEX IDX_VERSION_FILES_SOURCE ON VERSION_FILES (FILE_SIZE, SOURCE_MTIME)
+    """,
+
+    'idx_version_files_hash': """
+        CREATE INDEX IDX_VERSION_FILES_HASH ON VERSION_FILES (CONTENT_HASH)
+    """,
+
+    'idx_operation_history_time': """
+        CREATE INDEX IDX_OPERATION_HISTORY_TIME ON OPERATION_HISTORY (START_TIME)
+    """
+}
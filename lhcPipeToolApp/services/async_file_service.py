@@ -1,8 +1,8 @@
 """비동기 파일 서비스"""
-import asyncio
 from pathlib import Path
 from typing import List, Tuple, Optional
 from ..handlers.async_network_handler import AsyncNetworkFileHandler
+from ..handlers.copy_scheduler import copy_scheduler
 from ..handlers.network_path_handler import NetworkPathHandler
 from ..utils.logger import setup_logger
 
@@ -14,7 +14,7 @@ class AsyncFileService:
 
     async def process_files(self, files_to_copy: List[Tuple[str, str]]) -> List[bool]:
         """
-        여러 파일을 동시에 처리
+        여러 파일을 동시에 처리 (동시 복사 수는 공유 복사 스케줄러가 제한)
         
         Args:
             files_to_copy (list): (source, destination) 튜플의 리스트
@@ -22,31 +22,26 @@ class AsyncFileService:
         Returns:
             list[bool]: 각 파일의 복사 성공 여부 리스트
         """
-        async def copy_with_progress(source: str, destination: str) -> bool:
-            try:
-                # 네트워크 접근 확인 및 경로 변환
-                success, actual_dest = self.network_handler.ensure_network_access(destination)
-                if not success:
-                    self.logger.error(f"네트워크 접근 실패: {actual_dest}")
-                    return False
+        results = [False] * len(files_to_copy)
+        accessible = []
+        for index, (source, destination) in enumerate(files_to_copy):
+            # 네트워크 접근 확인 및 경로 변환
+            success, actual_dest = self.network_handler.ensure_network_access(destination)
+            if success:
+                accessible.append((index, source, actual_dest))
+            else:
+                self.logger.error(f"네트워크 접근 실패: {actual_dest}")
 
-                async def progress_callback(progress: float):
-                    self.logger.info(f"복사 진행률 ({Path(source).name}): {progress:.1f}%")
-                
-                return await self.async_handler.copy_with_timeout(
-                    source, actual_dest, progress_callback
-                )
-            except Exception as e:
-                self.logger.error(f"파일 처리 실패 ({source}): {str(e)}")
-                return False
+        async def progress_callback(source: str, progress: float):
+            self.logger.info(f"복사 진행률 ({Path(source).name}): {progress:.1f}%")
 
-        # 모든 파일 복사 작업을 동시에 실행
-        tasks = [
-            copy_with_progress(source, dest)
-            for source, dest in files_to_copy
-        ]
-        
-        return await asyncio.gather(*tasks)
+        copied = await copy_scheduler.copy_many(
+            [(source, actual_dest) for _, source, actual_dest in accessible],
+            progress_callback
+        )
+        for (index, _, _), success in zip(accessible, copied):
+            results[index] = success
+        return results
 
     async def copy_single_file(self, source: str, destination: str, 
                              progress_callback: Optional[callable] = None) -> bool:
@@ -67,9 +62,7 @@ class AsyncFileService:
             if not success:
                 raise PermissionError(f"네트워크 접근 실패: {actual_dest}")
 
-            return await self.async_handler.copy_with_timeout(
-                source, actual_dest, progress_callback
-            )
+            return await copy_scheduler.copy(source, actual_dest, progress_callback)
             
         except Exception as e:
             self.logger.error(f"파일 복사 실패: {str(e)}")
@@ -2,13 +2,16 @@
 from ..utils.event_system import EventSystem
 from ..utils.logger import setup_logger
 from ..utils.db_utils import convert_date_format
+from ..models.version_file import VersionFile
 
 class BaseVersionService:
     def __init__(self, version_model, worker_service):
         self.logger = setup_logger(__name__)
         self.table_name = None  # 하위 클래스에서 정의
+        self.item_type = None   # 하위 클래스에서 정의 ('project', 'sequence', 'shot')
         self.version_model = version_model
         self.worker_service = worker_service
+        self.version_file_model = VersionFile(version_model.db_connector)
 
     def create_version(self, item_id, version_number=None, worker_name=None, 
                       file_path=None, render_path=None, preview_path=None, comment=None, status=None):
@@ -68,6 +71,10 @@ class BaseVersionService:
             return None
         return worker
 
+    def get_next_version_number(self, item_id):
+        """다음 버전 번호 조회"""
+        return self._get_next_version_number(item_id)
+
     def _get_next_version_number(self, item_id):
         """다음 버전 번호 조회"""
         try:
@@ -100,7 +107,9 @@ class BaseVersionService:
                     v.version_number,
                     w.name as worker_name,
                     v.created_at,
-                    v.status
+                    v.status,
+                    v.file_path,
+                    v.preview_path
                 FROM {self.table_name} v
                 LEFT JOIN workers w ON v.worker_id = w.id
                 WHERE v.{self.get_foreign_key()} = ?
@@ -231,6 +240,19 @@ class BaseVersionService:
         """버전 정보 업데이트"""
         return self.version_model.update(version_id, status=status, comment=comment)
 
+    def update_preview_path(self, version_id, preview_path):
+        """프리뷰 경로 업데이트 (백그라운드 프리뷰 생성 완료 시 호출)"""
+        try:
+            if self.version_model.update_preview_path(version_id, preview_path):
+                self.version_model._commit()
+                return True
+            else:
+                self.version_model._rollback()
+                return False
+        except Exception as e:
+            self.logger.error(f"프리뷰 경로 업데이트 중 예외 발생: {str(e)}", exc_info=True)
+            return False
+
     def delete_version(self, version_id):
         """버전 삭제"""
         try:
@@ -253,6 +275,29 @@ class BaseVersionService:
             self.logger.error(f"렌더 경로 조회 실패: {str(e)}")
             return "\\\\DESKTOP-LHG738J:\\Project_TEST\\Render"
 
+    def get_version_files(self, version_ids):
+        """버전 파일 목록 조회 (공유 폴더를 탐색하지 않고 VERSION_FILES에서 조회)"""
+        return self.version_file_model.get_by_versions(self.item_type, list(version_ids))
+
+    def get_version_file_summaries(self, version_ids):
+        """버전별 파일 수, 전체 크기, 시퀀스별 프레임 범위 조회 (version_id -> dict)"""
+        return self.version_file_model.get_summaries(self.item_type, list(version_ids))
+
+    def remove_version_file(self, file_path):
+        """버전 파일 목록에서 파일 제거 (파일 삭제 후 호출)"""
+        try:
+            self.version_file_model.delete_by_path(self.item_type, file_path)
+            self.version_file_model._commit()
+            return True
+        except Exception as e:
+            self.version_file_model._rollback()
+            self.logger.error(f"버전 파일 목록 제거 실패: {str(e)}")
+            return False
+
+    def get_missing_frames(self, version_id):
+        """버전에서 누락된 프레임 구간 조회 (시퀀스 키 -> 구간 목록)"""
+        return self.version_file_model.find_frame_gaps(self.item_type, version_id)
+
     def get_foreign_key(self):
         """외래키 필드명 반환 - 하위 클래스에서 구현"""
         raise NotImplementedError
@@ -1,13 +1,22 @@
 """파일 관리 서비스"""
+import asyncio
 import os
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from ..handlers.network_path_handler import NetworkPathHandler
 from ..handlers.async_network_handler import AsyncNetworkFileHandler
+from ..handlers.copy_scheduler import copy_scheduler
+from ..handlers.content_store import ContentStore
 from ..handlers.monitoring_handler import NetworkMonitor, OperationType
+from ..models.version_file import VersionFile
+from ..utils.sequence_utils import parse_frame_number, parse_sequence_key, is_sequence_spec, sequence_index
 from ..utils.logger import setup_logger
 
 class FileManageService:
+    STORE_DIR_NAME = ".content_store"   # 렌더 출력 드라이브 아래 중복 제거 저장소 폴더
+    HASH_CONCURRENCY = 2                # 중복 제거 저장 시 동시에 해시를 계산하는 파일 수
+
     def __init__(self, version_services, settings_service):
         self.version_services = version_services
         self.settings_service = settings_service
@@ -16,7 +25,10 @@ class FileManageService:
         # 핸들러 초기화
         self.network_handler = NetworkPathHandler()
         self.async_handler = AsyncNetworkFileHandler()
-        self.monitor = NetworkMonitor()
+        self.monitor = NetworkMonitor.instance()
+        self.version_file_model = VersionFile(settings_service.db_connector)
+        # 작업 스레드의 해시 조회가 커넥션을 하나만 쓰도록 직렬화
+        self._lookup_lock = threading.Lock()
 
     async def copy_file_to_version(self, source_file: str, version_path: str) -> Optional[str]:
         """파일을 버전 디렉토리로 복사 (비동기)"""
@@ -24,12 +36,13 @@ class FileManageService:
             if not os.path.exists(source_file):
                 raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {source_file}")
             
-            # 모니터링 시작
+            # 모니터링 시작 (실제 전송은 파일 핸들러가 FILE_COPY 작업으로 따로 기록)
+            source_size = os.path.getsize(source_file)
             operation = self.monitor.start_operation(
-                OperationType.FILE_COPY,
+                OperationType.VERSION_FILE,
                 source_file,
                 version_path,
-                os.path.getsize(source_file)
+                source_size
             )
 
             try:
@@ -46,12 +59,12 @@ class FileManageService:
                 self.logger.debug(f"대상 파일: {target_file}")
                 
                 # 파일 비동기 복사
-                success = await self.async_handler.copy_with_timeout(
+                success = await copy_scheduler.copy(
                     source_file,
                     target_file,
                     progress_callback=lambda progress: self.monitor.update_progress(
                         operation.operation_id,
-                        int(progress * os.path.getsize(source_file) / 100)
+                        int(progress * source_size / 100)
                     )
                 )
 
@@ -74,6 +87,28 @@ class FileManageService:
             self.logger.error(f"파일 복사 실패: {str(e)}")
             raise
 
+    def _get_output_drive(self) -> str:
+        """렌더 출력 경로가 매핑된 드라이브 문자 (예: Y:)"""
+        # 기본 출력 경로 가져오기 (예: \\DESKTOP-LHG738J\lighting_share3\Project_TEST\Render)
+        base_path = self.settings_service.get_setting('render_output')
+        if not base_path:
+            raise ValueError("렌더 출력 경로가 설정되지 않았습니다.")
+
+        # 네트워크 경로 처리
+        success, mapped_path = self.network_handler.ensure_network_access(base_path)
+        if not success:
+            raise PermissionError(f"네트워크 경로 접근 실패: {mapped_path}")
+
+        return mapped_path.split(':')[0] + ':'
+
+    def is_dedup_enabled(self) -> bool:
+        """버전 파일 중복 제거 저장 사용 여부 ('dedup_storage' 설정)"""
+        return (self.settings_service.get_setting('dedup_storage') or '').lower() == 'true'
+
+    def get_content_store(self) -> ContentStore:
+        """렌더 출력 드라이브의 중복 제거 저장소 (버전 폴더와 같은 볼륨이어야 링크 가능)"""
+        return ContentStore(f"{self._get_output_drive()}/{self.STORE_DIR_NAME}")
+
     def get_version_path(self, item_type: str, item_id: int, version_number: int) -> str:
         """
         버전 경로 생성
@@ -92,19 +127,7 @@ class FileManageService:
             shot: Y:/Project_TEST/Render/Rogue/Wide/shot002/v001
         """
         try:
-            # 기본 출력 경로 가져오기 (예: \\DESKTOP-LHG738J\lighting_share3\Project_TEST\Render)
-            base_path = self.settings_service.get_setting('render_output')
-            if not base_path:
-                raise ValueError("렌더 출력 경로가 설정되지 않았습니다.")
-            
-            # 네트워크 경로 처리
-            success, mapped_path = self.network_handler.ensure_network_access(base_path)
-            if not success:
-                raise PermissionError(f"네트워크 경로 접근 실패: {mapped_path}")
-            
-            # 매핑된 드라이브 문자와 기본 경로 분리
-            drive_letter = mapped_path.split(':')[0] + ':'
-            base_components = base_path.split('\\')[4:]  # Project_TEST/Render 부분 추출
+            drive_letter = self._get_output_drive()
             version_folder = f"v{version_number:03d}"
             
             # 아이템 타입별 경로 구성
@@ -207,31 +230,151 @@ class FileManageService:
             self.logger.error(f"다음 버전 번호 조회 실패: {str(e)}")
             raise
 
+    def describe_source(self, source_file: str) -> Dict[str, Any]:
+        """버전 파일 목록에 기록할 원본 정보 (경로, 크기, 수정 시각, 프레임 번호, 시퀀스 키)"""
+        stat = os.stat(source_file)
+        return {
+            'source_path': os.path.normpath(source_file),
+            'file_size': stat.st_size,
+            'source_mtime': stat.st_mtime_ns,
+            'frame_number': parse_frame_number(source_file),
+            'sequence_key': parse_sequence_key(source_file)
+        }
+
+    def _build_file_entry(self, source_file: str, target_file: str, version_number: int,
+                          source_info: Dict[str, Any], content_hash: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            'source_file': source_file,
+            'target_file': target_file,
+            'file_path': target_file,
+            'version_number': version_number,
+            'content_hash': content_hash,
+            **source_info
+        }
+
+    async def _upload_blob(self, source_file: str, store: ContentStore, content_hash: str) -> bool:
+        """
+        원본을 저장소에 업로드
+
+        다른 작업자가 같은 내용을 동시에 올려도 서로의 임시 파일을 건드리지 않도록 업로더별 임시 파일에 복사하고,
+        그 사이 저장소 파일이 먼저 생겼으면 그 파일을 그대로 사용합니다.
+        """
+        upload_path = store.upload_path(content_hash)
+        committed = False
+        try:
+            if not await copy_scheduler.copy(source_file, upload_path):
+                return False
+            if not await asyncio.to_thread(store.commit_upload, upload_path, content_hash):
+                self.logger.debug(f"다른 작업자가 먼저 업로드한 저장소 파일 사용: {content_hash}")
+            committed = True
+            return True
+        finally:
+            if not committed:
+                await asyncio.to_thread(store.discard_upload, upload_path)
+
+    def _find_known_source(self, source_file: str):
+        """원본 정보와 이전에 등록된 해시 조회 (작업 스레드에서 실행)"""
+        source_info = self.describe_source(source_file)
+        with self._lookup_lock:
+            try:
+                content_hash = self.version_file_model.find_content_hash(
+                    source_info['source_path'], source_info['file_size'], source_info['source_mtime']
+                )
+            finally:
+                # 작업 스레드가 임대한 커넥션 반납
+                self.version_file_model.db_connector.release()
+        return source_info, content_hash
+
+    async def store_version_file(
+        self,
+        source_file: str,
+        target_file: str,
+        store: ContentStore,
+        uploads: Optional[Dict[str, asyncio.Future]] = None,
+        hash_slots: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Any]:
+        """
+        중복 제거 저장소를 거쳐 버전 파일 저장
+
+        같은 경로/크기/수정 시각의 원본을 이전에 등록했으면 해시 계산을 건너뛰고,
+        저장소에 이미 있는 내용이면 업로드 없이 버전 폴더에 링크만 만듭니다.
+        버전 폴더 볼륨에 링크를 만들 수 없으면 저장소에 업로드하지 않고 바로 복사합니다.
+
+        Args:
+            uploads: 한 번의 일괄 처리 안에서 같은 내용을 한 번만 업로드하기 위한 진행 중 업로드 (해시 -> Future)
+            hash_slots: 일괄 처리 안에서 동시에 해시를 계산할 수 있는 파일 수 제한
+
+        Returns:
+            dict: 버전 파일 목록에 기록할 정보 (source_path, file_size, source_mtime, content_hash)
+        """
+        if hash_slots is None:
+            hash_slots = asyncio.Semaphore(1)
+        async with hash_slots:
+            source_info, content_hash = await asyncio.to_thread(self._find_known_source, source_file)
+            can_link = await asyncio.to_thread(store.can_link_to, os.path.dirname(target_file))
+            if can_link and not content_hash:
+                content_hash = await asyncio.to_thread(ContentStore.hash_file, source_file)
+
+        if not can_link:
+            # 업로드 후 다시 복사하면 전송량이 두 배가 되므로 저장소를 거치지 않음
+            if not await copy_scheduler.copy(source_file, target_file):
+                raise Exception(f"파일 복사 실패: {source_file}")
+            return source_info | {'content_hash': content_hash}
+
+        if uploads is None:
+            uploads = {}
+        upload = uploads.get(content_hash)
+        if upload is None and not store.has_blob(content_hash):
+            upload = uploads[content_hash] = asyncio.ensure_future(
+                self._upload_blob(source_file, store, content_hash)
+            )
+        if upload is not None and not await upload:
+            raise Exception(f"저장소 업로드 실패: {source_file}")
+
+        try:
+            method = await asyncio.to_thread(store.link, content_hash, target_file)
+            self.logger.debug(f"저장소 파일 연결 ({method}): {target_file}")
+        except OSError as e:
+            # 이미 업로드한 저장소 파일에서 복사 (같은 볼륨이므로 원본을 다시 전송하지 않고 서버 측 복사 가능)
+            self.logger.debug(f"저장소 파일 연결 불가, 저장소 파일에서 복사: {str(e)}")
+            if not await copy_scheduler.copy(store.blob_path(content_hash), target_file):
+                raise Exception(f"파일 복사 실패: {source_file}")
+
+        return source_info | {'content_hash': content_hash}
+
     async def process_version_file(
         self, 
         source_file: str, 
         item_type: str, 
         item_id: int,
-        version_number: Optional[int] = None
+        version_number: Optional[int] = None,
+        dedup: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """버전 파일 처리"""
+        """버전 파일 처리 (dedup이 None이면 'dedup_storage' 설정을 따름)"""
         try:
             if version_number is None:
                 version_number = self.get_next_version_number(item_type, item_id)
+            if dedup is None:
+                dedup = self.is_dedup_enabled()
                 
             # 버전 경로 생성
             version_path = self.get_version_path(item_type, item_id, version_number)
             
-            # 파일 복사
-            target_file = await self.copy_file_to_version(source_file, version_path)
-            if not target_file:
-                raise Exception("파일 복사 실패")
+            if dedup:
+                if not await self.async_handler.ensure_directory(version_path):
+                    raise PermissionError(f"디렉토리 생성 실패: {version_path}")
+                target_file = os.path.join(version_path, os.path.basename(source_file))
+                source_info = await self.store_version_file(source_file, target_file, self.get_content_store())
+                content_hash = source_info.pop('content_hash')
+            else:
+                # 파일 복사
+                source_info = self.describe_source(source_file)
+                content_hash = None
+                target_file = await self.copy_file_to_version(source_file, version_path)
+                if not target_file:
+                    raise Exception("파일 복사 실패")
                 
-            return {
-                'source_file': source_file,
-                'target_file': target_file,
-                'version_number': version_number
-            }
+            return self._build_file_entry(source_file, target_file, version_number, source_info, content_hash)
             
         except Exception as e:
             self.logger.error(f"버전 파일 처리 실패: {str(e)}")
@@ -242,12 +385,15 @@ class FileManageService:
         files: List[str], 
         item_type: str, 
         item_id: int,
-        version_number: Optional[int] = None
+        version_number: Optional[int] = None,
+        dedup: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
-        """여러 파일 동시 처리"""
+        """여러 파일 동시 처리 (dedup이 None이면 'dedup_storage' 설정을 따름)"""
         try:
             if version_number is None:
                 version_number = self.get_next_version_number(item_type, item_id)
+            if dedup is None:
+                dedup = self.is_dedup_enabled()
                 
             version_path = self.get_version_path(item_type, item_id, version_number)
             
@@ -257,24 +403,37 @@ class FileManageService:
                 for source_file in files
             ]
             
-            # 비동기 파일 서비스를 통한 동시 처리
-            results = await self.async_handler.process_files(files_to_copy)
+            if dedup:
+                if not await self.async_handler.ensure_directory(version_path):
+                    raise PermissionError(f"디렉토리 생성 실패: {version_path}")
+                store = self.get_content_store()
+                uploads = {}
+                # 해시 계산은 파일 전체를 읽으므로 동시 실행 수 제한 (복사는 복사 스케줄러가 제한)
+                hash_slots = asyncio.Semaphore(self.HASH_CONCURRENCY)
+                results = await asyncio.gather(
+                    *(self.store_version_file(source, target, store, uploads, hash_slots)
+                      for source, target in files_to_copy),
+                    return_exceptions=True
+                )
+            else:
+                # 공유 복사 스케줄러를 통한 동시 처리 (동시 복사 수 제한, 작은 파일 우선)
+                results = await copy_scheduler.copy_many(files_to_copy)
             
             # 결과 매핑
             processed_files = []
-            for source_file, success in zip(files, results):
-                if success:
-                    target_file = os.path.join(
-                        version_path, 
-                        os.path.basename(source_file)
-                    )
-                    processed_files.append({
-                        'source_file': source_file,
-                        'target_file': target_file,
-                        'version_number': version_number
-                    })
-                else:
+            for (source_file, target_file), result in zip(files_to_copy, results):
+                if isinstance(result, Exception) or not result:
                     self.logger.error(f"파일 처리 실패: {source_file}")
+                    continue
+                if dedup:
+                    source_info = dict(result)
+                    content_hash = source_info.pop('content_hash')
+                else:
+                    source_info = self.describe_source(source_file)
+                    content_hash = None
+                processed_files.append(
+                    self._build_file_entry(source_file, target_file, version_number, source_info, content_hash)
+                )
                     
             if not processed_files:
                 raise Exception("모든 파일 처리 실패")
@@ -285,22 +444,41 @@ class FileManageService:
             self.logger.error(f"다중 파일 처리 실패: {str(e)}")
             raise
 
+    def expand_sequence_sources(self, source_files: List[str]) -> List[str]:
+        """시퀀스 경로(%04d, ####, $F4)를 프레임 파일 목록으로 펼침"""
+        expanded = []
+        for source_file in source_files:
+            if not is_sequence_spec(source_file):
+                expanded.append(source_file)
+                continue
+            sequence = sequence_index.find_sequence(source_file)
+            if not sequence:
+                raise FileNotFoundError(f"시퀀스 파일을 찾을 수 없습니다: {source_file}")
+            if sequence.gaps:
+                self.logger.warning(f"누락된 프레임이 있는 시퀀스: {source_file} ({sequence.display_name})")
+            expanded.extend(sequence.paths)
+        return expanded
+
     async def create_version(
         self, 
         item_type: str, 
         item_id: int, 
         source_files: List[str],
-        version_number: Optional[int] = None
+        version_number: Optional[int] = None,
+        dedup: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """버전 생성"""
+        """버전 생성 (시퀀스 경로는 프레임 파일 목록으로 펼쳐서 처리)"""
         try:
+            source_files = self.expand_sequence_sources(source_files)
+
             # 파일 처리
             if len(source_files) == 1:
                 file_info = await self.process_version_file(
                     source_files[0], 
                     item_type, 
                     item_id,
-                    version_number
+                    version_number,
+                    dedup
                 )
                 processed_files = [file_info]
             else:
@@ -308,7 +486,8 @@ class FileManageService:
                     source_files, 
                     item_type, 
                     item_id,
-                    version_number
+                    version_number,
+                    dedup
                 )
                 
             version_number = processed_files[0]['version_number']
@@ -321,4 +500,20 @@ class FileManageService:
             
         except Exception as e:
             self.logger.error(f"버전 생성 실패: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def record_manifest(self, item_type: str, version_id: int, files: List[Dict[str, Any]]) -> bool:
+        """
+        버전 파일 목록(VERSION_FILES) 기록
+
+        Args:
+            files: process_version_file/process_multiple_files가 반환한 파일 정보 목록
+        """
+        try:
+            self.version_file_model.add_files(item_type, version_id, files)
+            self.version_file_model._commit()
+            return True
+        except Exception as e:
+            self.version_file_model._rollback()
+            self.logger.error(f"버전 파일 목록 기록 실패: {str(e)}")
+            return False
@@ -0,0 +1,205 @@
+"""프리뷰 생성 큐 서비스"""
+import os
+import threading
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from PySide6.QtCore import QObject, Signal
+from ..handlers.monitoring_handler import NetworkMonitor, OperationType
+from ..utils.event_system import EventSystem
+from ..utils.logger import setup_logger, configure_worker_logging, worker_log_queue
+from ..utils.preview_generator import generate_preview
+
+class PreviewJob:
+    """원본 파일 하나에 대한 프리뷰 생성 작업"""
+
+    __slots__ = ('source', 'target', 'operation_id', 'future', 'versions')
+
+    def __init__(self, source, target, operation_id):
+        self.source = source
+        self.target = target
+        self.operation_id = operation_id
+        self.future = None
+        self.versions = []   # 완료 시 preview_path를 기록할 (version_service, version_id)
+
+class PreviewQueueService(QObject):
+    """
+    프로세스 풀 기반 프리뷰 생성 큐
+
+    OpenCV 디코딩은 CPU를 많이 쓰고 GIL을 오래 잡으므로 별도 프로세스에서 실행합니다.
+    같은 원본에 대한 작업이 진행 중이면 새로 만들지 않고 기존 작업에 합치며,
+    완료되면 연결된 버전 행의 preview_path를 갱신합니다. 진행 상황은 NetworkMonitor에 기록됩니다.
+
+    Example:
+        queue = PreviewQueueService.instance()
+        queue.submit(file_path, version_service=service, version_id=version_id)
+    """
+
+    # (source, preview_path) 작업 완료 시그널 (실패 시 preview_path는 빈 문자열)
+    preview_finished = Signal(str, str)
+    # (완료 수, 전체 수) 진행률 시그널 (큐가 비면 0으로 초기화)
+    progress_changed = Signal(int, int)
+    # 작업 스레드 -> GUI 스레드 버전 갱신 통지용
+    _versions_updated = Signal()
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """프로세스 전역 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, max_workers=None):
+        super().__init__()
+        self.logger = setup_logger(__name__)
+        self.monitor = NetworkMonitor.instance()
+        # GUI 프로세스가 쓸 코어 하나는 남겨둠
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+
+        self._lock = threading.Lock()
+        self._executor = None
+        self._jobs = {}   # 정규화된 원본 경로 -> PreviewJob
+        self._submitted = 0
+        self._completed = 0
+
+        self._versions_updated.connect(self._notify_versions_updated)
+
+    def _get_executor(self):
+        """프로세스 풀 반환 (첫 작업 시 생성)"""
+        if self._executor is None:
+            # 작업 프로세스의 로그는 메인 프로세스로 전달하여 같은 로그 파일에 기록
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=configure_worker_logging,
+                initargs=(worker_log_queue(),)
+            )
+            self.logger.info(f"프리뷰 프로세스 풀 시작 - workers: {self.max_workers}")
+        return self._executor
+
+    @staticmethod
+    def _job_key(source):
+        return os.path.normcase(os.path.abspath(source))
+
+    def submit(self, source, target=None, version_service=None, version_id=None):
+        """
+        프리뷰 생성 작업 추가 (즉시 반환)
+
+        Args:
+            source: 원본 파일 경로 (비디오 또는 이미지 시퀀스)
+            target: 프리뷰 저장 경로 (없으면 원본 옆에 *_preview.png)
+            version_service: 완료 시 preview_path를 기록할 버전 서비스
+            version_id: 완료 시 preview_path를 기록할 버전 ID
+
+        Returns:
+            concurrent.futures.Future (결과는 프리뷰 경로 또는 None)
+        """
+        if not source:
+            return None
+
+        key = self._job_key(source)
+        with self._lock:
+            job = self._jobs.get(key)
+            created = job is None
+            if created:
+                operation = self.monitor.start_operation(OperationType.PREVIEW_GENERATE, source, target)
+                job = PreviewJob(source, target, operation.operation_id)
+                job.future = self._get_executor().submit(generate_preview, source, target)
+                self._jobs[key] = job
+                self._submitted += 1
+            else:
+                self.logger.debug(f"진행 중인 프리뷰 작업에 합침: {source}")
+            if version_service is not None and version_id is not None:
+                job.versions.append((version_service, version_id))
+
+        if created:
+            # 이미 끝난 future는 콜백이 즉시 호출되므로 잠금 밖에서 등록
+            job.future.add_done_callback(lambda future, key=key: self._handle_done(key, future))
+            self._emit_progress()
+        return job.future
+
+    def submit_batch(self, jobs, version_service=None):
+        """
+        여러 프리뷰 작업을 한 번에 추가
+
+        Args:
+            jobs: (source, target) 또는 (source, target, version_id) 튜플 목록
+            version_service: version_id가 있는 작업의 preview_path를 기록할 버전 서비스
+        """
+        futures = []
+        for job in jobs:
+            source, target, version_id = (tuple(job) + (None, None))[:3]
+            futures.append(self.submit(source, target, version_service, version_id))
+        self.logger.info(f"프리뷰 작업 일괄 추가: {len(futures)}개")
+        return futures
+
+    def _handle_done(self, key, future):
+        """작업 완료 처리 (프로세스 풀 관리 스레드에서 호출)"""
+        with self._lock:
+            job = self._jobs.pop(key, None)
+            self._completed += 1
+        if job is None:
+            return
+
+        try:
+            preview_path = future.result()
+            error = None if preview_path else "프리뷰 생성 실패"
+        except CancelledError:
+            preview_path, error = None, "작업 취소"
+        except Exception as e:
+            preview_path, error = None, str(e)
+
+        with self._lock:
+            self.monitor.complete_operation(job.operation_id, bool(preview_path), error)
+
+        if preview_path and job.versions:
+            self._write_back(job.versions, preview_path)
+
+        self.preview_finished.emit(job.source, preview_path or "")
+        self._emit_progress()
+
+    def _write_back(self, versions, preview_path):
+        """생성된 프리뷰 경로를 버전 행에 기록"""
+        updated = False
+        connectors = set()
+        for version_service, version_id in versions:
+            try:
+                updated |= version_service.update_preview_path(version_id, preview_path)
+            except Exception as e:
+                self.logger.error(f"프리뷰 경로 기록 실패 - version: {version_id}, 오류: {str(e)}", exc_info=True)
+            connectors.add(version_service.version_model.db_connector)
+
+        # 관리 스레드가 임대한 커넥션은 작업마다 반납
+        for db_connector in connectors:
+            db_connector.release()
+
+        if updated:
+            self._versions_updated.emit()
+
+    def _notify_versions_updated(self):
+        EventSystem.notify('version_updated')
+
+    def _emit_progress(self):
+        with self._lock:
+            completed, submitted = self._completed, self._submitted
+            if completed >= submitted:
+                # 큐가 비면 다음 배치를 위해 진행률 초기화
+                self._completed = self._submitted = 0
+        self.progress_changed.emit(completed, submitted)
+
+    def pending_count(self):
+        """대기/실행 중인 작업 수"""
+        with self._lock:
+            return len(self._jobs)
+
+    def get_progress(self):
+        """현재 배치의 (완료 수, 전체 수) 반환"""
+        with self._lock:
+            return self._completed, self._submitted
+
+    def shutdown(self, wait=False):
+        """프로세스 풀 종료 (대기 중인 작업은 취소)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            self.logger.info("프리뷰 프로세스 풀 종료")
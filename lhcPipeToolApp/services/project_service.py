@@ -1,8 +1,13 @@
 """프로젝트 관리 서비스"""
+from ..utils.db_utils import max_queries
 from ..utils.event_system import EventSystem
 from ..utils.logger import setup_logger
 
 class ProjectService:
+    # 조회별 쿼리 예산 (초과 시 경고 로그 - N+1 쿼리 회귀 감지용)
+    PROJECT_STRUCTURE_QUERY_BUDGET = 4
+    TREE_CHILDREN_QUERY_BUDGET = 1
+
     def __init__(self, project_model, sequence_model, shot_model, version_model, worker_service):
         self.project_model = project_model
         self.sequence_model = sequence_model
@@ -12,53 +17,63 @@ class ProjectService:
         self.logger = setup_logger(__name__)
         
     def get_project_structure(self, project_id):
-        """프로젝트의 전체 구조 조회"""
+        """
+        프로젝트의 전체 구조 조회
+
+        프로젝트, 시퀀스, 샷, 샷별 최신 버전을 각각 한 번씩(총 4회) 조회한 뒤
+        메모리에서 조립하므로 시퀀스/샷 수와 무관하게 쿼리 수가 일정합니다.
+        """
         try:
             self.logger.info(f"프로젝트 구조 조회 시작 - Project ID: {project_id}")
-            
-            project = self.project_model.get_by_id(project_id)
-            if not project:
-                self.logger.warning(f"프로젝트를 찾을 수 없음 - ID: {project_id}")
-                return None
 
-            sequences = self.sequence_model.get_by_project(project_id)
+            with max_queries(self.project_model.db_connector, self.PROJECT_STRUCTURE_QUERY_BUDGET, self.logger):
+                project = self.project_model.get_by_id(project_id)
+                if not project:
+                    self.logger.warning(f"프로젝트를 찾을 수 없음 - ID: {project_id}")
+                    return None
+
+                sequences = self.sequence_model.get_by_project(project_id)
+                shots = self.shot_model.get_by_project(project_id)
+                latest_versions = {
+                    version['shot_id']: version
+                    for version in self.version_model["shot"].get_latest_versions_by_project(project_id)
+                }
+
             structure = {
                 "project": {
-                    "id": project[0],
-                    "name": project[1],
-                    "path": project[2],
-                    "description": project[3],
-                    "created_at": project[4]
+                    "id": project['id'],
+                    "name": project['name'],
+                    "path": project['path'],
+                    "description": project['description'],
+                    "created_at": project['created_at']
                 },
                 "sequences": {}
             }
 
             for seq in sequences:
-                shots = self.shot_model.get_by_sequence(seq[0])
-                shot_list = []
-                
-                for shot in shots:
-                    latest_version = self.version_model.get_latest_version(shot[0])
-                    shot_info = {
-                        "id": shot[0],
-                        "name": shot[2],
-                        "status": shot[3],
-                        "description": shot[4],
-                        "created_at": shot[5],
-                        "latest_version": latest_version
-                    }
-                    shot_list.append(shot_info)
-                
-                structure["sequences"][seq[0]] = {
+                structure["sequences"][seq['id']] = {
                     "info": {
-                        "id": seq[0],
-                        "name": seq[2],
-                        "description": seq[3],
-                        "created_at": seq[4]
+                        "id": seq['id'],
+                        "name": seq['name'],
+                        "description": seq['description'],
+                        "created_at": seq['created_at']
                     },
-                    "shots": shot_list
+                    "shots": []
                 }
 
+            for shot in shots:
+                sequence = structure["sequences"].get(shot['sequence_id'])
+                if sequence is None:
+                    continue
+                sequence["shots"].append({
+                    "id": shot['id'],
+                    "name": shot['name'],
+                    "status": shot['status'],
+                    "description": shot['description'],
+                    "created_at": shot['created_at'],
+                    "latest_version": latest_versions.get(shot['id'])
+                })
+
             self.logger.info("프로젝트 구조 조회 완료")
             return structure
             
@@ -108,6 +123,17 @@ class ProjectService:
 
         return structure
 
+    def get_tree_children(self, item_type, parent_id=None):
+        """트리 표시용 하위 노드 조회 (한 단계만 조회)"""
+        with max_queries(self.project_model.db_connector, self.TREE_CHILDREN_QUERY_BUDGET, self.logger):
+            if item_type == "project":
+                return self.project_model.get_project_nodes()
+            if item_type == "sequence":
+                return self.project_model.get_sequence_nodes(parent_id)
+            if item_type == "shot":
+                return self.project_model.get_shot_nodes(parent_id)
+            return []
+
     def create_project(self, name, path=None, description=None):
         """프로젝트 생성"""
         try:
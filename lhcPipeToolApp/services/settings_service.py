@@ -9,13 +9,11 @@ class SettingsService:
     def get_setting(self, key):
         """설정값 조회"""
         try:
-            cursor = self.db_connector.cursor()
-            cursor.execute(
+            result = self.db_connector.fetch_one(
                 "SELECT SETTING_VALUE FROM settings WHERE SETTING_KEY = ?",
                 (key,)
             )
-            result = cursor.fetchone()
-            return result[0] if result else None
+            return result['setting_value'] if result else None
         except Exception as e:
             self.logger.error(f"설정 조회 실패 ({key}): {str(e)}")
             return None
@@ -0,0 +1,243 @@
+"""썸네일 캐시 서비스"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader
+from ..utils.logger import setup_logger
+
+class ThumbnailTask(QRunnable):
+    """썸네일 생성 작업 (작업 스레드에서 실행)"""
+
+    def __init__(self, service, source_path, size):
+        super().__init__()
+        self.service = service
+        self.source_path = source_path
+        self.size = size
+
+    def run(self):
+        try:
+            self.service.get_thumbnail(self.source_path, self.size)
+        finally:
+            self.service._finish_request(self.source_path, self.size)
+
+class ThumbnailService(QObject):
+    """
+    프리뷰 썸네일 캐시
+
+    원본 프리뷰를 고정 크기(SMALL/LARGE) JPEG 썸네일로 축소해 사용자 프로필 아래
+    디스크 캐시에 저장하고, 최근 사용한 썸네일은 용량(MB) 제한이 있는 메모리 LRU에 보관합니다.
+    디스크 캐시 키는 원본 경로, 수정 시각, 파일 크기로 만들어지므로 원본이 바뀌면 새로 생성됩니다.
+    get_thumbnail()은 작업 스레드에서 호출할 수 있고, GUI 스레드에서는 peek_entry()/request()를 사용합니다.
+    메모리 항목은 REVALIDATE_INTERVAL이 지나면 peek 시 백그라운드에서 원본 변경 여부를 다시 확인합니다.
+    """
+
+    SMALL = 256     # 트리, 버전 테이블용
+    LARGE = 1024    # 디테일 패널용
+
+    CACHE_DIR = Path.home() / ".lhcPipeTool" / "thumbnails"
+    JPEG_QUALITY = 85
+    REVALIDATE_INTERVAL = 30.0   # 메모리 항목의 원본 변경 확인 간격(초)
+
+    # (source_path, size) 썸네일 준비 완료 시그널 (실패 시에도 발생)
+    thumbnail_ready = Signal(str, int)
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """프로세스 전역 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, memory_limit_mb=64, max_threads=2, cache_dir=None):
+        super().__init__()
+        self.logger = setup_logger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_limit = memory_limit_mb * 1024 * 1024
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()   # (source_path, size) -> (stamp, QImage, 마지막 확인 시각)
+        self._memory_bytes = 0
+        self._failed = set()           # 생성에 실패한 (source_path, size)
+        self._pending = set()          # 생성 중인 (source_path, size)
+        self.hits = 0
+        self.misses = 0
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads)
+
+    def _stamp(self, source_path):
+        """원본 파일의 (수정 시각, 크기) 반환 (파일이 없으면 None)"""
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _cache_file(self, source_path, size, stamp):
+        """디스크 캐시 파일 경로"""
+        key = f"{os.path.normcase(os.path.abspath(source_path))}|{stamp[0]}|{stamp[1]}|{size}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.jpg"
+
+    def _remember(self, key, stamp, image):
+        """메모리 LRU에 썸네일 저장 (용량 초과 시 오래된 항목 제거)"""
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old:
+                self._memory_bytes -= old[1].sizeInBytes()
+            self._memory[key] = (stamp, image, time.monotonic())
+            self._memory_bytes += image.sizeInBytes()
+            while self._memory_bytes > self.memory_limit and len(self._memory) > 1:
+                _, (_, evicted, _) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted.sizeInBytes()
+
+    def _generate(self, source_path, size, cache_file):
+        """원본을 축소 디코딩하여 썸네일 생성 후 디스크 캐시에 저장"""
+        reader = QImageReader(source_path)
+        reader.setAutoTransform(True)
+        original_size = reader.size()
+        if original_size.isValid() and (original_size.width() > size or original_size.height() > size):
+            # JPEG 등은 디코딩 단계에서 축소되므로 전체 해상도로 읽지 않음
+            reader.setScaledSize(original_size.scaled(QSize(size, size), Qt.KeepAspectRatio))
+
+        image = reader.read()
+        if image.isNull():
+            self.logger.warning(f"썸네일 생성 실패: {source_path} ({reader.errorString()})")
+            return None
+        if image.width() > size or image.height() > size:
+            image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_name(f"{cache_file.stem}.{threading.get_ident()}.tmp")
+            if image.save(str(temp_file), "JPG", self.JPEG_QUALITY):
+                os.replace(temp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"썸네일 캐시 저장 실패: {str(e)}")
+        return image
+
+    def get_thumbnail(self, source_path, size=SMALL):
+        """
+        썸네일 QImage 반환 (메모리 -> 디스크 -> 생성 순서, 실패 시 None)
+
+        원본 파일에 접근하므로 GUI 스레드에서는 peek()/request()를 사용합니다.
+        """
+        if not source_path:
+            return None
+        key = (source_path, size)
+        stamp = self._stamp(source_path)
+        if stamp is None:
+            with self._lock:
+                self._failed.add(key)
+            return None
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached and cached[0] == stamp:
+                self._memory[key] = (stamp, cached[1], time.monotonic())
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        cache_file = self._cache_file(source_path, size, stamp)
+        image = QImage(str(cache_file)) if cache_file.exists() else QImage()
+        if image.isNull():
+            image = self._generate(source_path, size, cache_file)
+        if image is None:
+            with self._lock:
+                self._failed.add(key)
+            return None
+
+        self._remember(key, stamp, image)
+        return image
+
+    def get_thumbnail_path(self, source_path, size=SMALL):
+        """디스크 캐시의 썸네일 파일 경로 반환 (없으면 생성, 실패 시 None)"""
+        if self.get_thumbnail(source_path, size) is None:
+            return None
+        stamp = self._stamp(source_path)
+        if stamp is None:
+            return None
+        cache_file = self._cache_file(source_path, size, stamp)
+        return str(cache_file) if cache_file.exists() else None
+
+    def peek_entry(self, source_path, size=SMALL):
+        """
+        메모리에 있는 썸네일의 (stamp, QImage) 반환 (없으면 None, 파일 접근 없음, GUI 스레드용)
+
+        stamp는 썸네일을 만든 원본의 (수정 시각, 크기)이므로 화면 쪽 캐시 키에 포함합니다.
+        마지막 확인 후 REVALIDATE_INTERVAL이 지난 항목은 백그라운드에서 원본 변경 여부를 확인하고,
+        바뀌었으면 새 썸네일을 만든 뒤 thumbnail_ready를 발생시킵니다.
+        """
+        key = (source_path, size)
+        with self._lock:
+            cached = self._memory.get(key)
+            if not cached:
+                return None
+            self._memory.move_to_end(key)
+            stale = time.monotonic() - cached[2] > self.REVALIDATE_INTERVAL
+        if stale:
+            self.request(source_path, size)
+        return cached[0], cached[1]
+
+    def peek(self, source_path, size=SMALL):
+        """메모리에 있는 썸네일만 반환 (파일 접근 없음, GUI 스레드용)"""
+        entry = self.peek_entry(source_path, size)
+        return entry[1] if entry else None
+
+    def peek_path(self, source_path, size=SMALL):
+        """메모리에 있는 썸네일의 디스크 캐시 파일 경로 반환 (원본 파일 접근 없음, GUI 스레드용)"""
+        entry = self.peek_entry(source_path, size)
+        if entry is None:
+            return None
+        cache_file = self._cache_file(source_path, size, entry[0])
+        return str(cache_file) if cache_file.exists() else None
+
+    def is_failed(self, source_path, size=SMALL):
+        """썸네일 생성에 실패한 경로인지 확인"""
+        with self._lock:
+            return (source_path, size) in self._failed
+
+    def request(self, source_path, size=SMALL):
+        """백그라운드에서 썸네일 준비 (완료 시 thumbnail_ready 발생, 중복 요청 무시)"""
+        key = (source_path, size)
+        with self._lock:
+            if not source_path or key in self._pending or key in self._failed:
+                return
+            self._pending.add(key)
+        self.thread_pool.start(ThumbnailTask(self, source_path, size))
+
+    def _finish_request(self, source_path, size):
+        with self._lock:
+            self._pending.discard((source_path, size))
+        self.thumbnail_ready.emit(source_path, size)
+
+    def reset_failures(self):
+        """실패 기록 초기화 (새로고침 시 다시 시도)"""
+        with self._lock:
+            self._failed.clear()
+
+    def clear_memory(self):
+        """메모리 캐시 비우기"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def get_statistics(self):
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "memory_items": len(self._memory),
+                "memory_mb": round(self._memory_bytes / (1024 * 1024), 2),
+                "memory_limit_mb": self.memory_limit // (1024 * 1024),
+                "hits": self.hits,
+                "misses": self.misses
+            }
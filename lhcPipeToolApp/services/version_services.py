@@ -5,6 +5,7 @@ class ShotVersionService(BaseVersionService):
     def __init__(self, version_model, worker_service):
         super().__init__(version_model, worker_service)
         self.table_name = "VERSIONS"
+        self.item_type = "shot"
         
     def get_foreign_key(self):
         return "shot_id"
@@ -13,6 +14,7 @@ class SequenceVersionService(BaseVersionService):
     def __init__(self, version_model, worker_service):
         super().__init__(version_model, worker_service)
         self.table_name = "SEQUENCE_VERSIONS"
+        self.item_type = "sequence"
         
     def get_foreign_key(self):
         return "sequence_id"
@@ -21,6 +23,7 @@ class ProjectVersionService(BaseVersionService):
     def __init__(self, version_model, worker_service):
         super().__init__(version_model, worker_service)
         self.table_name = "PROJECT_VERSIONS"
+        self.item_type = "project"
         
     def get_foreign_key(self):
         return "project_id"
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""백그라운드 데이터 로더"""
+import itertools
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from ..utils.logger import setup_logger
+
+class LoaderSignals(QObject):
+    """작업 스레드 -> GUI 스레드 결과 전달용 시그널"""
+    finished = Signal(str, int, object)   # key, request_id, result
+    failed = Signal(str, int, str)        # key, request_id, error message
+
+class LoadTask(QRunnable):
+    """서비스 호출을 작업 스레드에서 실행하는 QRunnable"""
+
+    def __init__(self, key, request_id, func, args, kwargs, signals, db_connector=None):
+        super().__init__()
+        self.key = key
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.db_connector = db_connector
+
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+            self.signals.finished.emit(self.key, self.request_id, result)
+        except Exception as e:
+            self.signals.failed.emit(self.key, self.request_id, str(e))
+        finally:
+            # 스레드 풀의 스레드는 재사용되므로 임대한 DB 커넥션은 작업마다 반납
+            if self.db_connector:
+                self.db_connector.release()
+
+class DataLoader(QObject):
+    """
+    QThreadPool 기반 데이터 로더
+
+    같은 key로 새 요청이 들어오면 이전 요청은 취소됩니다. 아직 시작되지 않은 작업은
+    스레드 풀에서 제거하고, 이미 실행 중인 작업의 결과는 도착해도 버립니다.
+    결과 콜백은 항상 GUI 스레드에서 호출됩니다.
+
+    Example:
+        loader.load("versions", service.get_all_versions, item_id,
+                    on_result=self.populate_versions)
+    """
+
+    def __init__(self, db_connector=None, max_threads=2, parent=None):
+        super().__init__(parent)
+        self.db_connector = db_connector
+        self.logger = setup_logger(__name__)
+        self.thread_pool = QThreadPool(self)
+        # DB 커넥션 풀 크기를 넘지 않도록 동시 작업 수 제한
+        self.thread_pool.setMaxThreadCount(max_threads)
+
+        self.signals = LoaderSignals()
+        self.signals.finished.connect(self._handle_finished)
+        self.signals.failed.connect(self._handle_failed)
+
+        self._request_ids = itertools.count(1)
+        self._pending = {}   # key -> (request_id, task, on_result, on_error)
+
+    def load(self, key, func, *args, on_result=None, on_error=None, **kwargs):
+        """func(*args, **kwargs)를 백그라운드에서 실행 (같은 key의 이전 요청은 취소)"""
+        self.cancel(key)
+
+        request_id = next(self._request_ids)
+        task = LoadTask(key, request_id, func, args, kwargs, self.signals, self.db_connector)
+        self._pending[key] = (request_id, task, on_result, on_error)
+        self.thread_pool.start(task)
+        return request_id
+
+    def cancel(self, key):
+        """key의 대기 중인 요청 취소"""
+        pending = self._pending.pop(key, None)
+        if pending and self.thread_pool.tryTake(pending[1]):
+            self.logger.debug(f"대기 중인 요청 취소 - key: {key}, request: {pending[0]}")
+
+    def is_loading(self, key):
+        """key의 요청이 진행 중인지 확인"""
+        return key in self._pending
+
+    def _take_pending(self, key, request_id):
+        """현재 유효한 요청이면 대기 목록에서 꺼내 반환 (오래된 요청이면 None)"""
+        pending = self._pending.get(key)
+        if not pending or pending[0] != request_id:
+            self.logger.debug(f"오래된 요청 결과 무시 - key: {key}, request: {request_id}")
+            return None
+        del self._pending[key]
+        return pending
+
+    def _handle_finished(self, key, request_id, result):
+        pending = self._take_pending(key, request_id)
+        if pending and pending[2]:
+            pending[2](result)
+
+    def _handle_failed(self, key, request_id, error):
+        pending = self._take_pending(key, request_id)
+        if not pending:
+            return
+        self.logger.error(f"백그라운드 로드 실패 - key: {key}, 오류: {error}")
+        if pending[3]:
+            pending[3](error)
+
+    def wait_for_done(self, msecs=-1):
+        """실행 중인 작업이 끝날 때까지 대기 (종료 시 호출)"""
+        self._pending.clear()
+        return self.thread_pool.waitForDone(msecs)
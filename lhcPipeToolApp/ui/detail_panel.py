@@ -8,7 +8,9 @@ from PySide6.QtCore import Qt, QEvent
 from PySide6.QtGui import QPixmap
 from ..utils.logger import setup_logger
 from ..utils.db_utils import convert_date_format
+from ..utils.sequence_utils import format_frame_ranges
 from ..config.app_state import AppState
+from ..services.thumbnail_service import ThumbnailService
 from ..styles.components import (
     get_input_style, get_button_style, get_frame_style, get_label_style
 )
@@ -45,11 +47,13 @@ class AspectRatioWidget(QWidget):
             self.widget.setGeometry(0, (height - target_height) // 2, width, target_height)
 
 class DetailPanel(QWidget):
-    def __init__(self, project_service, version_services):
+    def __init__(self, project_service, version_services, data_loader=None):
         super().__init__()
         self.logger = setup_logger(__name__)
         self.project_service = project_service
         self.version_services = version_services
+        self.data_loader = data_loader  # 없으면 GUI 스레드에서 바로 조회
+        self.thumbnail_service = ThumbnailService.instance()
         self.app_state = AppState()
         # 각 타입별 필요한 필드 정의
         self.type_field_configs = {
@@ -85,7 +89,8 @@ class DetailPanel(QWidget):
                 '생성일': {'type': 'line'},
                 '경로': {'type': 'line', 'buttons': ['복사', '열기']},
                 '렌더 경로': {'type': 'line', 'buttons': ['복사', '열기']},
-                '프리뷰 경로': {'type': 'line', 'buttons': ['복사', '열기']}
+                '프리뷰 경로': {'type': 'line', 'buttons': ['복사', '열기']},
+                '파일': {'type': 'line'}
             }
         }
         
@@ -231,18 +236,64 @@ class DetailPanel(QWidget):
 
     def _show_item_details_base(self, item_type, item_id, get_details_func):
         """아이템 상세 정보 표시를 위한 기본 메서드"""
+        # version 타입의 특별한 처리
+        if item_type == 'version' and item_id == -1:
+            self.logger.debug("버전 선택 안됨")
+            return
+
+        self._load_details(
+            self._fetch_item_details, item_type, item_id, get_details_func,
+            on_result=lambda result: self._apply_item_details(item_type, item_id, result)
+        )
+
+    def _load_details(self, func, *args, on_result):
+        """상세 정보 조회 (data_loader가 있으면 백그라운드에서 조회하고 이전 요청 결과는 버림)"""
+        if self.data_loader:
+            self.data_loader.load("details", func, *args, on_result=on_result,
+                                  on_error=lambda error: self.clear_item_details())
+            return
         try:
-            # version 타입의 특별한 처리
-            if item_type == 'version' and item_id == -1:
-                self.logger.debug("버전 선택 안됨")
-                return
+            on_result(func(*args))
+        except Exception as e:
+            self.logger.error(f"상세 정보 조회 실패: {str(e)}", exc_info=True)
+            self.clear_item_details()
+
+    def _fetch_item_details(self, item_type, item_id, get_details_func):
+        """아이템 상세 정보와 프리뷰 조회 (작업 스레드에서 실행 가능)"""
+        item = get_details_func(item_id)
+        if not item:
+            return None
+
+        # 프리뷰 경로 가져오기
+        preview_path = None
+        if item_type in ['project', 'sequence', 'shot']:
+            # 최신 버전의 프리뷰 경로 가져오기
+            latest_version = self.version_services[item_type].get_latest_version(item_id)
+            if latest_version:
+                preview_path = latest_version.get('preview_path')
+                self.logger.debug(f"최신 버전({latest_version.get('name')})의 프리뷰 경로: {preview_path}")
+        else:
+            # version 타입인 경우 직접 프리뷰 경로 사용
+            preview_path = item.get('preview_path')
+
+        return {
+            'item': item,
+            'preview_path': preview_path,
+            'preview_image': self._load_preview_image(preview_path)
+        }
+
+    def _load_preview_image(self, preview_path):
+        """프리뷰 이미지 로드 (원본 대신 썸네일 캐시의 LARGE 썸네일 사용)"""
+        return self.thumbnail_service.get_thumbnail(preview_path, ThumbnailService.LARGE)
 
-            # 데이터 로드
-            item = get_details_func(item_id)
-            if not item:
+    def _apply_item_details(self, item_type, item_id, result):
+        """조회된 아이템 상세 정보를 화면에 표시"""
+        try:
+            if not result:
                 self.logger.warning(f"{item_type} 정보를 찾을 수 없음 - id: {item_id}")
                 self.clear_item_details()
                 return
+            item = result['item']
 
             # 모든 필드 숨기기
             for type_fields in self.type_fields.values():
@@ -257,31 +308,24 @@ class DetailPanel(QWidget):
             fields_data = self._get_fields_data(item_type, item)
             self._update_fields_data(item_type, fields_data)
 
-            # 프리뷰 경로 가져오기
-            preview_path = None
-            if item_type in ['project', 'sequence', 'shot']:
-                # 최신 버전의 프리뷰 경로 가져오기
-                latest_version = self.version_services[item_type].get_latest_version(item_id)
-                if latest_version:
-                    preview_path = latest_version.get('preview_path')
-                    self.logger.debug(f"최신 버전({latest_version.get('name')})의 프리뷰 경로: {preview_path}")
-            else:
-                # version 타입인 경우 직접 프리뷰 경로 사용
-                preview_path = item.get('preview_path')
-            if preview_path and os.path.exists(preview_path):
-                self._show_preview(preview_path)
-                self.logger.debug(f"프리뷰 이미지 표시됨: {preview_path}")
-            else:
-                self.preview_label.clear()
-                self.preview_label.setPixmap(QPixmap())
-                self.original_pixmap = None
-                self.preview_label.setText("프리뷰 없음")
-                self.logger.debug("프리뷰 이미지 없음")
+            self._apply_preview(result['preview_path'], result['preview_image'])
 
         except Exception as e:
             self.logger.error(f"{item_type} 상세 정보 표시 실패: {str(e)}", exc_info=True)
             self.clear_item_details()
 
+    def _apply_preview(self, preview_path, preview_image):
+        """조회된 프리뷰 이미지 표시 (없으면 안내 문구 표시)"""
+        if preview_image is not None:
+            self._show_preview(preview_path, preview_image)
+            self.logger.debug(f"프리뷰 이미지 표시됨: {preview_path}")
+        else:
+            self.preview_label.clear()
+            self.preview_label.setPixmap(QPixmap())
+            self.original_pixmap = None
+            self.preview_label.setText("프리뷰 없음")
+            self.logger.debug("프리뷰 이미지 없음")
+
     def _get_fields_data(self, item_type, item):
         """아이템 타입별 필드 데이터 구성"""
         if item_type == 'project':
@@ -320,26 +364,51 @@ class DetailPanel(QWidget):
                 '상태': item.get('status', ''),
                 '경로': item.get('file_path', ''),
                 '렌더 경로': item.get('render_path', ''),
-                '프리뷰 경로': item.get('preview_path', '')
+                '프리뷰 경로': item.get('preview_path', ''),
+                '파일': item.get('file_summary', '')
             }
 
     def _show_version_fields(self, version_id):
         """버전 필드 표시"""
-        try:
-            self.logger.debug(f"버전 상세 정보 표시 시작 - version_id: {version_id}")
-            
-            if version_id == -1:
-                self.logger.debug("버전 선택 안됨")
-                return
+        self.logger.debug(f"버전 상세 정보 표시 시작 - version_id: {version_id}")
+
+        if version_id == -1:
+            self.logger.debug("버전 선택 안됨")
+            return
+
+        self._load_details(
+            self._fetch_version_details, self.app_state.current_item_type, version_id,
+            on_result=lambda result: self._apply_version_fields(version_id, result)
+        )
+
+    def _fetch_version_details(self, item_type, version_id):
+        """버전 상세 정보와 프리뷰 조회 (작업 스레드에서 실행 가능)"""
+        version_service = self.version_services[item_type]
+        version = version_service.get_version_details(version_id)
+        if not version:
+            return None
+        # 파일 수/크기/누락 프레임은 공유 폴더 대신 버전 파일 목록(VERSION_FILES)에서 조회
+        summary = version_service.get_version_file_summaries([version_id]).get(version_id)
+        if summary:
+            version['file_summary'] = self._format_file_summary(
+                summary, version_service.get_missing_frames(version_id)
+            )
+        preview_path = version.get('preview_path')
+        return {
+            'item': version,
+            'preview_path': preview_path,
+            'preview_image': self._load_preview_image(preview_path)
+        }
 
-            # 버전 데이터 로드
-            version = self.version_services[self.app_state.current_item_type].get_version_details(version_id)
-            self.logger.debug(f"로드된 버전 데이터: {version}")
-            
-            if not version:
+    def _apply_version_fields(self, version_id, result):
+        """조회된 버전 상세 정보를 화면에 표시"""
+        try:
+            if not result:
                 self.logger.warning(f"버전 정보를 찾을 수 없음 - version_id: {version_id}")
                 self.clear_item_details()
                 return
+            version = result['item']
+            self.logger.debug(f"로드된 버전 데이터: {version}")
 
             # 필드 데이터 업데이트 전에 모든 필드 숨기기
             for type_fields in self.type_fields.values():
@@ -366,21 +435,41 @@ class DetailPanel(QWidget):
                     self.logger.debug(f"필드 '{field_name}' 업데이트됨: {value}")
 
             # 프리뷰 표시
-            preview_path = version.get('preview_path')
-            if preview_path and os.path.exists(preview_path):
-                self._show_preview(preview_path)
-                self.logger.debug(f"프리뷰 이미지 표시됨: {preview_path}")
-            else:
-                self.preview_label.clear()
-                self.preview_label.setPixmap(QPixmap())
-                self.original_pixmap = None
-                self.preview_label.setText("프리뷰 없음")
-                self.logger.debug("프리뷰 이미지 없음")
+            self._apply_preview(result['preview_path'], result['preview_image'])
 
         except Exception as e:
             self.logger.error(f"버전 상세 정보 표시 실패: {str(e)}", exc_info=True)
             self.clear_item_details()
 
+    def _format_file_summary(self, summary, missing_frames):
+        """
+        버전 파일 요약 문자열
+
+        예: 120개, 3.4 GB, 1001-1120, 누락: 1050-1052
+            240개, 6.8 GB, beauty.####.exr 1001-1120, depth.####.exr 1001-1120 (누락: 1050-1052)
+        """
+        size = float(summary['total_size'] or 0)
+        for unit in ['B', 'KB', 'MB', 'GB']:
+            if size < 1024:
+                break
+            size /= 1024
+        else:
+            unit = 'TB'
+        parts = [f"{summary['file_count']}개", f"{size:.1f} {unit}"]
+        sequences = summary['sequences']
+        for sequence in sequences:
+            frame_range = f"{sequence['first_frame']}-{sequence['last_frame']}"
+            gaps = missing_frames.get(sequence['sequence_key'])
+            if len(sequences) == 1:
+                parts.append(frame_range)
+                if gaps:
+                    parts.append(f"누락: {format_frame_ranges(gaps)}")
+            else:
+                # 시퀀스(패스)가 여러 개면 시퀀스마다 범위와 누락 표시
+                missing = f" (누락: {format_frame_ranges(gaps)})" if gaps else ""
+                parts.append(f"{sequence['sequence_key'] or ''} {frame_range}{missing}".strip())
+        return ", ".join(parts)
+
     def _update_fields_data(self, item_type, fields_data):
         """필드 데이터 업데이트"""
         if item_type in self.type_fields:
@@ -392,11 +481,14 @@ class DetailPanel(QWidget):
                     else:
                         field_widget.setText(str(value))
 
-    def _show_preview(self, preview_path):
+    def _show_preview(self, preview_path, preview_image=None):
         """프리뷰 이미지 표시 헬퍼 메서드"""
         try:
-            # 원본 이미지 로드 및 저장
-            self.original_pixmap = QPixmap(preview_path)
+            # 원본 이미지 로드 및 저장 (미리 로드된 이미지가 있으면 사용)
+            if preview_image is not None:
+                self.original_pixmap = QPixmap.fromImage(preview_image)
+            else:
+                self.original_pixmap = QPixmap(preview_path)
             if not self.original_pixmap.isNull():
                 self._update_preview_size()
                 self.preview_label.setAlignment(Qt.AlignCenter)
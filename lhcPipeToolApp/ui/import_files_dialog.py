@@ -1,18 +1,130 @@
 """파일 임포트 다이얼로그"""
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                               QPushButton, QListWidget, QListWidgetItem,
-                              QLabel, QMessageBox, QFileDialog)
-from PySide6.QtCore import Qt
-import shutil
+                              QLabel, QMessageBox, QFileDialog, QProgressBar)
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QBrush, QColor
+import asyncio
+import os
+import threading
+import time
 from pathlib import Path
+from ..handlers.copy_scheduler import copy_scheduler
+from ..utils.directory_scanner import directory_scanner
+from ..utils.sequence_utils import sequence_index
 from ..utils.logger import setup_logger
 
+class ImportSignals(QObject):
+    """작업 스레드 -> GUI 스레드 임포트 진행 상황 전달용 시그널"""
+    progress = Signal(int, int, object, object, float)    # 완료 파일 수, 전체 파일 수, 복사 bytes, 전체 bytes, bytes/s
+    file_finished = Signal(str, bool)               # source, 성공 여부
+    finished = Signal(bool)                         # 취소 여부
+
+class ImportTask(QRunnable):
+    """
+    파일 임포트를 작업 스레드의 이벤트 루프에서 실행
+
+    복사는 공유 복사 스케줄러를 거치므로 동시 복사 수가 제한되고, 실패한 파일은
+    전체를 중단하지 않고 file_finished로 파일별로 알립니다.
+    진행률은 PROGRESS_INTERVAL 간격으로 묶어서 전달합니다.
+    """
+
+    PROGRESS_INTERVAL = 0.2
+
+    def __init__(self, files, version_dir, signals):
+        super().__init__()
+        self.files = files              # [(source, destination)]
+        self.version_dir = version_dir
+        self.signals = signals
+        self.logger = setup_logger(__name__)
+        self._loop = None
+        self._main_task = None
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """임포트 취소 (진행 중인 복사는 다음 청크에서 중단)"""
+        self._cancelled.set()
+        if self._loop and self._main_task:
+            self._loop.call_soon_threadsafe(self._main_task.cancel)
+
+    def run(self):
+        cancelled = False
+        try:
+            asyncio.run(self._run())
+        except asyncio.CancelledError:
+            cancelled = True
+        except Exception as e:
+            self.logger.error(f"파일 임포트 실패: {str(e)}", exc_info=True)
+        self.signals.finished.emit(cancelled or self._cancelled.is_set())
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+        if self._cancelled.is_set():
+            raise asyncio.CancelledError()
+
+        await asyncio.to_thread(os.makedirs, self.version_dir, exist_ok=True)
+
+        sizes = {}
+        for source, _ in self.files:
+            try:
+                sizes[source] = os.path.getsize(source)
+            except OSError:
+                sizes[source] = 0
+        total_bytes = [sum(sizes.values())]
+        copied = dict.fromkeys(sizes, 0)
+        completed = [0]
+        start_time = time.monotonic()
+        last_report = [0.0]
+
+        def report(force=False):
+            now = time.monotonic()
+            if not force and now - last_report[0] < self.PROGRESS_INTERVAL:
+                return
+            last_report[0] = now
+            copied_bytes = sum(copied.values())
+            speed = copied_bytes / max(now - start_time, 1e-6)
+            self.signals.progress.emit(completed[0], len(self.files), copied_bytes, total_bytes[0], speed)
+
+        def on_progress(source, progress):
+            copied[source] = int(sizes[source] * progress / 100)
+            report()
+
+        async def copy_one(source, destination):
+            try:
+                success = await copy_scheduler.copy(
+                    source, destination, lambda progress: on_progress(source, progress)
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"파일 복사 실패 ({source}): {str(e)}")
+                success = False
+            copied[source] = sizes[source] if success else 0
+            if not success:
+                # 실패한 파일은 남은 양에서 제외하여 진행률/남은 시간에 반영
+                total_bytes[0] -= sizes[source]
+            completed[0] += 1
+            self.signals.file_finished.emit(source, success)
+            report(force=True)
+
+        self.logger.debug(f"파일 복사 시작: {len(self.files)}개 -> {self.version_dir}")
+        await asyncio.gather(*(copy_one(source, destination) for source, destination in self.files))
+
 class ImportFilesDialog(QDialog):
     def __init__(self, version_service, shot_id, parent=None):
         super().__init__(parent)
         self.version_service = version_service
         self.shot_id = shot_id
         self.selected_files = []
+        self.import_task = None
+        self.import_signals = ImportSignals()
+        self.import_signals.progress.connect(self.on_import_progress)
+        self.import_signals.file_finished.connect(self.on_file_finished)
+        self.import_signals.finished.connect(self.on_import_finished)
+        self._source_items = {}    # source -> QListWidgetItem
+        self._failed_sources = []
+        self._version_num = None
         self.logger = setup_logger(__name__)
         self.logger.info(f"ImportFilesDialog 초기화 - Shot ID: {shot_id}")
         self.setup_ui()
@@ -30,30 +142,39 @@ class ImportFilesDialog(QDialog):
         # 버튼들
         button_layout = QHBoxLayout()
         
-        add_files_button = QPushButton("Add Files")
-        add_files_button.clicked.connect(self.add_files)
-        button_layout.addWidget(add_files_button)
+        self.add_files_button = QPushButton("Add Files")
+        self.add_files_button.clicked.connect(self.add_files)
+        button_layout.addWidget(self.add_files_button)
         
-        add_folder_button = QPushButton("Add Folder")
-        add_folder_button.clicked.connect(self.add_folder)
-        button_layout.addWidget(add_folder_button)
+        self.add_folder_button = QPushButton("Add Folder")
+        self.add_folder_button.clicked.connect(self.add_folder)
+        button_layout.addWidget(self.add_folder_button)
         
-        remove_button = QPushButton("Remove Selected")
-        remove_button.clicked.connect(self.remove_selected)
-        button_layout.addWidget(remove_button)
+        self.remove_button = QPushButton("Remove Selected")
+        self.remove_button.clicked.connect(self.remove_selected)
+        button_layout.addWidget(self.remove_button)
         
         layout.addLayout(button_layout)
         
+        # 임포트 진행률 (파일 수, 처리량, 남은 시간)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        self.progress_label = QLabel()
+        self.progress_label.setVisible(False)
+        layout.addWidget(self.progress_label)
+        
         # 임포트/취소 버튼
         final_button_layout = QHBoxLayout()
         
-        import_button = QPushButton("Import")
-        import_button.clicked.connect(self.import_files)
-        final_button_layout.addWidget(import_button)
+        self.import_button = QPushButton("Import")
+        self.import_button.clicked.connect(self.import_files)
+        final_button_layout.addWidget(self.import_button)
         
-        cancel_button = QPushButton("Cancel")
-        cancel_button.clicked.connect(self.reject)
-        final_button_layout.addWidget(cancel_button)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        final_button_layout.addWidget(self.cancel_button)
         
         layout.addLayout(final_button_layout)
         
@@ -80,18 +201,33 @@ class ImportFilesDialog(QDialog):
         )
         
         if folder:
-            folder_path = Path(folder)
-            self.logger.info(f"선택된 폴더: {folder_path}")
-            for file_path in folder_path.rglob("*"):
-                if file_path.is_file():
-                    self.logger.debug(f"파일 추가: {file_path}")
-                    self.add_to_list(file_path)
+            self.logger.info(f"선택된 폴더: {folder}")
+            # 하위 폴더까지 조회하되 시퀀스는 폴더별로 한 항목으로 묶어서 추가
+            pending = [folder]
+            while pending:
+                directory = pending.pop()
+                pending.extend(entry.path for entry in directory_scanner.scan(directory) if entry.is_dir)
+                sequences, files = sequence_index.index(directory)
+                for sequence in sequences:
+                    if len(sequence.frames) == 1:
+                        self.add_to_list(Path(sequence.entries[0].path))
+                    else:
+                        self.add_sequence_to_list(sequence)
+                for entry in files:
+                    self.add_to_list(Path(entry.path))
                     
     def add_to_list(self, file_path):
         """리스트에 파일 추가"""
         item = QListWidgetItem(str(file_path))
         item.setData(Qt.UserRole, str(file_path))
         self.file_list.addItem(item)
+
+    def add_sequence_to_list(self, sequence):
+        """리스트에 시퀀스 추가 (프레임 파일 경로 목록을 항목 하나에 저장)"""
+        self.logger.debug(f"시퀀스 추가: {sequence.spec} ({len(sequence.frames)} frames)")
+        item = QListWidgetItem(os.path.join(sequence.directory, sequence.display_name))
+        item.setData(Qt.UserRole, sequence.paths)
+        self.file_list.addItem(item)
         
     def remove_selected(self):
         """선택된 항목 제거"""
@@ -99,7 +235,7 @@ class ImportFilesDialog(QDialog):
             self.file_list.takeItem(self.file_list.row(item))
             
     def import_files(self):
-        """선택된 파일들 임포트"""
+        """선택된 파일들 임포트 (작업 스레드에서 복사하고 진행률 표시)"""
         if self.file_list.count() == 0:
             self.logger.warning("임포트할 파일이 선택되지 않음")
             QMessageBox.warning(
@@ -114,22 +250,25 @@ class ImportFilesDialog(QDialog):
             render_root = Path(self.version_service.get_render_root())
             version_dir = render_root / f"shot_{self.shot_id}" / f"v{version_num:03d}"
             self.logger.info(f"새 버전 디렉토리 생성: {version_dir}")
-            version_dir.mkdir(parents=True, exist_ok=True)
             
+            files_to_copy = []
+            self._source_items.clear()
+            self._failed_sources = []
             for i in range(self.file_list.count()):
                 item = self.file_list.item(i)
-                source_path = Path(item.data(Qt.UserRole))
-                dest_path = version_dir / source_path.name
-                self.logger.debug(f"파일 복사: {source_path} -> {dest_path}")
-                shutil.copy2(source_path, dest_path)
-                
-            self.logger.info(f"파일 임포트 완료 - 버전: v{version_num:03d}")
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Successfully imported files to version v{version_num:03d}"
-            )
-            self.accept()
+                item.setForeground(QBrush())
+                item.setToolTip("")
+                sources = item.data(Qt.UserRole)
+                for source in (sources if isinstance(sources, list) else [sources]):
+                    source_path = Path(source)
+                    dest_path = version_dir / source_path.name
+                    files_to_copy.append((str(source_path), str(dest_path)))
+                    self._source_items[str(source_path)] = item
+
+            self._version_num = version_num
+            self.set_importing(True)
+            self.import_task = ImportTask(files_to_copy, str(version_dir), self.import_signals)
+            QThreadPool.globalInstance().start(self.import_task)
             
         except Exception as e:
             self.logger.error(f"파일 임포트 실패: {str(e)}", exc_info=True)
@@ -137,4 +276,78 @@ class ImportFilesDialog(QDialog):
                 self,
                 "Error",
                 f"Failed to import files: {e}"
-            )
\ No newline at end of file
+            )
+
+    def set_importing(self, importing):
+        """임포트 중에는 목록 편집을 막고 취소 버튼을 임포트 취소로 사용"""
+        for button in (self.add_files_button, self.add_folder_button, self.remove_button, self.import_button):
+            button.setEnabled(not importing)
+        self.cancel_button.setText("Cancel Import" if importing else "Cancel")
+        self.cancel_button.setEnabled(True)
+        if importing:
+            self.progress_bar.setValue(0)
+            self.progress_label.setText("Preparing...")
+        self.progress_bar.setVisible(importing or bool(self._failed_sources))
+        self.progress_label.setVisible(importing or bool(self._failed_sources))
+
+    def on_import_progress(self, completed, total, copied_bytes, total_bytes, speed):
+        """진행률, 처리량, 남은 시간 표시"""
+        self.progress_bar.setValue(int(copied_bytes / total_bytes * 1000) if total_bytes else 0)
+        remaining = (total_bytes - copied_bytes) / speed if speed > 0 else 0
+        minutes, seconds = divmod(int(remaining), 60)
+        self.progress_label.setText(
+            f"{completed}/{total} files | "
+            f"{copied_bytes / (1024 * 1024):.1f}/{total_bytes / (1024 * 1024):.1f} MB | "
+            f"{speed / (1024 * 1024):.1f} MB/s | ETA {minutes:02d}:{seconds:02d}"
+        )
+
+    def on_file_finished(self, source, success):
+        """실패한 파일은 목록 항목에 표시 (전체 임포트는 계속 진행)"""
+        if success:
+            return
+        self._failed_sources.append(source)
+        item = self._source_items.get(source)
+        if item is not None:
+            item.setForeground(QBrush(QColor("red")))
+            tooltip = item.toolTip()
+            item.setToolTip(f"{tooltip}\n{source}" if tooltip else f"Failed: {source}")
+
+    def on_import_finished(self, cancelled):
+        self.import_task = None
+        self.set_importing(False)
+        version = f"v{self._version_num:03d}"
+
+        if cancelled:
+            self.logger.info(f"파일 임포트 취소 - 버전: {version}")
+            self.progress_label.setText("Import cancelled")
+            self.progress_label.setVisible(True)
+            return
+
+        if self._failed_sources:
+            self.logger.error(f"파일 임포트 일부 실패 - 버전: {version}, 실패: {len(self._failed_sources)}개")
+            self.progress_label.setText(f"{len(self._failed_sources)} file(s) failed")
+            QMessageBox.warning(
+                self,
+                "Import Incomplete",
+                f"{len(self._failed_sources)} file(s) failed to import to version {version}:\n"
+                + "\n".join(Path(source).name for source in self._failed_sources[:10])
+                + ("\n..." if len(self._failed_sources) > 10 else "")
+            )
+            return
+
+        self.logger.info(f"파일 임포트 완료 - 버전: {version}")
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Successfully imported files to version {version}"
+        )
+        self.accept()
+
+    def reject(self):
+        """임포트 중이면 임포트만 취소하고, 아니면 다이얼로그 닫기"""
+        if self.import_task:
+            self.logger.info("파일 임포트 취소 요청")
+            self.cancel_button.setEnabled(False)
+            self.import_task.cancel()
+            return
+        super().reject()
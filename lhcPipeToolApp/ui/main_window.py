@@ -22,12 +22,14 @@ from ..services.refresh_service import RefreshService
 from ..services.database_service import DatabaseService
 from ..services.version_services import (ShotVersionService, SequenceVersionService, ProjectVersionService)
 from ..services.settings_service import SettingsService
+from ..services.preview_queue_service import PreviewQueueService
 
 from ..database.table_manager import TableManager
 from ..utils.logger import setup_logger
 from ..utils.decorators import require_admin
 from ..config.app_state import AppState
 from ..styles.components import get_toolbar_style
+from .data_loader import DataLoader
 
 class MainWindow(QMainWindow):
     def __init__(self, db_connector):
@@ -89,6 +91,12 @@ class MainWindow(QMainWindow):
         # self.settings_service 초기화
         self.settings_service = SettingsService(db_connector)
         
+        # 백그라운드 데이터 로더 (커넥션 풀에서 로더 몫으로 계산된 스레드 수만 사용)
+        self.data_loader = DataLoader(db_connector, max_threads=db_connector.config.loader_threads, parent=self)
+
+        # 전송 모니터 (처음 열 때 생성)
+        self.transfer_monitor_dialog = None
+
         self.table_manager.initialize_settings()
         self.init_ui()
         self.setup_menu()
@@ -166,15 +174,19 @@ class MainWindow(QMainWindow):
         splitter.setStretchFactor(1, 2)  # 상세 정보 패널
         
         # 프로젝트 트리
-        self.project_tree = ProjectTreeWidget(self.project_service, self.version_services, self.settings_service)
+        self.project_tree = ProjectTreeWidget(
+            self.project_service, self.version_services, self.settings_service, self.data_loader
+        )
         splitter.addWidget(self.project_tree)
         
         # 버전 테이블
-        self.version_table = VersionTableWidget(self.version_services, self.settings_service, self.project_tree)
+        self.version_table = VersionTableWidget(
+            self.version_services, self.settings_service, self.project_tree, self.data_loader
+        )
         splitter.addWidget(self.version_table)
         
         # 상세 정보 패널
-        self.detail_panel = DetailPanel(self.project_service, self.version_services)
+        self.detail_panel = DetailPanel(self.project_service, self.version_services, self.data_loader)
         splitter.addWidget(self.detail_panel)
         
         # 메인 윈도우 스타일 수정
@@ -229,6 +241,8 @@ class MainWindow(QMainWindow):
         manager_menu = menubar.addMenu('관리자')
         render_manager_action = manager_menu.addAction('렌더 관리자')
         render_manager_action.triggered.connect(self.show_render_manager)
+        transfer_monitor_action = manager_menu.addAction('전송 모니터')
+        transfer_monitor_action.triggered.connect(self.show_transfer_monitor)
         manage_workers_action = manager_menu.addAction('작업자 관리자')
         manage_workers_action.triggered.connect(self.show_worker_manager)
         table_manager_action = manager_menu.addAction('테이블 관리자')
@@ -287,6 +301,15 @@ class MainWindow(QMainWindow):
         )
         dialog.exec_()
 
+    def show_transfer_monitor(self):
+        """전송 모니터 다이얼로그 (모달이 아니므로 작업 중에도 열어둘 수 있음)"""
+        if self.transfer_monitor_dialog is None:
+            from .transfer_monitor_dialog import TransferMonitorDialog
+            self.transfer_monitor_dialog = TransferMonitorDialog(self)
+        self.transfer_monitor_dialog.show()
+        self.transfer_monitor_dialog.raise_()
+        self.transfer_monitor_dialog.activateWindow()
+
     def show_settings_dialog(self):
         """설정 다이얼로그"""
         from .settings_dialog import SettingsDialog
@@ -344,6 +367,12 @@ class MainWindow(QMainWindow):
         """아이템 타입 변경 처리"""
         self.detail_panel.show_item_details(item_type, item_id)
 
+    def closeEvent(self, event):
+        """종료 시 실행 중인 백그라운드 조회가 끝날 때까지 대기하고 프리뷰 작업 취소"""
+        self.data_loader.wait_for_done()
+        PreviewQueueService.instance().shutdown()
+        super().closeEvent(event)
+
     def update_login_info(self):
         """로그인 정보 업데이트"""
         user = self.app_state.current_worker
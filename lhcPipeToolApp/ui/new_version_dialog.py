@@ -9,8 +9,9 @@ from PySide6.QtGui import QIcon
 
 from ..config.app_state import AppState
 from ..utils.logger import setup_logger
-from ..utils.preview_generator import PreviewGenerator
 from ..services.file_manage_service import FileManageService
+from ..services.preview_queue_service import PreviewQueueService
+from ..utils.sequence_utils import is_sequence_spec, sequence_index
 from ..styles.components import get_dialog_style, get_button_style
 
 class NewVersionDialog(QDialog):
@@ -20,7 +21,7 @@ class NewVersionDialog(QDialog):
         self.item_type = item_type
         self.app_state = AppState()
         self.logger = setup_logger(__name__)
-        self.preview_generator = PreviewGenerator()
+        self.preview_queue = PreviewQueueService.instance()
         self.settings = QSettings('LHC', 'PipeTool')
         self.project_tree = project_tree
         self.version_services = version_services
@@ -290,38 +291,65 @@ class NewVersionDialog(QDialog):
             QMessageBox.warning(self, "경고", "파일을 선택해주세요!")
             return False
             
-        if not os.path.exists(source_file):
+        # 시퀀스 경로(%04d, ####, $F4)는 시퀀스 색인에서 프레임 파일 확인
+        is_sequence = is_sequence_spec(source_file)
+        if not (sequence_index.find_sequence(source_file) if is_sequence else os.path.exists(source_file)):
             QMessageBox.warning(self, "경고", "선택한 파일이 존재하지 않습니다!")
             return False
 
         try:
             # 파일 처리 (비동기)
-            file_info = await self.file_manager.process_version_file(
-                source_file,
-                self.item_type,
-                self.item_id
-            )
+            if is_sequence:
+                result = await self.file_manager.create_version(self.item_type, self.item_id, [source_file])
+                files = result['files']
+                version_number = result['version_number']
+                # 버전의 파일 경로는 버전 폴더 안의 시퀀스 경로
+                file_path = os.path.join(
+                    os.path.dirname(files[0]['file_path']), os.path.basename(source_file)
+                ).replace('\\', '/')
+            else:
+                file_info = await self.file_manager.process_version_file(
+                    source_file,
+                    self.item_type,
+                    self.item_id
+                )
+                files = [file_info]
+                version_number = file_info['version_number']
+                file_path = file_info['file_path']
             
             # 상태 가져오기
             status = self.status_group.checkedButton().text()
             
-            # 프리뷰 경로가 비어있으면 자동 생성 시도
+            # 프리뷰 경로가 비어있으면 버전 생성 후 백그라운드에서 자동 생성
             preview_path = os.path.normpath(self.preview_path_input.text().strip())
-            if preview_path == ".":
-                preview_path = self.preview_generator.create_preview(file_info['file_path'])
+            generate_preview = preview_path == "."
+            if generate_preview:
+                preview_path = None
 
             # 버전 생성
-            success = self.version_services[self.item_type].create_version(
+            version_service = self.version_services[self.item_type]
+            success = version_service.create_version(
                 item_id=self.item_id,
-                version_number=file_info['version_number'],
+                version_number=version_number,
                 worker_name=worker_name,
-                file_path=file_info['file_path'],
+                file_path=file_path,
                 render_path=source_file,
                 preview_path=preview_path,
                 comment=self.comment_input.toPlainText(),
                 status=status
             )
 
+            if success:
+                self.file_manager.record_manifest(self.item_type, success, files)
+
+            if success and generate_preview:
+                # 완료되면 프리뷰 큐가 버전의 preview_path를 기록
+                self.preview_queue.submit(
+                    file_path,
+                    version_service=version_service,
+                    version_id=success
+                )
+
             return success
 
         except Exception as e:
@@ -1,8 +1,9 @@
 """프로젝트 트리 위젯"""
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu, QMessageBox, QApplication
+from PySide6.QtWidgets import QTreeView, QAbstractItemView, QMenu, QMessageBox, QApplication
 from PySide6.QtCore import Signal, Qt, QSize, QEvent
 from ..utils.logger import setup_logger
-from .project_tree_item import CustomTreeItemWidget
+from .project_tree_item import ProjectTreeItemDelegate
+from .project_tree_model import ProjectTreeModel
 from .new_shot_dialog import NewShotDialog
 from .new_sequence_dialog import NewSequenceDialog
 from .new_project_dialog import NewProjectDialog
@@ -11,17 +12,20 @@ from ..utils.event_system import EventSystem
 from ..config.app_state import AppState
 from ..styles.components import get_tree_style
 
-class ProjectTreeWidget(QTreeWidget):
+class ProjectTreeWidget(QTreeView):
     item_selected = Signal(int)
     item_type_changed = Signal(str, int)
 
-    def __init__(self, project_service, version_services, settings_service):
+    def __init__(self, project_service, version_services, settings_service, data_loader=None):
         super().__init__()
         self.logger = setup_logger(__name__)
         self.project_service = project_service
         self.version_services = version_services
         self.settings_service = settings_service
+        self.data_loader = data_loader  # 없으면 GUI 스레드에서 바로 조회
         self.app_state = AppState()
+        self.tree_model = ProjectTreeModel(project_service, self)
+        self.item_delegate = ProjectTreeItemDelegate(self)
         self.setup_ui()
         self.load_projects()
         # 빈 공간 클릭 이벤트 연결
@@ -36,8 +40,12 @@ class ProjectTreeWidget(QTreeWidget):
 
     def setup_ui(self):
         """UI 초기화"""
-        self.setHeaderLabels(["영상연출실"])
-        self.setColumnCount(1)
+        self.setModel(self.tree_model)
+        self.setItemDelegate(self.item_delegate)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        # 모든 행의 높이가 같으므로 높이 계산을 생략
+        self.setUniformRowHeights(True)
+        self.setMouseTracking(True)
         
         # 화면 해상도에 따른 크기 조정
         screen = QApplication.primaryScreen()
@@ -59,71 +67,57 @@ class ProjectTreeWidget(QTreeWidget):
         
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
-        self.itemClicked.connect(self.handle_item_click)
+        self.clicked.connect(self.handle_item_click)
         
     def load_projects(self):
-        """프로젝트 목록 로드"""
-        self.clear()
-        self.logger.debug("프로젝트 목록 로드 시작")
-        # self.save_expanded_state()
-        try:
-            # 서비스 레이어를 통해 전체 프로젝트 구조를 가져옴
-            structure = self.project_service.get_full_project_structure()
-
-            self.setSelectionMode(QTreeWidget.ExtendedSelection)
-
-            for project_id, project in structure.items():
-                project_name = project['name']
-                preview_path = project.get('preview_path')
+        """
+        프로젝트 목록 로드
 
-                project_item = QTreeWidgetItem([""])
-                project_item.setData(0, Qt.UserRole, ("project", project_id))
-                project_widget = CustomTreeItemWidget(project_name, "project", preview_path)
-                self.addTopLevelItem(project_item)
-                self.setItemWidget(project_item, 0, project_widget)
-
-                for sequence_id, sequence in project['sequences'].items():
-                    sequence_name = sequence['name']
-                    preview_path = sequence.get('preview_path')
-
-                    seq_item = QTreeWidgetItem([""])
-                    seq_item.setData(0, Qt.UserRole, ("sequence", sequence_id))
-                    seq_widget = CustomTreeItemWidget(sequence_name, "sequence", preview_path)
-                    project_item.addChild(seq_item)
-                    self.setItemWidget(seq_item, 0, seq_widget)
+        로드된(펼쳐 본) 노드만 다시 조회하여 추가/삭제/변경된 항목을 반영합니다.
+        하위 항목은 노드를 펼칠 때 모델의 fetchMore를 통해 조회됩니다.
+        """
+        self.logger.debug("프로젝트 목록 로드 시작")
+        self.item_delegate.clear_preview_cache()
 
-                    for shot_id, shot in sequence['shots'].items():
-                        shot_name = shot['name']
-                        preview_path = shot.get('preview_path')
+        if self.data_loader:
+            # 조회는 작업 스레드에서, 모델 반영은 GUI 스레드에서 처리
+            self.data_loader.load(
+                "project_tree",
+                self.tree_model.load_children_batch,
+                self.tree_model.fetched_keys(),
+                on_result=self.tree_model.apply_reload,
+                on_error=self._handle_load_error
+            )
+            return
 
-                        shot_item = QTreeWidgetItem([""])
-                        shot_item.setData(0, Qt.UserRole, ("shot", shot_id))
-                        shot_widget = CustomTreeItemWidget(shot_name, "shot", preview_path)
-                        seq_item.addChild(shot_item)
-                        self.setItemWidget(shot_item, 0, shot_widget)
+        try:
+            self.tree_model.reload()
+        except Exception as e:
+            self._handle_load_error(str(e))
 
-                    seq_item.setExpanded(True)
+    def _handle_load_error(self, error):
+        """프로젝트 목록 로드 실패 처리"""
+        self.logger.error(f"프로젝트 목록 로드 실패: {error}")
+        QMessageBox.critical(self, "오류", f"프로젝트 목록 로드 실패: {error}")
 
-                project_item.setExpanded(True)
+    def clear(self):
+        """트리 비우기"""
+        if self.data_loader:
+            self.data_loader.cancel("project_tree")
+        self.tree_model.clear()
 
-        except Exception as e:
-            self.logger.error(f"프로젝트 목록 로드 실패: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, "오류", f"프로젝트 목록 로드 실패: {str(e)}")
-        # finally:
-        #     self.restore_expanded_state()
-            
     def show_context_menu(self, position):
         """우클릭 컨텍스트 메뉴 표시"""
         menu = QMenu()
-        item = self.itemAt(position)
+        item = self.indexAt(position)
         
-        if not item:
+        if not item.isValid():
             menu.addAction("새 프로젝트 추가", lambda: self.add_project())
             menu.exec_(self.viewport().mapToGlobal(position))
             return
 
-        if item:
-            item_type, item_id = item.data(0, Qt.UserRole)
+        if item.isValid():
+            item_type, item_id = item.data(Qt.UserRole)
             
             if item_type == "project":
                 menu.addAction("시퀀스 추가", lambda: self.add_sequence(item, item_id))
@@ -211,7 +205,7 @@ class ProjectTreeWidget(QTreeWidget):
 
     def delete_selected_items(self):
         """선택된 아이템들 삭제"""
-        selected_items = self.selectedItems()
+        selected_items = [index.data(Qt.UserRole) for index in self.selectionModel().selectedRows()]
         if not selected_items:
             return True
                     
@@ -223,23 +217,18 @@ class ProjectTreeWidget(QTreeWidget):
         )
                 
         if reply == QMessageBox.Yes:
-            for item in selected_items:
-                item_type, item_id = item.data(0, Qt.UserRole)
+            for item_type, item_id in selected_items:
                 try:
                     if item_type == "project":
-                        if self.project_service.delete_project(item_id):
-                            parent = item.parent() or self.invisibleRootItem()
-                            parent.removeChild(item)
+                        self.project_service.delete_project(item_id)
                     elif item_type == "sequence":
-                        if self.project_service.delete_sequence(item_id):
-                            parent = item.parent()
-                            parent.removeChild(item)
+                        self.project_service.delete_sequence(item_id)
                     elif item_type == "shot":
-                        if self.project_service.delete_shot(item_id):
-                            parent = item.parent()
-                            parent.removeChild(item)
+                        self.project_service.delete_shot(item_id)
                 except Exception as e:
                     QMessageBox.critical(self, "오류", f"{item_type} 삭제 실패: {str(e)}")
+            # 삭제된 항목을 모델에서 제거
+            self.load_projects()
         return True
 
     def delete_project(self, item, project_id):
@@ -251,9 +240,8 @@ class ProjectTreeWidget(QTreeWidget):
         if reply == QMessageBox.Yes:
             try:
                 if self.project_service.delete_project(project_id):
-                    index = self.indexOfTopLevelItem(item)
-                    self.takeTopLevelItem(index)
                     self.project_service._commit()
+                    self.load_projects()
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"프로젝트 삭제 실패: {str(e)}")
 
@@ -266,9 +254,8 @@ class ProjectTreeWidget(QTreeWidget):
         if reply == QMessageBox.Yes:
             try:
                 if self.project_service.delete_sequence(sequence_id):
-                    parent = item.parent()
-                    parent.removeChild(item)
                     self.project_service._commit()
+                    self.load_projects()
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"시퀀스 삭제 실패: {str(e)}")
 
@@ -281,18 +268,17 @@ class ProjectTreeWidget(QTreeWidget):
         if reply == QMessageBox.Yes:
             try:
                 if self.project_service.delete_shot(shot_id):
-                    parent = item.parent()
-                    parent.removeChild(item)
                     self.project_service._commit()
+                    self.load_projects()
             except Exception as e:
                 QMessageBox.critical(self, "오류", f"샷 삭제 실패: {str(e)}")
 
-    def handle_item_click(self, item, column):
+    def handle_item_click(self, index):
         """트리 아이템 클릭 처리"""
-        if not item:
+        if not index.isValid():
             return
         
-        item_type, item_id = item.data(0, Qt.UserRole)
+        item_type, item_id = index.data(Qt.UserRole)
         self.logger.debug(f"트리 아이템 클릭 - type: {item_type}, id: {item_id}")
         
         # AppState 업데이트
@@ -307,9 +293,9 @@ class ProjectTreeWidget(QTreeWidget):
         if (obj == self.viewport() and 
             event.type() == QEvent.MouseButtonPress):
             
-            item = self.itemAt(event.pos())
+            index = self.indexAt(event.pos())
             
-            if not item:
+            if not index.isValid():
                 self.clearSelection()  # 선택 해제
                 self.item_selected.emit(-1)  # 선택 해제 시그널 발생
                 
@@ -318,37 +304,3 @@ class ProjectTreeWidget(QTreeWidget):
                 self.delete_selected_items()
             
         return super().eventFilter(obj, event)
-    
-    def save_expanded_state(self):
-        self.expanded_items = set()
-        self.logger.debug("확장된 상태 저장 시작")
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            self._save_expanded_state_recursive(item)
-        self.logger.debug(f"확장된 아이템: {self.expanded_items}")
-
-    def _save_expanded_state_recursive(self, item):
-        if item.isExpanded():
-            item_id = item.data(0, Qt.UserRole)
-            self.expanded_items.add(item_id)
-            self.logger.debug(f"확장된 아이템 ID 저장: {item_id}")
-        for i in range(item.childCount()):
-            self._save_expanded_state_recursive(item.child(i))
-
-    def restore_expanded_state(self):
-        self.logger.debug("확장된 상태 복원 시작")
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            self._restore_expanded_state_recursive(item)
-        self.logger.debug("확장된 상태 복원 완료")
-
-    def _restore_expanded_state_recursive(self, item):
-        item_id = item.data(0, Qt.UserRole)
-        if item_id in self.expanded_items:
-            item.setExpanded(True)
-            self.logger.debug(f"아이템 ID 복원: {item_id} (확장됨)")
-        else:
-            item.setExpanded(False)
-            self.logger.debug(f"아이템 ID 복원: {item_id} (축소됨)")
-        for i in range(item.childCount()):
-            self._restore_expanded_state_recursive(item.child(i))
@@ -1,142 +1,161 @@
-"""커스텀 트리 아이템 위젯"""
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QPainter
-from PySide6.QtSvg import QSvgRenderer
-import os
+"""프로젝트 트리 아이템 델리게이트"""
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import Qt, QSize, QRect, QModelIndex
+from PySide6.QtGui import QPixmap, QPainter, QPixmapCache, QColor, QFont, QPen
 from PySide6.QtWidgets import QApplication
+from .project_tree_model import PREVIEW_ROLE
+from ..utils.icon_cache import IconCache
+from ..utils.event_system import EventSystem
+from ..services.thumbnail_service import ThumbnailService
 
-class CustomTreeItemWidget(QWidget):
-    def __init__(self, name, item_type, preview_path=None, parent=None):
+class ProjectTreeItemDelegate(QStyledItemDelegate):
+    """아이콘, 이름, 프리뷰를 위젯 없이 직접 그리는 트리 아이템 델리게이트"""
+
+    ICON_NAMES = {
+        "project": "project-icon",
+        "sequence": "sequence-icon",
+        "shot": "shot-icon"
+    }
+
+    # 선택/호버 배경색
+    HOVER_COLOR = QColor("#1f1f2c")
+    SELECTED_COLOR = QColor("#2d2d3d")
+    SELECTED_HOVER_COLOR = QColor("#363647")
+    TEXT_COLOR = QColor("#e0e0e0")
+    PREVIEW_BACKGROUND = QColor("#1a1a24")
+    PREVIEW_BORDER = QColor("#2d2d3d")
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        # 현재 파일의 디렉토리 경로를 가져옵니다
-        self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.item_type = item_type  # 아이템 타입 저장
-        
-        # 화면 해상도에 따른 크기 계산
+        self.thumbnail_service = ThumbnailService.instance()
+        self.thumbnail_service.thumbnail_ready.connect(self._handle_thumbnail_ready)
+        self.update_metrics()
+
+        # 화면 DPI가 바뀌면 크기 다시 계산
+        EventSystem.subscribe('dpi_changed', self.update_metrics)
+
+    def update_metrics(self):
+        """화면 해상도에 따른 크기 계산 (생성 시와 DPI 변경 시에만 계산)"""
         self.scale_factor = self.calculate_scale_factor()
-        self.setup_ui(name, preview_path)
-        
+        self.margin = int(8 * self.scale_factor)
+        self.spacing = int(12 * self.scale_factor)
+        self.icon_size = int(24 * self.scale_factor)
+        self.preview_size = QSize(int(150 * self.scale_factor), int(85 * self.scale_factor))
+
+        self.font = QFont("Segoe UI")
+        self.font.setPixelSize(int(14 * self.scale_factor))
+        self.font.setWeight(QFont.Medium)
+
+        # 행 높이가 바뀌었음을 뷰에 알림
+        self.sizeHintChanged.emit(QModelIndex())
+
     def calculate_scale_factor(self):
         """화면 해상도에 따른 스케일 팩터 계산"""
         screen = QApplication.primaryScreen()
         dpi = screen.logicalDotsPerInch()
-        
+
         # 기준 DPI (96은 일반적인 FHD 해상도의 DPI)
         base_dpi = 96
         return dpi / base_dpi
 
-    def load_svg_icon(self, icon_name, size=24):
-        icon_path = os.path.join(self.base_path, 'lhcPipeToolApp', 'resources', 'icons', f'{icon_name}.svg')
-        if not os.path.exists(icon_path):
-            print(f"Icon not found: {icon_path}")
+    def get_icon(self, item_type, device_pixel_ratio=1.0):
+        """아이템 타입별 아이콘 반환 (전역 아이콘 캐시 사용)"""
+        icon_name = self.ICON_NAMES.get(item_type, "project-icon")
+        return IconCache.get(icon_name, self.icon_size, device_pixel_ratio)
+
+    def get_preview(self, preview_path):
+        """
+        프리뷰 썸네일 반환
+
+        썸네일 캐시의 메모리에 없으면 백그라운드 생성을 요청하고 None을 반환합니다.
+        생성이 끝나면 thumbnail_ready 시그널로 뷰가 다시 그려집니다.
+        """
+        if not preview_path:
             return None
-            
-        renderer = QSvgRenderer(icon_path)
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
+
+        entry = self.thumbnail_service.peek_entry(preview_path, ThumbnailService.SMALL)
+        if entry is None:
+            self.thumbnail_service.request(preview_path, ThumbnailService.SMALL)
+            return None
+        stamp, image = entry
+
+        # 원본이 바뀌면 stamp가 달라지므로 이전 pixmap은 사용되지 않음
+        width, height = self.preview_size.width(), self.preview_size.height()
+        key = f"project_tree_preview:{preview_path}:{stamp[0]}:{stamp[1]}:{width}x{height}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            return pixmap
+
+        pixmap = QPixmap.fromImage(image).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
         return pixmap
-        
-    def setup_ui(self, name, preview_path):
-        layout = QHBoxLayout(self)
-        
-        # 스케일 팩터에 따른 여백 조정
-        margin_size = int(8 * self.scale_factor)
-        layout.setContentsMargins(margin_size, 2, margin_size, 4)
-        layout.setSpacing(int(12 * self.scale_factor))
-        
-        # 아이콘 크기 조정
-        icon_size = int(24 * self.scale_factor)
-        self.icon_label = QLabel()
-        self.icon_label.setFixedSize(icon_size, icon_size)
-        self.icon_label.setStyleSheet("QLabel { margin-top: 0px; }")
-        
-        # 아이콘 로드 시 크기 적용
-        if self.item_type == "sequence":
-            icon_pixmap = self.load_svg_icon('sequence-icon', icon_size)
-        elif self.item_type == "shot":
-            icon_pixmap = self.load_svg_icon('shot-icon', icon_size)
-        else:  # project
-            icon_pixmap = self.load_svg_icon('project-icon', icon_size)
-            
-        if icon_pixmap:
-            self.icon_label.setPixmap(icon_pixmap)
-        
-        layout.addWidget(self.icon_label)
-        
-        # 이름 라벨 폰트 크기 조정
-        self.name_label = QLabel(str(name))
-        font_size = int(14 * self.scale_factor)
-        self.name_label.setStyleSheet(f"""
-            QLabel {{
-                font-family: 'Segoe UI';
-                font-size: {font_size}px;
-                font-weight: 500;
-                color: #e0e0e0;
-                padding: 2px 4px;
-            }}
-        """)
-        self.name_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        layout.addWidget(self.name_label)
-        
-        layout.addStretch()
-        
-        # 프리뷰 크기 조정
-        preview_width = int(150 * self.scale_factor)
-        preview_height = int(85 * self.scale_factor)
-        self.preview_label = QLabel()
-        self.preview_label.setFixedSize(preview_width, preview_height)
-        self.preview_label.setStyleSheet("""
-            QLabel {
-                background-color: #1a1a24;
-                border: 1px solid #2d2d3d;
-                border-radius: 4px;
-                margin-top: -4px;
-                margin-right: 0px;
-            }
-        """)
-        self.preview_label.setAlignment(Qt.AlignCenter)
-        
-        # 프리뷰 이미지 로드 및 크기 조정
-        if preview_path:
-            pixmap = QPixmap(preview_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(
-                    preview_width, 
-                    preview_height,
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                )
-                self.preview_label.setPixmap(scaled_pixmap)
-            else:
-                self.preview_label.setText("No Preview")
+
+    def clear_preview_cache(self):
+        """썸네일 생성 실패 기록 초기화 (새로고침 시 다시 시도)"""
+        self.thumbnail_service.reset_failures()
+
+    def _handle_thumbnail_ready(self, source_path, size):
+        """썸네일 준비 완료 시 뷰 다시 그리기"""
+        view = self.parent()
+        if view is not None:
+            view.viewport().update()
+
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
+
+        # 선택/호버 배경
+        selected = option.state & QStyle.State_Selected
+        hovered = option.state & QStyle.State_MouseOver
+        if selected:
+            painter.fillRect(rect, self.SELECTED_HOVER_COLOR if hovered else self.SELECTED_COLOR)
+        elif hovered:
+            painter.fillRect(rect, self.HOVER_COLOR)
+
+        item_type, _ = index.data(Qt.UserRole)
+
+        # 아이콘
+        x = rect.left() + self.margin
+        device_pixel_ratio = option.widget.devicePixelRatioF() if option.widget else 1.0
+        icon = self.get_icon(item_type, device_pixel_ratio)
+        if icon:
+            painter.drawPixmap(x, rect.top() + (rect.height() - self.icon_size) // 2, icon)
+        x += self.icon_size + self.spacing
+
+        # 프리뷰 영역 (오른쪽 정렬)
+        preview_rect = QRect(
+            rect.right() - self.margin - self.preview_size.width() + 1,
+            rect.top() + (rect.height() - self.preview_size.height()) // 2,
+            self.preview_size.width(),
+            self.preview_size.height()
+        )
+
+        # 이름
+        painter.setFont(self.font)
+        painter.setPen(self.TEXT_COLOR)
+        name_rect = QRect(x, rect.top(), max(0, preview_rect.left() - self.spacing - x), rect.height())
+        name = painter.fontMetrics().elidedText(str(index.data(Qt.DisplayRole)), Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        # 프리뷰
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self.PREVIEW_BORDER, 1))
+        painter.setBrush(self.PREVIEW_BACKGROUND)
+        painter.drawRoundedRect(preview_rect.adjusted(0, 0, -1, -1), 4, 4)
+
+        preview = self.get_preview(index.data(PREVIEW_ROLE))
+        if preview:
+            painter.drawPixmap(
+                preview_rect.left() + (preview_rect.width() - preview.width()) // 2,
+                preview_rect.top() + (preview_rect.height() - preview.height()) // 2,
+                preview
+            )
         else:
-            self.preview_label.setText("No Preview")
-            
-        layout.addWidget(self.preview_label)
-
-        # 선택 효과를 위한 스타일시트 수정
-        self.setStyleSheet("""
-            CustomTreeItemWidget {
-                background: transparent;
-                outline: none;
-                border: none;
-            }
-            
-            CustomTreeItemWidget:hover {
-                background: #1f1f2c;  /* 호버 효과 */
-            }
-            
-            CustomTreeItemWidget[selected="true"] {
-                background: #2d2d3d;  /* 선택 시 배경색 */
-                outline: none;
-                border: none;
-            }
-            
-            CustomTreeItemWidget[selected="true"]:hover {
-                background: #363647;  /* 선택된 상태에서 호버 시 */
-            }
-        """)
\ No newline at end of file
+            painter.setPen(self.TEXT_COLOR)
+            painter.drawText(preview_rect, Qt.AlignCenter, "No Preview")
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        width = self.margin * 2 + self.icon_size + self.spacing * 2 + self.preview_size.width()
+        return QSize(width, self.preview_size.height() + 6)
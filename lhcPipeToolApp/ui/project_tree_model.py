@@ -0,0 +1,240 @@
+"""프로젝트 트리 모델"""
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from ..utils.logger import setup_logger
+
+# 프리뷰 경로 조회용 role
+PREVIEW_ROLE = Qt.UserRole + 1
+
+# 타입별 하위 노드 타입 (None은 루트)
+CHILD_TYPES = {
+    None: "project",
+    "project": "sequence",
+    "sequence": "shot",
+    "shot": None
+}
+
+class ProjectTreeNode:
+    """트리 노드 (프로젝트/시퀀스/샷)"""
+
+    __slots__ = ('item_type', 'item_id', 'name', 'preview_path', 'child_count',
+                 'parent', 'children', 'fetched', 'row_index')
+
+    def __init__(self, item_type=None, data=None, parent=None):
+        self.item_type = item_type
+        self.item_id = data['id'] if data else None
+        self.name = data['name'] if data else None
+        self.preview_path = data.get('preview_path') if data else None
+        self.child_count = data.get('child_count', 0) if data else 0
+        self.parent = parent
+        self.children = []
+        self.row_index = 0   # 부모 내 위치 (하위 목록이 바뀔 때 renumber_children로 갱신)
+        # 하위 노드가 없는 노드는 지연 로드할 대상이 없으므로 로드 완료로 취급
+        self.fetched = data is not None and (CHILD_TYPES[item_type] is None or not self.child_count)
+
+    @property
+    def child_type(self):
+        return CHILD_TYPES[self.item_type]
+
+    def update(self, data):
+        """조회 결과로 노드 정보 갱신 (변경 여부 반환)"""
+        values = (data['name'], data.get('preview_path'), data.get('child_count', 0))
+        if values == (self.name, self.preview_path, self.child_count):
+            return False
+        self.name, self.preview_path, self.child_count = values
+        return True
+
+    def row(self):
+        """부모 내 위치 반환"""
+        return self.row_index
+
+    def renumber_children(self, start=0):
+        """start 이후 하위 노드의 위치 갱신 (추가/이동 후 호출)"""
+        for row in range(start, len(self.children)):
+            self.children[row].row_index = row
+
+class ProjectTreeModel(QAbstractItemModel):
+    """
+    프로젝트 > 시퀀스 > 샷 계층 모델
+
+    하위 노드는 펼칠 때 canFetchMore/fetchMore를 통해 단계별로 조회하므로
+    메모리와 로딩 시간이 전체 계층이 아닌 펼쳐진 노드 수에 비례합니다.
+    루트(프로젝트 목록)는 뷰가 GUI 스레드에서 조회하지 않도록 reload/apply_reload로만 채웁니다.
+    """
+
+    HEADER = "영상연출실"
+
+    def __init__(self, project_service, parent=None):
+        super().__init__(parent)
+        self.project_service = project_service
+        self.logger = setup_logger(__name__)
+        self.root = ProjectTreeNode()
+
+    def _node(self, index):
+        """인덱스에 해당하는 노드 반환 (유효하지 않으면 루트)"""
+        return index.internalPointer() if index.isValid() else self.root
+
+    def _load_children(self, node):
+        """노드의 하위 목록 조회"""
+        return self.project_service.get_tree_children(node.child_type, node.item_id)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._node(parent).children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self.root:
+            return QModelIndex()
+        return self.createIndex(parent_node.row(), 0, parent_node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        if node is self.root:
+            return True
+        return bool(node.children) or (not node.fetched and node.child_count > 0)
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        # 루트는 DataLoader가 조회 결과를 전달할 때 apply_reload로 채움
+        return node is not self.root and not node.fetched
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node is self.root or node.fetched:
+            return
+        try:
+            rows = self._load_children(node)
+        except Exception as e:
+            self.logger.error(f"하위 항목 로드 실패: {str(e)}", exc_info=True)
+            return
+
+        node.fetched = True
+        if not rows:
+            return
+        self.beginInsertRows(parent, 0, len(rows) - 1)
+        node.children = [ProjectTreeNode(node.child_type, row, node) for row in rows]
+        node.renumber_children()
+        self.endInsertRows()
+        self.logger.debug(f"하위 항목 로드 - {node.child_type}: {len(rows)}개")
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.name
+        if role == Qt.UserRole:
+            return (node.item_type, node.item_id)
+        if role == PREVIEW_ROLE:
+            return node.preview_path
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return self.HEADER
+        return None
+
+    def reload(self):
+        """
+        로드된 노드만 다시 조회하여 추가/삭제/변경된 항목을 반영
+
+        기존 노드는 그대로 유지되므로 펼침 상태와 선택 상태도 유지됩니다.
+        """
+        self.apply_reload(self.load_children_batch(self.fetched_keys()))
+
+    def fetched_keys(self):
+        """하위 목록을 로드한 노드의 (type, id) 목록 (루트 포함, 하위 항목이 없는 노드 제외)"""
+        keys = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is self.root or (node.child_type and node.fetched and node.children):
+                keys.append((node.item_type, node.item_id))
+                stack.extend(node.children)
+        return keys
+
+    def load_children_batch(self, keys):
+        """
+        노드별 하위 목록 조회 (GUI 스레드 밖에서 실행 가능)
+
+        모델 상태를 변경하지 않으므로 DataLoader 작업 스레드에서 호출할 수 있습니다.
+        """
+        return {
+            (item_type, item_id): self.project_service.get_tree_children(CHILD_TYPES[item_type], item_id)
+            for item_type, item_id in keys
+        }
+
+    def apply_reload(self, children_rows):
+        """load_children_batch() 결과를 모델에 반영 (GUI 스레드에서 호출)"""
+        self._sync_node(self.root, QModelIndex(), children_rows)
+
+    def _sync_node(self, node, parent_index, children_rows):
+        """노드의 하위 목록을 DB 조회 결과와 동기화"""
+        key = (node.item_type, node.item_id)
+        if key not in children_rows:
+            # 조회 이후에 새로 추가된 노드는 다음 새로고침 때 반영
+            return
+        rows = children_rows[key]
+        node.fetched = True
+
+        for row, data in enumerate(rows):
+            current = node.children[row] if row < len(node.children) else None
+
+            if current is None or current.item_id != data['id']:
+                source = next(
+                    (i for i in range(row + 1, len(node.children)) if node.children[i].item_id == data['id']),
+                    None
+                )
+                if source is not None:
+                    # 이름 변경 등으로 순서가 바뀐 노드 이동
+                    self.beginMoveRows(parent_index, source, source, parent_index, row)
+                    node.children.insert(row, node.children.pop(source))
+                    node.renumber_children(row)
+                    self.endMoveRows()
+                else:
+                    # 새 노드 추가
+                    self.beginInsertRows(parent_index, row, row)
+                    node.children.insert(row, ProjectTreeNode(node.child_type, data, node))
+                    node.renumber_children(row)
+                    self.endInsertRows()
+                    continue
+
+            child = node.children[row]
+            if child.update(data):
+                if child.child_type and not child.children:
+                    # 하위 항목이 새로 생긴 빈 노드는 펼칠 때 다시 조회
+                    child.fetched = not child.child_count
+                child_index = self.index(row, 0, parent_index)
+                self.dataChanged.emit(child_index, child_index)
+
+        # 조회 결과에 없는 나머지 노드 제거
+        if len(node.children) > len(rows):
+            self.beginRemoveRows(parent_index, len(rows), len(node.children) - 1)
+            del node.children[len(rows):]
+            self.endRemoveRows()
+
+        for row, child in enumerate(node.children):
+            if child.child_type and child.fetched and child.children:
+                self._sync_node(child, self.index(row, 0, parent_index), children_rows)
+
+    def clear(self):
+        """모든 노드 제거 (다음 reload 시 다시 조회)"""
+        self.beginResetModel()
+        self.root = ProjectTreeNode()
+        self.endResetModel()
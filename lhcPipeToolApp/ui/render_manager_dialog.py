@@ -1,20 +1,121 @@
 """렌더 출력물 관리 다이얼로그"""
+import itertools
+import os
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, 
                               QPushButton, QTreeWidget, QTreeWidgetItem,
                               QLabel, QMessageBox, QMenu)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
 from pathlib import Path
 from datetime import datetime
+from ..handlers.content_store import ContentStore
 from ..utils.logger import setup_logger
+from ..utils.directory_scanner import directory_scanner, FileEntry
+from ..utils.sequence_utils import collapse_sequences, SequenceGroup
+
+# 파일 행 데이터: (name, path, size, mtime, type, frame_count)
+# frame_count는 시퀀스로 묶인 행이면 프레임 수, 단일 파일이면 0
+
+class RenderScanSignals(QObject):
+    """작업 스레드 -> GUI 스레드 스캔 결과 전달용 시그널"""
+    versions_loaded = Signal(int, object, object)   # request_id, versions, summaries
+    rows_loaded = Signal(int, int, object)          # request_id, version_id, [파일 행]
+    finished = Signal(int)                          # request_id
+
+class RenderScanTask(QRunnable):
+    """
+    샷의 버전별 렌더 파일 목록을 작업 스레드에서 조회
+
+    버전 파일 목록(VERSION_FILES)이 있는 버전은 DB에서, 없는 이전 버전은 버전 폴더를
+    scandir로 조회하고, 시퀀스는 한 행으로 묶어 BATCH_SIZE 행씩 전달합니다.
+    """
+
+    BATCH_SIZE = 200
+
+    def __init__(self, request_id, version_service, shot_id, signals):
+        super().__init__()
+        self.request_id = request_id
+        self.version_service = version_service
+        self.shot_id = shot_id
+        self.signals = signals
+        self.cancelled = False
+        self.logger = setup_logger(__name__)
+
+    def run(self):
+        try:
+            versions = self.version_service.get_all_versions(self.shot_id)
+            summaries = self.version_service.get_version_file_summaries(version['id'] for version in versions)
+            manifest_files = {}
+            for file in self.version_service.get_version_files(list(summaries)):
+                manifest_files.setdefault(file['version_id'], []).append(file)
+        except Exception as e:
+            self.logger.error(f"렌더 파일 목록 조회 실패: {str(e)}")
+            versions, summaries, manifest_files = [], {}, {}
+        finally:
+            # 스레드 풀의 스레드는 재사용되므로 임대한 DB 커넥션 반납
+            self.version_service.version_model.db_connector.release()
+
+        if self.cancelled:
+            return
+        self.signals.versions_loaded.emit(self.request_id, versions, summaries)
+
+        for version in versions:
+            if self.cancelled:
+                return
+            if version['id'] in manifest_files:
+                entries = [self._manifest_entry(file) for file in manifest_files[version['id']]]
+            elif version.get('file_path'):
+                # 버전 파일 목록이 없는 이전 버전은 버전 폴더를 직접 조회
+                entries = [
+                    entry for entry in directory_scanner.scan(os.path.dirname(version['file_path']))
+                    if not entry.is_dir
+                ]
+            else:
+                continue
+
+            rows = [self._make_row(row) for row in collapse_sequences(entries)]
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                if self.cancelled:
+                    return
+                self.signals.rows_loaded.emit(self.request_id, version['id'], rows[start:start + self.BATCH_SIZE])
+
+        self.signals.finished.emit(self.request_id)
+
+    @staticmethod
+    def _manifest_entry(file):
+        created_at = file.get('created_at')
+        return FileEntry(
+            os.path.basename(file['file_path']),
+            file['file_path'],
+            file['file_size'] or 0,
+            created_at.timestamp() if hasattr(created_at, 'timestamp') else None,
+            False
+        )
+
+    @staticmethod
+    def _make_row(row):
+        if isinstance(row, SequenceGroup):
+            return (row.display_name, row.entries[0].path, row.size, row.mtime,
+                    f"{row.ext[1:].upper()} Sequence", len(row.frames))
+        return (row.name, row.path, row.size, row.mtime, Path(row.name).suffix[1:].upper(), 0)
 
 class RenderManagerDialog(QDialog):
+    FRAME_COUNT_ROLE = Qt.UserRole + 1
+
     def __init__(self, version_service, shot_id, parent=None):
         super().__init__(parent)
         self.version_service = version_service
         self.shot_id = shot_id
-        self.render_root = Path(self.version_service.get_render_root())
         self.logger = setup_logger(__name__)
         self.logger.info(f"RenderManager 초기화 - Shot ID: {shot_id}")
+
+        self.scan_signals = RenderScanSignals()
+        self.scan_signals.versions_loaded.connect(self._on_versions_loaded)
+        self.scan_signals.rows_loaded.connect(self._on_rows_loaded)
+        self.scan_signals.finished.connect(self._on_scan_finished)
+        self._request_ids = itertools.count(1)
+        self._current_task = None
+        self._version_items = {}   # version_id -> QTreeWidgetItem
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -25,7 +126,6 @@ class RenderManagerDialog(QDialog):
         # 상단 정보 표시
         info_layout = QHBoxLayout()
         self.shot_info_label = QLabel()
-        self.update_shot_info()
         info_layout.addWidget(self.shot_info_label)
         layout.addLayout(info_layout)
         
@@ -60,54 +160,86 @@ class RenderManagerDialog(QDialog):
         # 초기 데이터 로드
         self.load_renders()
         
-    def update_shot_info(self):
-        """샷 정보 업데이트"""
-        shot_info = self.version_service.get_shot_info(self.shot_id)
-        if shot_info:
-            self.shot_info_label.setText(
-                f"Shot: {shot_info['name']} | "
-                f"Status: {shot_info['status']} | "
-                f"Latest Version: {shot_info['latest_version']}"
-            )
+    def update_shot_info(self, versions, summaries):
+        """샷 정보 업데이트 (버전 수, 최신 버전, 전체 크기)"""
+        total_size = sum(summary['total_size'] or 0 for summary in summaries.values())
+        latest = versions[0]['name'] if versions else "-"
+        self.shot_info_label.setText(
+            f"Shot ID: {self.shot_id} | "
+            f"Versions: {len(versions)} | "
+            f"Latest Version: {latest} | "
+            f"Total Size: {self.format_size(total_size)}"
+        )
             
     def load_renders(self):
-        """렌더 파일 목록 로드"""
+        """렌더 파일 목록 로드 (작업 스레드에서 조회하고 버전별로 나누어 트리에 추가)"""
+        self.cancel_scan()
         self.tree_widget.clear()
-        render_path = self.render_root / f"shot_{self.shot_id}"
-        self.logger.info(f"렌더 파일 로드 시작 - 경로: {render_path}")
-        
-        if not render_path.exists():
-            self.logger.info(f"렌더 디렉토리 생성: {render_path}")
-            render_path.mkdir(parents=True)
-            
-        for version_dir in sorted(render_path.glob("v*")):
-            self.logger.debug(f"버전 디렉토리 처리: {version_dir}")
+        self._version_items.clear()
+        self.shot_info_label.setText(f"Shot ID: {self.shot_id} | Loading...")
+        self.logger.info(f"렌더 파일 로드 시작 - Shot ID: {self.shot_id}")
+
+        self._current_task = RenderScanTask(
+            next(self._request_ids), self.version_service, self.shot_id, self.scan_signals
+        )
+        QThreadPool.globalInstance().start(self._current_task)
+
+    def cancel_scan(self):
+        """진행 중인 조회 취소 (이미 전달된 결과는 request_id로 걸러냄)"""
+        if self._current_task:
+            self._current_task.cancelled = True
+            QThreadPool.globalInstance().tryTake(self._current_task)
+            self._current_task = None
+
+    def _is_current(self, request_id):
+        return self._current_task is not None and self._current_task.request_id == request_id
+
+    def _on_versions_loaded(self, request_id, versions, summaries):
+        if not self._is_current(request_id):
+            return
+        for version in versions:
+            summary = summaries.get(version['id'])
             version_item = QTreeWidgetItem([
-                version_dir.name,
-                "",
-                self.format_date(version_dir.stat().st_mtime),
-                "Directory"
+                version['name'],
+                self.format_size(summary['total_size'] or 0) if summary else "",
+                str(version.get('created_at') or ""),
+                "Version"
             ])
-            self.tree_widget.addTopLevelItem(version_item)
-            
-            # 버전 디렉토리 내 파일들 로드
-            self.load_render_files(version_item, version_dir)
-            
-    def load_render_files(self, parent_item, directory):
-        """디렉토리 내 렌더 파일들 로드"""
-        for file_path in directory.glob("*"):
-            if file_path.is_file():
-                size = self.format_size(file_path.stat().st_size)
-                modified = file_path.stat().st_mtime
-                file_type = file_path.suffix[1:].upper()
-                
-                file_item = QTreeWidgetItem([
-                    file_path.name,
-                    size,
-                    modified,
-                    file_type
-                ])
-                parent_item.addChild(file_item)
+            if version.get('file_path'):
+                version_item.setData(0, Qt.UserRole, os.path.dirname(version['file_path']))
+            self._version_items[version['id']] = version_item
+        self.tree_widget.addTopLevelItems(list(self._version_items.values()))
+        self.update_shot_info(versions, summaries)
+
+    def _on_rows_loaded(self, request_id, version_id, rows):
+        version_item = self._version_items.get(version_id)
+        if not self._is_current(request_id) or version_item is None:
+            return
+        file_items = []
+        for name, path, size, mtime, file_type, frame_count in rows:
+            file_item = QTreeWidgetItem([
+                name,
+                self.format_size(size),
+                self.format_date(mtime) if mtime else "",
+                file_type
+            ])
+            file_item.setData(0, Qt.UserRole, path)
+            file_item.setData(0, self.FRAME_COUNT_ROLE, frame_count)
+            file_items.append(file_item)
+        version_item.addChildren(file_items)
+
+    def _on_scan_finished(self, request_id):
+        if self._is_current(request_id):
+            self._current_task = None
+            self.logger.info(f"렌더 파일 로드 완료 - Shot ID: {self.shot_id}")
+
+    def closeEvent(self, event):
+        self.cancel_scan()
+        super().closeEvent(event)
+
+    def reject(self):
+        self.cancel_scan()
+        super().reject()
                 
     def format_size(self, size):
         """파일 크기 포맷팅"""
@@ -134,10 +266,12 @@ class RenderManagerDialog(QDialog):
         open_location_action = menu.addAction("Open Location")
         menu.addSeparator()
         copy_path_action = menu.addAction("Copy Path")
+        preview_action = delete_action = None
         
-        if item.childCount() == 0:  # 파일인 경우
+        if item.parent() is not None:  # 파일인 경우
             preview_action = menu.addAction("Preview")
-            delete_action = menu.addAction("Delete")
+            if not item.data(0, self.FRAME_COUNT_ROLE):  # 시퀀스 행은 삭제하지 않음
+                delete_action = menu.addAction("Delete")
         
         # 메뉴 표시 및 액션 처리
         action = menu.exec_(self.tree_widget.viewport().mapToGlobal(position))
@@ -157,12 +291,11 @@ class RenderManagerDialog(QDialog):
                 self.delete_file(file_path, item)
 
     def get_item_path(self, item):
-        """트리 아이템의 전체 경로 반환"""
-        path_parts = []
-        while item:
-            path_parts.insert(0, item.text(0))
-            item = item.parent()
-        return self.render_root / f"shot_{self.shot_id}" / "/".join(path_parts)
+        """트리 아이템의 전체 경로 반환 (버전 아이템은 버전 폴더)"""
+        path = item.data(0, Qt.UserRole)
+        if not path and item.childCount():
+            path = str(Path(item.child(0).data(0, Qt.UserRole)).parent)
+        return Path(path or "")
 
     def open_file(self, file_path):
         """파일 열기"""
@@ -197,7 +330,9 @@ class RenderManagerDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             try:
-                file_path.unlink()
+                # 중복 제거 저장소에 연결된 파일은 읽기 전용일 수 있음
+                ContentStore.remove_file(file_path)
+                self.version_service.remove_version_file(item.data(0, Qt.UserRole))
                 item.parent().removeChild(item)
                 self.logger.info(f"파일 삭제 성공: {file_path}")
             except Exception as e:
@@ -2,7 +2,7 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLineEdit, 
                               QPushButton, QMessageBox, 
                               QTabWidget, QWidget, QFormLayout, 
-                              QGroupBox, QHBoxLayout, QFileDialog)
+                              QGroupBox, QHBoxLayout, QFileDialog, QCheckBox)
 from pathlib import Path
 
 from ..utils.logger import setup_logger
@@ -55,6 +55,10 @@ class SettingsDialog(QDialog):
         self.preview_output_input = QLineEdit()
         path_layout.addRow("Preview Output:", self.preview_output_input)
         
+        # 같은 내용의 버전 파일은 저장소에 한 번만 저장하고 버전 폴더에는 링크로 연결
+        self.dedup_storage_check = QCheckBox("Deduplicate Version Files")
+        path_layout.addRow(self.dedup_storage_check)
+        
         tab_widget.addTab(path_tab, "Paths")
         
         # 데이터베이스 설정 탭
@@ -92,6 +96,7 @@ class SettingsDialog(QDialog):
         self.project_root_input.setText(settings.get("project_root", ""))
         self.render_output_input.setText(settings.get("render_output", ""))
         self.preview_output_input.setText(settings.get("preview_output", ""))
+        self.dedup_storage_check.setChecked(settings.get("dedup_storage", "false") == "true")
         self.db_host_input.setText(settings.get("db_host", "localhost"))
         self.db_name_input.setText(settings.get("db_name", ""))
         self.db_user_input.setText(settings.get("db_user", "SYSDBA"))
@@ -104,6 +109,7 @@ class SettingsDialog(QDialog):
                 "project_root": self.project_root_input.text(),
                 "render_output": self.render_output_input.text(),
                 "preview_output": self.preview_output_input.text(),
+                "dedup_storage": "true" if self.dedup_storage_check.isChecked() else "false",
                 "db_host": self.db_host_input.text(),
                 "db_name": self.db_name_input.text(),
                 "db_user": self.db_user_input.text(),
@@ -0,0 +1,212 @@
+"""파일 전송 모니터 다이얼로그"""
+import os
+import time
+from collections import deque, defaultdict
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QWidget)
+from PySide6.QtCore import QTimer, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF
+from ..handlers.copy_scheduler import copy_scheduler
+from ..handlers.monitoring_handler import NetworkMonitor, OperationType
+from ..utils.logger import setup_logger
+
+MB = 1024 * 1024
+
+def format_eta(seconds):
+    """남은 시간을 mm:ss (1시간 이상이면 h:mm:ss) 형식으로 변환"""
+    if seconds is None:
+        return "--:--"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+class SparklineWidget(QWidget):
+    """최근 처리량 추이 그래프"""
+
+    def __init__(self, max_samples, parent=None):
+        super().__init__(parent)
+        self.samples = deque(maxlen=max_samples)
+        self.setMinimumHeight(70)
+
+    def add_sample(self, value):
+        self.samples.append(value)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = self.rect().adjusted(2, 14, -2, -2)
+        painter.fillRect(self.rect(), QColor(30, 30, 30))
+
+        peak = max(self.samples, default=0.0)
+        current = self.samples[-1] if self.samples else 0.0
+        painter.setPen(QColor(180, 180, 180))
+        painter.drawText(4, 12, f"{current:.1f} MB/s (peak {peak:.1f} MB/s)")
+
+        if len(self.samples) < 2:
+            return
+        scale = max(peak, 1.0)
+        step = rect.width() / (self.samples.maxlen - 1)
+        offset = self.samples.maxlen - len(self.samples)
+        polygon = QPolygonF([
+            QPointF(rect.left() + (offset + index) * step, rect.bottom() - value / scale * rect.height())
+            for index, value in enumerate(self.samples)
+        ])
+        painter.setPen(QPen(QColor(80, 200, 120), 1.5))
+        painter.drawPolyline(polygon)
+
+class TransferMonitorDialog(QDialog):
+    """
+    진행 중인 파일 전송 현황
+
+    NetworkMonitor와 복사 스케줄러 상태를 REFRESH_INTERVAL_MS마다 읽어 전송별 진행률/속도,
+    전체 처리량과 대기열, 남은 시간, 클라이언트 CPU와 네트워크 송수신량을 표시합니다.
+    전체 처리량과 클라이언트 송신량, 대상 볼륨별 처리량을 함께 보면 병목이 클라이언트,
+    네트워크, 서버 중 어디인지 구분할 수 있습니다.
+    """
+
+    REFRESH_INTERVAL_MS = 1000
+    HISTORY_SAMPLES = 120      # 그래프에 표시할 샘플 수 (REFRESH_INTERVAL_MS 간격)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = setup_logger(__name__)
+        self.monitor = NetworkMonitor.instance()
+        self._last_net_io = None   # (시각, bytes_sent, bytes_recv)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        self.setWindowTitle("Transfer Monitor")
+        self.resize(900, 500)
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.sparkline = SparklineWidget(self.HISTORY_SAMPLES)
+        layout.addWidget(self.sparkline)
+
+        self.table = QTableWidget(0, 5)
+        self.table.setHorizontalHeaderLabels(["File", "Destination", "Progress", "Speed", "ETA"])
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionMode(QTableWidget.NoSelection)
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.volume_label = QLabel()
+        self.health_label = QLabel()
+        self.stats_label = QLabel()
+        for label in (self.volume_label, self.health_label, self.stats_label):
+            layout.addWidget(label)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        # 보이지 않는 동안에는 조회하지 않음
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """모니터 상태를 읽어 화면 갱신"""
+        try:
+            transfers = self.monitor.get_active_operations(OperationType.FILE_COPY)
+            scheduler_stats = copy_scheduler.get_statistics()
+
+            total_speed = sum(transfer.current_speed_mbps for transfer in transfers)
+            remaining_bytes = scheduler_stats["queued_bytes"] + sum(
+                max(transfer.total_bytes - transfer.transferred_bytes, 0) for transfer in transfers
+            )
+            eta = remaining_bytes / (total_speed * MB) if total_speed > 0 else None
+
+            self.summary_label.setText(
+                f"Active: {len(transfers)} | "
+                f"Queued: {scheduler_stats['queued']} ({scheduler_stats['queued_bytes'] / MB:.1f} MB) | "
+                f"{total_speed:.1f} MB/s | ETA {format_eta(eta)}"
+            )
+            self.sparkline.add_sample(total_speed)
+            self._update_table(transfers)
+            self._update_volumes(transfers)
+            self._update_health()
+            self._update_statistics()
+
+        except Exception as e:
+            self.logger.error(f"전송 현황 갱신 실패: {str(e)}")
+
+    def _update_table(self, transfers):
+        self.table.setRowCount(len(transfers))
+        for row, transfer in enumerate(transfers):
+            speed = transfer.current_speed_mbps
+            remaining = max(transfer.total_bytes - transfer.transferred_bytes, 0)
+            values = [
+                os.path.basename(transfer.source),
+                transfer.destination or "",
+                f"{transfer.progress:.1f}% ({transfer.transferred_bytes / MB:.1f}/{transfer.total_bytes / MB:.1f} MB)",
+                f"{speed:.1f} MB/s",
+                format_eta(remaining / (speed * MB) if speed > 0 else None)
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column == 0:
+                    item.setToolTip(transfer.source)
+                self.table.setItem(row, column, item)
+
+    def _update_volumes(self, transfers):
+        """대상 볼륨(드라이브/공유)별 전송 수와 처리량"""
+        volumes = defaultdict(lambda: [0, 0.0])
+        for transfer in transfers:
+            volume = os.path.splitdrive(transfer.destination or "")[0] or "/"
+            volumes[volume][0] += 1
+            volumes[volume][1] += transfer.current_speed_mbps
+        self.volume_label.setText("Volumes: " + (", ".join(
+            f"{volume} {count} ({speed:.1f} MB/s)" for volume, (count, speed) in sorted(volumes.items())
+        ) or "-"))
+
+    def _update_health(self):
+        """클라이언트 CPU/메모리와 네트워크 송수신 속도"""
+        health = self.monitor.check_system_health()
+        if not health:
+            self.health_label.setText("Client: -")
+            return
+
+        now = time.monotonic()
+        net_io = health["network_io"]
+        sent_speed = recv_speed = 0.0
+        if self._last_net_io:
+            last_time, last_sent, last_recv = self._last_net_io
+            elapsed = now - last_time
+            if elapsed > 0:
+                sent_speed = (net_io["bytes_sent"] - last_sent) / elapsed / MB
+                recv_speed = (net_io["bytes_recv"] - last_recv) / elapsed / MB
+        self._last_net_io = (now, net_io["bytes_sent"], net_io["bytes_recv"])
+
+        self.health_label.setText(
+            f"Client CPU: {health['cpu_usage']:.0f}% | Memory: {health['memory_usage']:.0f}% | "
+            f"Network out: {sent_speed:.1f} MB/s | in: {recv_speed:.1f} MB/s"
+        )
+
+    def _update_statistics(self):
+        """세션 누적 통계 (파일 전송만)"""
+        stats = self.monitor.get_operation_statistics(OperationType.FILE_COPY)
+        self.stats_label.setText(
+            f"Completed: {stats['successful_operations']} | Failed: {stats['failed_operations']} | "
+            f"Transferred: {stats['total_bytes'] / MB:.1f} MB | "
+            f"Duration p50: {stats['p50_duration']:.2f}s, p95: {stats['p95_duration']:.2f}s"
+        )
@@ -1,24 +1,32 @@
 """버전 테이블 위젯"""
 import os
 from PySide6.QtWidgets import (QTableWidget, QTableWidgetItem, QVBoxLayout, 
-                               QWidget, QMessageBox, QMenu, QHeaderView, QDialog, QApplication)
-from PySide6.QtCore import Qt, Signal, QEvent, QTimer
-from PySide6.QtGui import QColor
+                               QWidget, QMessageBox, QMenu, QHeaderView, QDialog, QApplication, QToolTip)
+from PySide6.QtCore import Qt, Signal, QEvent, QTimer, QUrl
+from PySide6.QtGui import QColor, QCursor
 from ..ui.new_version_dialog import NewVersionDialog
 from ..utils.logger import setup_logger
 from ..utils.db_utils import convert_date_format
 from ..config.app_state import AppState
+from ..services.thumbnail_service import ThumbnailService
 from ..styles.components import get_table_style
 
+# 버전 아이템의 프리뷰 경로 (툴팁 썸네일용)
+PREVIEW_ROLE = Qt.UserRole + 1
+
 class VersionTableWidget(QWidget):
     version_selected = Signal(int)
 
-    def __init__(self, version_services, settings_service, project_tree):
+    def __init__(self, version_services, settings_service, project_tree, data_loader=None):
         super().__init__()
         self.logger = setup_logger(__name__)
         self.version_services = version_services
         self.settings_service = settings_service
         self.project_tree = project_tree
+        self.data_loader = data_loader  # 없으면 GUI 스레드에서 바로 조회
+        self.thumbnail_service = ThumbnailService.instance()
+        self.thumbnail_service.thumbnail_ready.connect(self._handle_thumbnail_ready)
+        self._tooltip_preview = None   # 툴팁을 기다리는 프리뷰 경로
         self.app_state = AppState()
         self.new_version_dialog = NewVersionDialog(version_services, settings_service, project_tree, item_id=None, item_type="shot", parent=self)
         
@@ -189,11 +197,28 @@ class VersionTableWidget(QWidget):
             item_id = 1
             
         self.table.setRowCount(0)
+        self.logger.debug(f"{item_type} ID {item_id}의 버전 목록 로드 시작")
+
+        if self.data_loader:
+            # 다른 아이템을 클릭하면 이전 요청의 결과는 버려짐
+            self.data_loader.load("versions", self._fetch_versions, item_type, item_id,
+                                  on_result=self.populate_versions)
+            return
+
+        try:
+            self.populate_versions(self._fetch_versions(item_type, item_id))
+        except Exception as e:
+            self.logger.error(f"버전 목록 로드 실패: {str(e)}", exc_info=True)
+
+    def _fetch_versions(self, item_type, item_id):
+        """버전 목록 조회 (작업 스레드에서 실행 가능, 썸네일은 툴팁을 표시할 때 준비)"""
+        return self.version_services[item_type].get_all_versions(item_id)
+
+    def populate_versions(self, versions):
+        """조회된 버전 목록을 테이블에 표시"""
+        self.table.setRowCount(0)
 
         try:
-            self.logger.debug(f"{item_type} ID {item_id}의 버전 목록 로드 시작")
-            versions = self.version_services[item_type].get_all_versions(item_id)
-            
             if not versions:
                 self.logger.debug("버전 정보가 없습니다.")
                 return
@@ -218,6 +243,7 @@ class VersionTableWidget(QWidget):
                     # 버전 아이템 생성
                     version_item = QTableWidgetItem(str(version_name))
                     version_item.setData(Qt.UserRole, version_id)
+                    version_item.setData(PREVIEW_ROLE, version.get('preview_path'))
                     version_item.setTextAlignment(Qt.AlignCenter)
                     
                     # 작업자, 날짜, 상태 아이템 생성
@@ -254,6 +280,8 @@ class VersionTableWidget(QWidget):
 
     def clear_versions(self):
         """버전 테이블 초기화"""
+        if self.data_loader:
+            self.data_loader.cancel("versions")
         total_rows = 1  # 최소 1행은 표시
         self.table.setRowCount(total_rows)
         
@@ -293,8 +321,49 @@ class VersionTableWidget(QWidget):
         self.logger.debug(f"선택된 버전 ID: {item_id}")
         self.version_selected.emit(item_id)
 
+    def _show_thumbnail_tooltip(self, pos, request=True):
+        """
+        마우스 위치의 버전 썸네일을 툴팁으로 표시
+
+        썸네일이 메모리에 없으면 백그라운드 생성을 요청하고, 준비되면 _handle_thumbnail_ready에서
+        마우스가 아직 같은 버전 위에 있을 때 표시합니다. 툴팁에는 로컬 썸네일 캐시 파일을 사용합니다.
+        """
+        viewport = self.table.viewport()
+        item = self.table.itemAt(pos)
+        preview_path = item.data(PREVIEW_ROLE) if item and item.column() == 0 else None
+        self._tooltip_preview = preview_path
+        if not preview_path:
+            QToolTip.hideText()
+            return
+
+        thumbnail_path = self.thumbnail_service.peek_path(preview_path, ThumbnailService.SMALL)
+        if thumbnail_path is None:
+            if request:
+                self.thumbnail_service.request(preview_path, ThumbnailService.SMALL)
+            QToolTip.hideText()
+            return
+
+        thumbnail_url = QUrl.fromLocalFile(thumbnail_path).toString()
+        QToolTip.showText(viewport.mapToGlobal(pos), f'<img src="{thumbnail_url}" width="256">', viewport)
+
+    def _handle_thumbnail_ready(self, source_path, size):
+        """툴팁을 기다리던 썸네일이 준비되면 표시"""
+        if size != ThumbnailService.SMALL or source_path != self._tooltip_preview:
+            return
+        viewport = self.table.viewport()
+        pos = viewport.mapFromGlobal(QCursor.pos())
+        if viewport.rect().contains(pos):
+            # 준비에 실패했으면 다시 요청하지 않음
+            self._show_thumbnail_tooltip(pos, request=False)
+
     def eventFilter(self, obj, event):
         """이벤트 필터"""
+        if obj == self.table.viewport():
+            if event.type() == QEvent.ToolTip:
+                self._show_thumbnail_tooltip(event.pos())
+                return True
+            if event.type() == QEvent.Leave:
+                self._tooltip_preview = None
         if obj == self.table and event.type() == QEvent.KeyPress:
             if event.key() == Qt.Key_Delete:
                 selected_items = self.table.selectedItems()
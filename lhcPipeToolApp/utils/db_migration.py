@@ -1,7 +1,13 @@
 """데이터베이스 마이그레이션"""
 from ..utils.logger import setup_logger
+from ..schemas.table_schemas import TABLES, INDEXES
+from ..utils.sequence_utils import parse_sequence_key
 
 class DatabaseMigration:
+    # 일회성 마이그레이션 이름 (MIGRATIONS.VERSION)
+    IS_LATEST_BACKFILL = "is_latest_backfill"
+    SEQUENCE_KEY_BACKFILL = "sequence_key_backfill"
+
     def __init__(self, db_connector):
         self.db_connector = db_connector
         self.logger = setup_logger(__name__)
@@ -90,8 +96,163 @@ class DatabaseMigration:
             except Exception as e:
                 self.logger.error(f"기존 데이터 업데이트 중 오류 발생: {e}")
 
+    def create_table_if_not_exists(self, table_name):
+        """테이블이 존재하지 않을 경우에만 생성"""
+        try:
+            check_query = """
+                SELECT 1 FROM RDB$RELATIONS
+                WHERE RDB$RELATION_NAME = ?
+            """
+            result = self.db_connector.fetch_one(check_query, (table_name.upper(),))
+
+            if not result:
+                self.logger.debug(f"실행할 SQL: {TABLES[table_name]}")
+                self.db_connector.execute(TABLES[table_name])
+                self.db_connector.commit()
+                self.logger.info(f"{table_name} 테이블 추가됨")
+            else:
+                self.logger.info(f"{table_name} 테이블이 이미 존재함")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"테이블 추가 중 오류 발생: {e}")
+            return False
+
+    def migrate_version_files_table(self):
+        """버전 파일 목록(VERSION_FILES) 테이블 마이그레이션"""
+        if not self.create_table_if_not_exists('version_files'):
+            self.logger.error("version_files 테이블 추가 실패")
+            return
+
+        migrations = [
+            ("FRAME_NUMBER", "INTEGER"),
+            ("SEQUENCE_KEY", "VARCHAR(255)")
+        ]
+
+        for column_name, definition in migrations:
+            if not self.add_column_if_not_exists('VERSION_FILES', column_name, definition):
+                self.logger.error(f"{column_name} 컬럼 추가 실패")
+                return
+
+        self.backfill_sequence_keys()
+
+    def backfill_sequence_keys(self):
+        """기존 버전 파일 목록에 시퀀스 키 기록 (한 번만 실행)"""
+        if not self.create_table_if_not_exists('migrations'):
+            self.logger.error("migrations 테이블 추가 실패")
+            return
+        try:
+            if self.is_migration_applied(self.SEQUENCE_KEY_BACKFILL):
+                return
+            rows = self.db_connector.fetch_all(
+                "SELECT ID, FILE_PATH FROM VERSION_FILES WHERE FRAME_NUMBER IS NOT NULL AND SEQUENCE_KEY IS NULL"
+            )
+            params = [(parse_sequence_key(row['file_path']), row['id']) for row in rows]
+            if params:
+                self.db_connector.execute_many("UPDATE VERSION_FILES SET SEQUENCE_KEY = ? WHERE ID = ?", params)
+                self.db_connector.commit()
+            self.mark_migration_applied(self.SEQUENCE_KEY_BACKFILL)
+            self.logger.info(f"시퀀스 키 기록 완료: {len(params)}개")
+        except Exception as e:
+            self.db_connector.rollback()
+            self.logger.error(f"시퀀스 키 기록 중 오류 발생: {e}")
+
+    def migrate_operation_history_table(self):
+        """작업 기록(OPERATION_HISTORY) 테이블 마이그레이션"""
+        if not self.create_table_if_not_exists('operation_history'):
+            self.logger.error("operation_history 테이블 추가 실패")
+
+    def create_index_if_not_exists(self, index_name):
+        """인덱스가 존재하지 않을 경우에만 생성"""
+        try:
+            check_query = """
+                SELECT 1 FROM RDB$INDICES
+                WHERE RDB$INDEX_NAME = ?
+            """
+            result = self.db_connector.fetch_one(check_query, (index_name.upper(),))
+
+            if not result:
+                self.logger.debug(f"실행할 SQL: {INDEXES[index_name]}")
+                self.db_connector.execute(INDEXES[index_name])
+                self.db_connector.commit()
+                self.logger.info(f"{index_name} 인덱스 추가됨")
+            else:
+                self.logger.info(f"{index_name} 인덱스가 이미 존재함")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"인덱스 추가 중 오류 발생: {e}")
+            return False
+
+    def is_migration_applied(self, version):
+        """MIGRATIONS 테이블에 기록된 일회성 마이그레이션인지 확인"""
+        result = self.db_connector.fetch_one("SELECT 1 FROM MIGRATIONS WHERE VERSION = ?", (version,))
+        return result is not None
+
+    def mark_migration_applied(self, version):
+        """일회성 마이그레이션 완료 기록"""
+        self.db_connector.execute(
+            "INSERT INTO MIGRATIONS (ID, VERSION) SELECT COALESCE(MAX(ID), 0) + 1, ? FROM MIGRATIONS",
+            (version,)
+        )
+        self.db_connector.commit()
+
+    def migrate_version_indexes(self):
+        """버전 테이블 인덱스 및 최신 버전(IS_LATEST) 플래그 마이그레이션"""
+        for index_name in INDEXES:
+            if not self.create_index_if_not_exists(index_name):
+                self.logger.error(f"{index_name} 인덱스 추가 실패")
+                return
+
+        # 플래그 보정은 기존 데이터에 한 번만 실행 (이후에는 버전 생성/삭제 시 유지됨)
+        if not self.create_table_if_not_exists('migrations'):
+            self.logger.error("migrations 테이블 추가 실패")
+            return
+        try:
+            if self.is_migration_applied(self.IS_LATEST_BACKFILL):
+                return
+        except Exception as e:
+            self.logger.error(f"마이그레이션 기록 조회 중 오류 발생: {e}")
+            return
+
+        # 최신 버전 플래그가 없는 항목은 가장 높은 버전 번호를 최신 버전으로 지정
+        version_tables = [
+            ('VERSIONS', 'SHOT_ID'),
+            ('SEQUENCE_VERSIONS', 'SEQUENCE_ID'),
+            ('PROJECT_VERSIONS', 'PROJECT_ID')
+        ]
+        for table_name, foreign_key in version_tables:
+            try:
+                update_sql = f"""
+                    UPDATE {table_name} v
+                    SET v.IS_LATEST = TRUE
+                    WHERE v.VERSION_NUMBER = (
+                        SELECT MAX(m.VERSION_NUMBER) FROM {table_name} m
+                        WHERE m.{foreign_key} = v.{foreign_key}
+                    )
+                    AND NOT EXISTS (
+                        SELECT 1 FROM {table_name} l
+                        WHERE l.{foreign_key} = v.{foreign_key} AND l.IS_LATEST = TRUE
+                    )
+                """
+                self.db_connector.execute(update_sql)
+                self.db_connector.commit()
+            except Exception as e:
+                self.logger.error(f"{table_name} 최신 버전 플래그 업데이트 중 오류 발생: {e}")
+                # 실패한 경우 다음 실행 때 다시 시도
+                return
+
+        try:
+            self.mark_migration_applied(self.IS_LATEST_BACKFILL)
+        except Exception as e:
+            self.logger.error(f"마이그레이션 기록 중 오류 발생: {e}")
+        self.logger.info("최신 버전 플래그 보정 완료")
+
 def run_migrations(db_connector):
     """모든 마이그레이션 실행"""
     migration = DatabaseMigration(db_connector)
     migration.migrate_workers_table()
-    migration.migrate_sequences_table()
\ No newline at end of file
+    migration.migrate_sequences_table()
+    migration.migrate_version_files_table()
+    migration.migrate_operation_history_table()
+    migration.migrate_version_indexes()
\ No newline at end of file
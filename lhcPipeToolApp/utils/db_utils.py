@@ -1,4 +1,5 @@
 """데이터베이스 유틸리티 함수"""
+from contextlib import contextmanager
 from ..utils.logger import setup_logger
 
 def check_table_schema(db_connector, table_name):
@@ -99,6 +100,25 @@ def check_database_connection(db_connector):
         logger.error(f"데이터베이스 연결 상태: 비정상 - {str(e)}", exc_info=True)
         return False
     
+@contextmanager
+def max_queries(db_connector, limit, logger=None):
+    """블록 안에서 현재 스레드가 DBConnector로 실행한 쿼리 수가 limit 이하인지 확인
+
+    초과 시 logger를 지정하면 경고 로그를 남기고, 지정하지 않으면 AssertionError를 발생시킵니다.
+
+    Example:
+        with max_queries(db_connector, 4, self.logger):
+            ...
+    """
+    start = db_connector.query_count
+    yield
+    executed = db_connector.query_count - start
+    if executed > limit:
+        message = f"쿼리 수 초과: {executed}회 실행 (허용: {limit}회)"
+        if logger is None:
+            raise AssertionError(message)
+        logger.warning(message)
+
 # 날짜 형식 변환
 def convert_date_format(date):
     """날짜 형식 변환
@@ -0,0 +1,72 @@
+"""생성 확인된 디렉토리 캐시"""
+import os
+import threading
+from .logger import setup_logger
+
+class KnownDirectoryCache:
+    """
+    이번 세션에서 존재를 확인했거나 생성한 디렉토리 목록
+
+    같은 버전 폴더로 파일을 여러 개 복사할 때 매번 경로 구성 요소마다 존재 여부를 확인하지
+    않도록, 확인된 디렉토리와 그 상위 디렉토리를 기억합니다. 다른 곳에서 디렉토리가 삭제되어
+    작업이 ENOENT로 실패하면 discard()로 해당 디렉토리와 하위 항목을 목록에서 제거합니다.
+    """
+
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+        self._known = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.normpath(str(path)))
+
+    def contains(self, path):
+        with self._lock:
+            return self._key(path) in self._known
+
+    def add(self, path):
+        """디렉토리와 모든 상위 디렉토리를 확인된 것으로 기록"""
+        key = self._key(path)
+        with self._lock:
+            while key not in self._known:
+                self._known.add(key)
+                parent = os.path.dirname(key)
+                if parent == key:
+                    break
+                key = parent
+
+    def ensure(self, path):
+        """
+        디렉토리가 없으면 생성 (이미 확인된 디렉토리는 파일 시스템에 접근하지 않음)
+
+        여러 작업이 같은 디렉토리를 동시에 만들어도 exist_ok로 안전하게 처리됩니다.
+
+        Returns:
+            bool: 디렉토리가 존재하거나 생성되었으면 True
+        """
+        if self.contains(path):
+            return True
+        try:
+            # 대상이 이미 있으면 확인 한 번으로 끝나고, 없으면 없는 상위 디렉토리부터 생성
+            os.makedirs(path, exist_ok=True)
+        except OSError as e:
+            self.logger.error(f"디렉토리 생성 실패: {path} - {str(e)}")
+            return False
+        self.add(path)
+        return True
+
+    def discard(self, path):
+        """디렉토리와 하위 디렉토리를 목록에서 제거"""
+        key = self._key(path)
+        prefix = key.rstrip(os.sep) + os.sep
+        with self._lock:
+            self._known = {known for known in self._known if known != key and not known.startswith(prefix)}
+
+    def clear(self):
+        with self._lock:
+            self._known.clear()
+
+
+# 파일 핸들러들이 함께 사용하는 전역 인스턴스
+known_directories = KnownDirectoryCache()
@@ -0,0 +1,79 @@
+"""디렉토리 스캐너"""
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from .logger import setup_logger
+
+FileEntry = namedtuple('FileEntry', ['name', 'path', 'size', 'mtime', 'is_dir'])
+
+class DirectoryScanner:
+    """
+    os.scandir 기반 디렉토리 목록 조회 (디렉토리 수정 시각 기준 캐시)
+
+    항목마다 stat을 한 번만 호출하며, Windows에서는 scandir 결과에 크기/수정 시각이 포함되어
+    있어 네트워크 공유에서도 추가 요청이 없습니다. 디렉토리의 수정 시각은 파일이 추가/삭제/이름
+    변경될 때 바뀌므로, 수정 시각이 같으면 캐시된 목록을 그대로 반환합니다.
+    """
+
+    MAX_CACHED_DIRS = 256
+
+    def __init__(self, max_cached_dirs=MAX_CACHED_DIRS):
+        self.logger = setup_logger(__name__)
+        self.max_cached_dirs = max_cached_dirs
+        self._cache = OrderedDict()    # path -> (디렉토리 mtime_ns, [FileEntry])
+        self._lock = threading.Lock()
+
+    def scan(self, path):
+        """
+        디렉토리 항목 목록 (이름순)
+
+        Returns:
+            list[FileEntry]: 디렉토리가 없으면 빈 목록
+        """
+        path = os.path.normpath(path)
+        try:
+            dir_mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached and cached[0] == dir_mtime:
+                self._cache.move_to_end(path)
+                return cached[1]
+
+        entries = []
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    try:
+                        is_dir = entry.is_dir()
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append(FileEntry(
+                        entry.name, entry.path, 0 if is_dir else stat.st_size, stat.st_mtime, is_dir
+                    ))
+        except OSError as e:
+            self.logger.error(f"디렉토리 조회 실패 ({path}): {str(e)}")
+            return []
+        entries.sort(key=lambda entry: entry.name)
+
+        with self._lock:
+            self._cache[path] = (dir_mtime, entries)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.max_cached_dirs:
+                self._cache.popitem(last=False)
+        return entries
+
+    def invalidate(self, path=None):
+        """캐시 무효화 (path가 없으면 전체)"""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.normpath(path), None)
+
+
+# 다이얼로그들이 함께 사용하는 전역 인스턴스
+directory_scanner = DirectoryScanner()
@@ -0,0 +1,84 @@
+"""SVG 아이콘 캐시"""
+import os
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtSvg import QSvgRenderer
+from .event_system import EventSystem
+from .logger import setup_logger
+
+class IconCache:
+    """
+    프로세스 전역 SVG 아이콘 pixmap 캐시
+
+    (아이콘 이름, 크기, devicePixelRatio) 조합마다 SVG를 한 번만 렌더링하고
+    같은 QPixmap을 공유합니다. 화면 DPI가 바뀌면 install_dpi_hook()으로 연결된
+    핸들러가 캐시를 비우고 'dpi_changed' 이벤트를 발생시킵니다.
+    """
+
+    ICON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'resources', 'icons')
+
+    _pixmaps = {}    # (icon_name, size, device_pixel_ratio) -> QPixmap
+    _hook_installed = False
+    _logger = None
+
+    @classmethod
+    def _get_logger(cls):
+        if cls._logger is None:
+            cls._logger = setup_logger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get(cls, icon_name, size=24, device_pixel_ratio=1.0):
+        """아이콘 pixmap 반환 (없으면 렌더링 후 캐시, 파일이 없으면 None)"""
+        key = (icon_name, size, device_pixel_ratio)
+        if key not in cls._pixmaps:
+            cls._pixmaps[key] = cls._render(icon_name, size, device_pixel_ratio)
+        return cls._pixmaps[key]
+
+    @classmethod
+    def _render(cls, icon_name, size, device_pixel_ratio):
+        """SVG 파일을 지정 크기로 렌더링"""
+        icon_path = os.path.join(cls.ICON_DIR, f'{icon_name}.svg')
+        if not os.path.exists(icon_path):
+            cls._get_logger().warning(f"아이콘 파일 없음: {icon_path}")
+            return None
+
+        renderer = QSvgRenderer(icon_path)
+        pixel_size = round(size * device_pixel_ratio)
+        pixmap = QPixmap(pixel_size, pixel_size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+        # 고해상도 화면에서도 논리 크기(size)로 그려지도록 설정
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    @classmethod
+    def invalidate(cls):
+        """캐시 비우기"""
+        cls._pixmaps.clear()
+        cls._get_logger().debug("아이콘 캐시 초기화")
+
+    @classmethod
+    def install_dpi_hook(cls, app):
+        """화면 추가/변경 및 DPI 변경 시 캐시를 비우도록 QGuiApplication 시그널 연결"""
+        if cls._hook_installed:
+            return
+        cls._hook_installed = True
+        app.screenAdded.connect(cls._hook_screen)
+        app.primaryScreenChanged.connect(lambda screen: cls._on_dpi_changed())
+        for screen in app.screens():
+            cls._hook_screen(screen)
+
+    @classmethod
+    def _hook_screen(cls, screen):
+        """화면별 DPI 변경 시그널 연결"""
+        screen.logicalDotsPerInchChanged.connect(lambda dpi: cls._on_dpi_changed())
+        screen.physicalDotsPerInchChanged.connect(lambda dpi: cls._on_dpi_changed())
+
+    @classmethod
+    def _on_dpi_changed(cls):
+        """DPI 변경 처리 (캐시 무효화 후 이벤트 발생)"""
+        cls.invalidate()
+        EventSystem.notify('dpi_changed')
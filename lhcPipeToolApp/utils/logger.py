@@ -1,50 +1,163 @@
+import atexit
 import logging
+import logging.handlers
+import multiprocessing
+import queue
+import random
 import sys
+import threading
 from pathlib import Path
+from ..config.log_config import LogConfig
 
 # 로거 인스턴스를 저장할 딕셔너리
 loggers = {}
 
+SQL_LOGGER_NAME = "lhcPipeToolApp.sql"
+
+_config = None
+_listener = None
+_worker_queue = None      # 작업 프로세스 로그를 받는 큐 (메인 프로세스에서 생성)
+_worker_listener = None
+_lock = threading.RLock()
+
+def configure_logging(config=None):
+    """
+    로그 출력 설정 (처음 한 번만 적용, setup_logger가 자동으로 호출)
+
+    로그 호출은 큐에 넣기만 하고, 파일/콘솔 출력은 별도 스레드(QueueListener)가 처리하므로
+    GUI 스레드가 디스크 쓰기를 기다리지 않습니다.
+    프리뷰 작업 프로세스는 로그 파일을 직접 열지 않고 configure_worker_logging()으로 받은 큐를 통해
+    메인 프로세스에 기록을 전달합니다 (파일 쓰기와 순환은 메인 프로세스만 처리).
+    """
+    global _config, _listener
+    with _lock:
+        if _config is not None:
+            return _config
+        _config = config or LogConfig()
+
+        # 모든 로거가 루트의 핸들러로 전달 (외부 라이브러리는 경고 이상만)
+        root = logging.getLogger()
+        root.setLevel(logging.WARNING)
+        if multiprocessing.parent_process() is not None:
+            return _config
+
+        formatter = logging.Formatter(
+            '[%(asctime)s] %(levelname)s - %(message)s\n'
+            'Location: %(pathname)s:%(lineno)d'
+        )
+
+        log_dir = Path(_config.log_dir)
+        log_dir.mkdir(exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / _config.file_name,
+            maxBytes=_config.max_bytes,
+            backupCount=_config.backup_count,
+            encoding='utf-8'
+        )
+        file_handler.setLevel(_config.file_level)
+        file_handler.setFormatter(formatter)
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(_config.console_level)
+        console_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        return _config
+
+def worker_log_queue():
+    """
+    작업 프로세스 로그를 메인 프로세스로 전달할 큐 반환 (처음 호출 시 수신 스레드 시작)
+
+    Example:
+        ProcessPoolExecutor(initializer=configure_worker_logging, initargs=(worker_log_queue(),))
+    """
+    global _worker_queue, _worker_listener
+    configure_logging()
+    with _lock:
+        if _worker_queue is None:
+            _worker_queue = multiprocessing.Queue()
+            # 메인 프로세스와 같은 파일/콘솔 핸들러로 출력 (핸들러 잠금으로 쓰기가 겹치지 않음)
+            _worker_listener = logging.handlers.QueueListener(
+                _worker_queue, *_listener.handlers, respect_handler_level=True
+            )
+            _worker_listener.start()
+        return _worker_queue
+
+def configure_worker_logging(log_queue):
+    """작업 프로세스 로그 설정 (ProcessPoolExecutor initializer, 모든 기록을 log_queue로 전달)"""
+    configure_logging()
+    root = logging.getLogger()
+    with _lock:
+        if any(getattr(handler, 'queue', None) is log_queue for handler in root.handlers):
+            return
+        # fork로 시작된 경우 부모에서 물려받은 핸들러(부모 스레드용 큐)는 제거
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+def shutdown_logging():
+    """대기 중인 로그를 모두 출력하고 출력 스레드 종료"""
+    global _listener, _worker_listener
+    with _lock:
+        if _worker_listener is not None:
+            _worker_listener.stop()
+            _worker_listener = None
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+def _level_for(name):
+    """로거 이름에 해당하는 레벨 (가장 긴 접두어 설정 우선)"""
+    best = None
+    for prefix, level in _config.levels.items():
+        if (name == prefix or name.startswith(prefix + ".")) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return _config.levels[best] if best else _config.default_level
+
+def set_log_level(prefix, level):
+    """
+    서브시스템 로그 레벨 변경 (이미 만든 로거에도 바로 적용)
+
+    Example:
+        set_log_level("lhcPipeToolApp.database", "DEBUG")
+    """
+    configure_logging()
+    with _lock:
+        _config.levels[prefix] = level
+        for name, logger in loggers.items():
+            logger.setLevel(_level_for(name))
+
+def set_sql_logging(enabled, sample_rate=None):
+    """SQL 로그 켜기/끄기 (sample_rate: 기록할 쿼리 비율 0~1)"""
+    configure_logging()
+    _config.sql_logging = enabled
+    if sample_rate is not None:
+        _config.sql_sample_rate = sample_rate
+
+def sql_log_sampled():
+    """이번 쿼리를 SQL 로그에 기록할지 여부 (꺼져 있으면 항상 False)"""
+    config = _config or configure_logging()
+    return config.sql_logging and random.random() < config.sql_sample_rate
+
 def setup_logger(name):
     """로거 설정"""
     if name in loggers:
         return loggers[name]
-        
+
+    configure_logging()
     logger = logging.getLogger(name)
-    
-    # 이미 핸들러가 설정되어 있다면 리턴
-    if logger.handlers:
-        return logger
-        
-    logger.setLevel(logging.DEBUG)  # 로그 레벨을 DEBUG로 변경
-    
-    # 파일 핸들러 설정
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    file_handler = logging.FileHandler(
-        log_dir / "app.log",
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-    
-    # 콘솔 핸들러 설정
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
-    
-    # 포맷터 설정
-    formatter = logging.Formatter(
-        '[%(asctime)s] %(levelname)s - %(message)s\n'
-        'Location: %(pathname)s:%(lineno)d'
-    )
-    
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
-    # 로거 저장
-    loggers[name] = logger
-    
-    return logger
\ No newline at end of file
+    with _lock:
+        logger.setLevel(_level_for(name))
+        # 로거 저장
+        loggers[name] = logger
+
+    return logger
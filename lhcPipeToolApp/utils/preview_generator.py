@@ -1,17 +1,24 @@
 """프리뷰 생성기"""
 import cv2
-import glob
-import re
 from pathlib import Path
 from .logger import setup_logger
+from .sequence_utils import is_sequence_spec, sequence_index
+
+def generate_preview(file_path, preview_path=None):
+    """
+    프리뷰 생성 (프로세스 풀 작업용 모듈 함수)
+
+    ProcessPoolExecutor에 전달할 수 있도록 모듈 최상위에 정의합니다.
+    """
+    return PreviewGenerator().create_preview(file_path, preview_path)
 
 class PreviewGenerator:
     def __init__(self):
         self.logger = setup_logger(__name__)
         self.max_size = 4096  # 최대 이미지 크기
         
-    def create_preview(self, file_path):
-        """파일로부터 프리뷰 이미지 생성"""
+    def create_preview(self, file_path, preview_path=None):
+        """파일로부터 프리뷰 이미지 생성 (preview_path가 없으면 원본 옆에 저장)"""
         try:
             self.logger.debug(f"프리뷰 생성 시작 - file_path: {file_path}")
             
@@ -21,7 +28,7 @@ class PreviewGenerator:
                 
             # 파일 경로 처리
             file_path = Path(file_path)
-            preview_path = file_path.parent / f"{file_path.stem}_preview.png"
+            preview_path = Path(preview_path) if preview_path else file_path.parent / f"{file_path.stem}_preview.png"
             
             # 이미지 시퀀스 확인
             if self._is_sequence(str(file_path)):
@@ -46,36 +53,22 @@ class PreviewGenerator:
             return None
             
     def _is_sequence(self, file_path):
-        """이미지 시퀀스 패턴 확인"""
-        sequence_pattern = re.compile(r'.*?(?:%0\d+d|\#{1,4}|\$F\d+).*?')
-        return bool(sequence_pattern.match(file_path))
+        """이미지 시퀀스 패턴 확인 (%04d, ####, $F4)"""
+        return is_sequence_spec(file_path)
         
     def _handle_sequence(self, file_path):
         """이미지 시퀀스 처리"""
         try:
             self.logger.debug("이미지 시퀀스 파일 처리")
             
-            # 시퀀스 패턴 매칭
-            patterns = [
-                (r'%0\d+d', r'\d+'),  # %04d 형식
-                (r'\#{1,4}', r'\d+'),  # #### 형식
-                (r'\$F\d+', r'\d+')    # $F4 형식
-            ]
-            
-            file_str = str(file_path)
-            sequence_files = []
-            
-            for pattern, num_pattern in patterns:
-                if re.search(pattern, file_str):
-                    search_pattern = re.sub(pattern, num_pattern, file_str)
-                    sequence_files = sorted(glob.glob(search_pattern))
-                    break
-                    
-            if not sequence_files:
+            # 시퀀스 색인에서 첫 프레임 조회 (폴더 전체를 glob/정렬하지 않음)
+            sequence = sequence_index.find_sequence(str(file_path))
+            if not sequence:
                 raise ValueError("시퀀스 파일을 찾을 수 없습니다.")
+            first_frame = sequence.entries[0].path
                 
-            self.logger.debug(f"첫 번째 시퀀스 파일: {sequence_files[0]}")
-            img = cv2.imread(sequence_files[0])
+            self.logger.debug(f"첫 번째 시퀀스 파일: {first_frame}")
+            img = cv2.imread(first_frame)
             
             if img is None:
                 raise ValueError("이미지를 읽을 수 없습니다.")
@@ -0,0 +1,251 @@
+"""이미지 시퀀스 유틸리티"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from .directory_scanner import directory_scanner
+
+# 프레임 번호를 가질 수 있는 이미지 시퀀스 확장자
+SEQUENCE_EXTENSIONS = {'.exr', '.dpx', '.png', '.jpg', '.jpeg', '.tif', '.tiff', '.tga', '.bmp'}
+
+# name.1001.exr, name_1001.exr 형식 (확장자 바로 앞의 숫자가 프레임 번호)
+FRAME_PATTERN = re.compile(r'^(?P<prefix>.*?[._])(?P<frame>\d+)(?P<ext>\.[^.]+)$')
+
+# 시퀀스 경로의 프레임 자리 표시 (%04d, ####, $F4 - 숫자가 없으면 자릿수 제한 없음)
+SPEC_PATTERN = re.compile(r'%0?(?P<printf>\d*)d|(?P<hash>#+)|\$F(?P<houdini>\d*)')
+
+def parse_frame_number(file_name):
+    """
+    파일 이름에서 프레임 번호 추출
+
+    Returns:
+        int: 프레임 번호 (시퀀스 이미지가 아니면 None)
+    """
+    file_name = os.path.basename(file_name)
+    match = FRAME_PATTERN.match(file_name)
+    if not match or match.group('ext').lower() not in SEQUENCE_EXTENSIONS:
+        return None
+    return int(match.group('frame'))
+
+def parse_sequence_key(file_name):
+    """
+    파일이 속한 시퀀스 키 (프레임 번호를 #으로 바꾼 파일 이름, 예: name.####.exr)
+
+    group_sequences()와 같은 기준(접두어, 자릿수, 확장자)으로 묶습니다.
+
+    Returns:
+        str: 시퀀스 키 (시퀀스 이미지가 아니면 None)
+    """
+    file_name = os.path.basename(file_name)
+    match = FRAME_PATTERN.match(file_name)
+    if not match or match.group('ext').lower() not in SEQUENCE_EXTENSIONS:
+        return None
+    return f"{match.group('prefix')}{'#' * len(match.group('frame'))}{match.group('ext')}"
+
+def is_sequence_spec(path):
+    """%04d, ####, $F4 형식의 시퀀스 경로인지 확인"""
+    return SPEC_PATTERN.search(os.path.basename(str(path))) is not None
+
+def parse_sequence_spec(path):
+    """
+    시퀀스 경로 분해
+
+    Returns:
+        tuple: (디렉토리, 접두어, 자릿수, 접미어) - 시퀀스 경로가 아니면 None
+               자릿수가 0이면 자릿수 제한 없음 (%d, $F)
+    """
+    path = str(path)
+    name = os.path.basename(path)
+    match = SPEC_PATTERN.search(name)
+    if not match:
+        return None
+    if match.group('hash'):
+        padding = len(match.group('hash'))
+    else:
+        padding = int(match.group('printf') or match.group('houdini') or 0)
+    return os.path.dirname(path), name[:match.start()], padding, name[match.end():]
+
+def format_frame_ranges(ranges):
+    """(시작, 끝) 프레임 구간 목록을 '1001-1010, 1015' 형식 문자열로 변환"""
+    return ", ".join(str(start) if start == end else f"{start}-{end}" for start, end in ranges)
+
+def frames_to_ranges(frames):
+    """정렬된 프레임 번호 목록을 연속 구간 (시작, 끝) 목록으로 변환"""
+    ranges = []
+    for frame in frames:
+        if ranges and frame == ranges[-1][1] + 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return [tuple(frame_range) for frame_range in ranges]
+
+class SequenceGroup:
+    """하나로 묶은 이미지 시퀀스 (name.####.exr)"""
+
+    def __init__(self, prefix, padding, ext, directory):
+        self.prefix = prefix
+        self.padding = padding
+        self.ext = ext
+        self.directory = directory
+        self.frames = []
+        self.entries = []
+        self.size = 0
+        self.mtime = 0
+
+    @property
+    def pattern(self):
+        return f"{self.prefix}{'#' * self.padding}{self.ext}"
+
+    @property
+    def spec(self):
+        """printf 형식 시퀀스 경로 (예: /render/v001/name.%04d.exr)"""
+        return os.path.join(self.directory, f"{self.prefix}%0{self.padding}d{self.ext}")
+
+    @property
+    def display_name(self):
+        """예: name.####.exr [1001-1100, 1105-1240]"""
+        return f"{self.pattern} [{format_frame_ranges(self.ranges)}]"
+
+    @property
+    def ranges(self):
+        """연속 프레임 구간 목록"""
+        return frames_to_ranges(self.frames)
+
+    @property
+    def gaps(self):
+        """첫 프레임과 마지막 프레임 사이의 누락 구간 목록"""
+        ranges = self.ranges
+        return [(end + 1, start - 1) for (_, end), (start, _) in zip(ranges, ranges[1:])]
+
+    @property
+    def paths(self):
+        return [entry.path for entry in self.entries]
+
+    def add(self, frame, entry):
+        self.frames.append(frame)
+        self.entries.append(entry)
+        self.size += entry.size
+        self.mtime = max(self.mtime, entry.mtime or 0)
+
+    def sort(self):
+        """프레임 순으로 정렬"""
+        pairs = sorted(zip(self.frames, self.entries), key=lambda pair: pair[0])
+        self.frames = [frame for frame, _ in pairs]
+        self.entries = [entry for _, entry in pairs]
+
+def group_sequences(entries):
+    """
+    파일 항목을 시퀀스별로 묶음 (한 번 순회)
+
+    Args:
+        entries: name, path, size, mtime 속성을 가진 파일 항목 목록 (FileEntry 등)
+
+    Returns:
+        tuple: (프레임순으로 정렬된 SequenceGroup 목록, 시퀀스가 아닌 파일 항목 목록)
+    """
+    groups = {}
+    others = []
+    for entry in entries:
+        match = FRAME_PATTERN.match(entry.name)
+        if not match or match.group('ext').lower() not in SEQUENCE_EXTENSIONS:
+            others.append(entry)
+            continue
+        key = (match.group('prefix'), len(match.group('frame')), match.group('ext'))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = SequenceGroup(*key, os.path.dirname(entry.path))
+        group.add(int(match.group('frame')), entry)
+
+    for group in groups.values():
+        group.sort()
+    return list(groups.values()), others
+
+def collapse_sequences(entries):
+    """
+    같은 시퀀스에 속한 파일을 SequenceGroup 하나로 묶은 목록
+
+    Returns:
+        list: 이름순으로 정렬된 SequenceGroup과 시퀀스가 아닌 파일 항목 목록
+              (프레임이 하나뿐인 시퀀스는 파일 항목으로 남김)
+    """
+    groups, rows = group_sequences(entries)
+    for group in groups:
+        if len(group.frames) == 1:
+            rows.extend(group.entries)
+        else:
+            rows.append(group)
+    rows.sort(key=lambda row: row.pattern if isinstance(row, SequenceGroup) else row.name)
+    return rows
+
+class SequenceIndex:
+    """
+    디렉토리별 시퀀스 색인 (디렉토리 수정 시각 기준 캐시)
+
+    디렉토리 목록은 directory_scanner로 조회하고, 목록이 바뀌지 않았으면(같은 캐시 객체)
+    이전에 묶어 둔 결과를 그대로 반환하므로 같은 폴더를 반복 조회해도 다시 묶지 않습니다.
+
+    Example:
+        sequence = sequence_index.find_sequence("Y:/render/v001/beauty.%04d.exr")
+        first_frame = sequence.entries[0].path
+    """
+
+    MAX_CACHED_DIRS = 256
+
+    def __init__(self, scanner=None, max_cached_dirs=MAX_CACHED_DIRS):
+        self.scanner = scanner or directory_scanner
+        self.max_cached_dirs = max_cached_dirs
+        self._cache = OrderedDict()   # path -> (디렉토리 목록 객체, 시퀀스 목록, 기타 파일 목록)
+        self._lock = threading.Lock()
+
+    def index(self, directory):
+        """
+        디렉토리의 시퀀스와 기타 파일 목록
+
+        Returns:
+            tuple: (SequenceGroup 목록, 시퀀스가 아닌 FileEntry 목록)
+        """
+        directory = os.path.normpath(directory)
+        entries = self.scanner.scan(directory)
+        with self._lock:
+            cached = self._cache.get(directory)
+            if cached and cached[0] is entries:
+                self._cache.move_to_end(directory)
+                return cached[1], cached[2]
+
+        groups, others = group_sequences(entry for entry in entries if not entry.is_dir)
+        with self._lock:
+            self._cache[directory] = (entries, groups, others)
+            self._cache.move_to_end(directory)
+            while len(self._cache) > self.max_cached_dirs:
+                self._cache.popitem(last=False)
+        return groups, others
+
+    def find_sequence(self, spec_path):
+        """
+        시퀀스 경로(%04d, ####, $F4)에 해당하는 시퀀스 조회
+
+        Returns:
+            SequenceGroup: 없으면 None (자릿수 제한이 없으면 프레임이 가장 많은 시퀀스)
+        """
+        spec = parse_sequence_spec(spec_path)
+        if not spec:
+            return None
+        directory, prefix, padding, suffix = spec
+        groups, _ = self.index(directory or '.')
+        matches = [
+            group for group in groups
+            if group.prefix == prefix and group.ext == suffix and (not padding or group.padding == padding)
+        ]
+        return max(matches, key=lambda group: len(group.frames)) if matches else None
+
+    def invalidate(self, directory=None):
+        """캐시 무효화 (directory가 없으면 전체)"""
+        with self._lock:
+            if directory is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.normpath(directory), None)
+
+
+# 서비스와 다이얼로그가 함께 사용하는 전역 인스턴스
+sequence_index = SequenceIndex()